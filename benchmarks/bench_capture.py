@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+===========================================================
+    Project Name : Screen Shot Manager
+    File Name    : bench_capture.py
+    Author       : Vignesh Kumar B
+    Created On   : 2026-10-18
+    Description  : Screen capture backend latency benchmark
+===========================================================
+
+Times grab() of every capture backend at several resolutions and reports
+the latency per frame and the frames per second it sustains.  Screen
+backends capture a box of that size from the top-left corner, so sizes
+larger than the screen are skipped; run under a large virtual screen to
+cover them all, e.g.
+
+    xvfb-run -s "-screen 0 3840x2160x24" python benchmarks/bench_capture.py
+
+--modes compares capturing the full desktop, a 1280x720 region and the
+active window instead: grab and encode time and bytes written per capture
+(default: the synthetic backend on a three-monitor 5760x1080 desktop).
+
+Usage: python benchmarks/bench_capture.py [--backends a,b] [--sizes WxH,...] [--frames N]
+       python benchmarks/bench_capture.py --modes [--backends a] [--sizes WxH] [--encoder NAME]
+"""
+
+import argparse
+import io
+import os
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from capture_backends import CAPTURE_BACKENDS, CaptureUnavailableError, get_backend  # noqa: E402
+from encoders import DEFAULT_PROFILE, ENCODER_PROFILES, get_profile  # noqa: E402
+
+SIZES = "1280x720,1920x1080,2560x1440,3840x2160"
+MODES_DESKTOP = "5760x1080"
+REGION = (1280, 720)
+
+
+def time_grabs(backend, bbox, frames, warmup):
+    """Milliseconds per grab() of bbox over frames runs"""
+    for _ in range(warmup):
+        backend.grab(bbox)
+    times = []
+    for _ in range(frames):
+        t = time.perf_counter()
+        image = backend.grab(bbox)
+        times.append((time.perf_counter() - t) * 1000)
+    assert image.mode == "RGB"
+    return times
+
+
+def compare_modes(backend, encoder, frames):
+    """Per capture mode: (name, size, grab ms, encode ms, bytes)"""
+    width, height = backend.size()
+    left, top = (width - REGION[0]) // 2, (height - REGION[1]) // 2
+    modes = [("desktop", None), ("region", (left, top, left + REGION[0], top + REGION[1]))]
+    try:
+        modes.append(("window", backend.active_window_box()))
+    except CaptureUnavailableError as e:
+        print(f"window mode skipped: {e}")
+    rows = []
+    for mode, bbox in modes:
+        grab_ms = time_grabs(backend, bbox, frames, 1)
+        image = backend.grab(bbox)
+        encode_ms = []
+        for _ in range(max(1, frames // 5)):
+            handle = io.BytesIO()
+            t = time.perf_counter()
+            encoder.encode(image, handle)
+            encode_ms.append((time.perf_counter() - t) * 1000)
+        rows.append((mode, image.size, statistics.median(grab_ms), statistics.median(encode_ms),
+                     handle.tell()))
+    return rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--backends", default=",".join(CAPTURE_BACKENDS))
+    parser.add_argument("--sizes", default=SIZES)
+    parser.add_argument("--frames", type=int, default=30)
+    parser.add_argument("--warmup", type=int, default=3)
+    parser.add_argument("--modes", action="store_true",
+                        help="compare full desktop, region and active-window capture")
+    parser.add_argument("--encoder", default=DEFAULT_PROFILE, choices=sorted(ENCODER_PROFILES))
+    args = parser.parse_args()
+    if args.modes:
+        name = args.backends if "," not in args.backends else "synthetic"
+        size = args.sizes if "," not in args.sizes else MODES_DESKTOP
+        width, height = (int(v) for v in size.split("x"))
+        try:
+            backend = get_backend(name, size=(width, height)) if name == "synthetic" \
+                else get_backend(name)
+        except CaptureUnavailableError as e:
+            print(f"{name}: unavailable: {e}")
+            return 1
+        try:
+            rows = compare_modes(backend, get_profile(args.encoder), args.frames)
+        finally:
+            backend.close()
+        print(f"{name} backend, {args.encoder} encoder")
+        print(f"{'mode':8} {'size':>10} {'grab ms':>8} {'encode ms':>10} {'KiB':>8} {'total ms':>9}")
+        for mode, (w, h), grab, encode, size in rows:
+            print(f"{mode:8} {w}x{h:<5} {grab:8.2f} {encode:10.2f} {size / 1024:8.1f} "
+                  f"{grab + encode:9.2f}")
+        return 0
+    sizes = [tuple(int(v) for v in size.split("x")) for size in args.sizes.split(",")]
+
+    print(f"{'backend':12} {'size':>10} {'median ms':>10} {'p95 ms':>8} {'fps':>7}")
+    for name in args.backends.split(","):
+        for width, height in sizes:
+            try:
+                if name == "synthetic":
+                    backend = get_backend(name, size=(width, height))
+                    bbox = None
+                else:
+                    backend = get_backend(name)
+                    screen = backend.size()
+                    if width > screen[0] or height > screen[1]:
+                        print(f"{name:12} {width}x{height:<5} skipped: screen is "
+                              f"{screen[0]}x{screen[1]}")
+                        backend.close()
+                        continue
+                    bbox = (0, 0, width, height)
+            except CaptureUnavailableError as e:
+                print(f"{name:12} unavailable: {e}")
+                break
+
+            try:
+                times = time_grabs(backend, bbox, args.frames, args.warmup)
+            finally:
+                backend.close()
+            times.sort()
+            p95 = times[min(len(times) - 1, int(len(times) * 0.95))]
+            print(f"{name:12} {width}x{height:<5} {statistics.median(times):10.2f} {p95:8.2f} "
+                  f"{1000 / statistics.mean(times):7.1f}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
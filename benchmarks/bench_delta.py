@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+===========================================================
+    Project Name : Screen Shot Manager
+    File Name    : bench_delta.py
+    Author       : Vignesh Kumar B
+    Created On   : 2026-10-18
+    Description  : Keyframe + delta storage benchmark
+===========================================================
+
+Simulates a capture session where consecutive screenshots differ only in
+small regions (a clock, a log pane, a dialog opening and closing) and
+compares disk usage and write time of delta storage against standalone
+fast PNGs.
+
+Usage: python benchmarks/bench_delta.py [--size WxH] [--frames N]
+"""
+
+import argparse
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from PIL import ImageChops, ImageDraw  # noqa: E402
+
+from delta_store import DeltaStore, open_screenshot  # noqa: E402
+from encoders import get_profile  # noqa: E402
+from synthetic import desktop_capture, dialog_capture  # noqa: E402
+
+
+def session(size, frames):
+    """Yield frames of a workstation session with small local changes"""
+    base = desktop_capture(size)
+    dialog = dialog_capture((size[0] // 3, size[1] // 3), seed=1)
+    for i in range(frames):
+        frame = base.copy()
+        draw = ImageDraw.Draw(frame)
+        # Clock in the title bar
+        draw.text((size[0] - 120, 12), f"12:{i // 60:02d}:{i % 60:02d}", fill=(255, 255, 255))
+        # A log pane that gains a line per frame
+        for line in range(min(i, 20)):
+            draw.text((size[0] // 3 + 40, size[1] - 560 + line * 24),
+                      f"[{line:04d}] new event {line * 31}", fill=(249, 226, 175))
+        # A dialog that is open for a third of the frames
+        if i % 9 < 3:
+            frame.paste(dialog, (size[0] // 3, size[1] // 3))
+        yield frame
+
+
+def folder_bytes(folder):
+    total = 0
+    for root, _, files in os.walk(folder):
+        total += sum(os.path.getsize(os.path.join(root, name)) for name in files)
+    return total
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--size", default="1920x1080")
+    parser.add_argument("--frames", type=int, default=30)
+    args = parser.parse_args()
+    size = tuple(int(v) for v in args.size.lower().split("x"))
+    frames = list(session(size, args.frames))
+
+    workdir = tempfile.mkdtemp(prefix="ssm_bench_")
+    try:
+        png_dir = os.path.join(workdir, "png")
+        delta_dir = os.path.join(workdir, "delta")
+        os.makedirs(png_dir)
+        os.makedirs(delta_dir)
+
+        png = get_profile("png-fast")
+        start = time.perf_counter()
+        for i, frame in enumerate(frames):
+            png.save(frame, os.path.join(png_dir, f"ss_{i:04d}.png"))
+        png_ms = (time.perf_counter() - start) * 1000 / len(frames)
+
+        store = DeltaStore(os.path.join(delta_dir, ".screenshot_manager", "keyframes"))
+        start = time.perf_counter()
+        for i, frame in enumerate(frames):
+            store.save(frame, os.path.join(delta_dir, f"ss_{i:04d}.ssd"))
+        delta_ms = (time.perf_counter() - start) * 1000 / len(frames)
+
+        for i, frame in enumerate(frames):
+            restored = open_screenshot(os.path.join(delta_dir, f"ss_{i:04d}.ssd"))
+            if ImageChops.difference(restored.convert(frame.mode), frame).getbbox() is not None:
+                print(f"frame {i} did not round-trip")
+                return 1
+
+        png_bytes, delta_bytes = folder_bytes(png_dir), folder_bytes(delta_dir)
+        print(f"{len(frames)} frames at {size[0]}x{size[1]}")
+        print(f"  standalone png-fast  {png_bytes / 1048576:8.2f} MB  {png_ms:7.1f} ms/frame")
+        print(f"  keyframe + delta     {delta_bytes / 1048576:8.2f} MB  {delta_ms:7.1f} ms/frame")
+        print(f"  reduction            {png_bytes / delta_bytes:8.1f}x   (all frames round-trip exactly)")
+        return 0
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+===========================================================
+    Project Name : Screen Shot Manager
+    File Name    : bench_encoders.py
+    Author       : Vignesh Kumar B
+    Created On   : 2026-10-18
+    Description  : Storage encoder size/speed benchmark
+===========================================================
+
+Encodes a corpus of synthetic screenshots with every encoder profile and
+reports milliseconds per frame and bytes per frame, overall and per
+screenshot kind, so the default profile can be chosen from data.
+
+Usage: python benchmarks/bench_encoders.py [--size WxH] [--frames N] [--runs N]
+"""
+
+import argparse
+import io
+import os
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from PIL import Image, ImageChops  # noqa: E402
+
+from encoders import ENCODER_PROFILES  # noqa: E402
+from synthetic import corpus  # noqa: E402
+
+
+def encode_once(profile, image):
+    buffer = io.BytesIO()
+    start = time.perf_counter()
+    profile.encode(image, buffer)
+    return (time.perf_counter() - start) * 1000, buffer.getvalue()
+
+
+def is_identical(image, data):
+    decoded = Image.open(io.BytesIO(data)).convert(image.mode)
+    return ImageChops.difference(image, decoded).getbbox() is None
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--size", default="1920x1080")
+    parser.add_argument("--frames", type=int, default=2, help="frames per screenshot kind")
+    parser.add_argument("--runs", type=int, default=3, help="encodes per frame (median)")
+    args = parser.parse_args()
+    size = tuple(int(v) for v in args.size.lower().split("x"))
+
+    frames = list(corpus(size, args.frames))
+    kinds = sorted({kind for kind, _ in frames})
+    print(f"{len(frames)} synthetic {size[0]}x{size[1]} frames ({', '.join(kinds)}), "
+          f"median of {args.runs} encodes each\n")
+
+    header = f"{'profile':<15}{'ms/frame':>10}{'KB/frame':>10}{'vs png':>8}  exact"
+    header += "".join(f"{kind + ' KB':>14}" for kind in kinds)
+    print(header)
+    print("-" * len(header))
+
+    baseline = None
+    for name, profile in ENCODER_PROFILES.items():
+        times, sizes, per_kind, exact = [], [], {kind: [] for kind in kinds}, True
+        for kind, image in frames:
+            runs = [encode_once(profile, image) for _ in range(args.runs)]
+            data = runs[0][1]
+            times.append(statistics.median(ms for ms, _ in runs))
+            sizes.append(len(data))
+            per_kind[kind].append(len(data))
+            exact = exact and is_identical(image, data)
+
+        mean_bytes = statistics.mean(sizes)
+        if baseline is None:
+            baseline = mean_bytes
+        row = (f"{name:<15}{statistics.mean(times):>10.1f}{mean_bytes / 1024:>10.0f}"
+               f"{mean_bytes / baseline:>8.2f}  {'yes' if exact else 'no ':<5}")
+        row += "".join(f"{statistics.mean(per_kind[kind]) / 1024:>14.0f}" for kind in kinds)
+        print(row)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
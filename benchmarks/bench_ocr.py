@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+===========================================================
+    Project Name : Screen Shot Manager
+    File Name    : bench_ocr.py
+    Author       : Vignesh Kumar B
+    Created On   : 2026-10-18
+    Description  : OCR latency and accuracy benchmark
+===========================================================
+
+Runs tesseract on synthetic screenshots with known text, once on the
+whole colour frame (the default) and once through the opt-in
+preprocessing and text-region pipeline, and reports the time per frame
+and the share of the expected characters that were recognised; run it
+before turning DEFAULT_PREPROCESS["enabled"] on.  With --monitors N the
+frames are N captures side by side, and tiled OCR (a grid of
+overlapping tiles recognised in parallel) is compared as well.
+
+Usage: python benchmarks/bench_ocr.py [--frames N] [--monitors N] [--tesseract PATH]
+"""
+
+import argparse
+import difflib
+import os
+import statistics
+import sys
+import time
+
+from PIL import Image
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from ocr_pool import TESSERACT_CMD  # noqa: E402
+from ocr_preprocess import DEFAULT_PREPROCESS, ocr_preprocessed, region_mask, \
+    text_regions, to_grayscale  # noqa: E402
+from ocr_tiles import DEFAULT_TILES, grid_tiles, ocr_tiled  # noqa: E402
+from synthetic import text_capture  # noqa: E402
+
+
+def accuracy(text, truth):
+    """Share of the characters of truth found, in order, in text
+
+    Whitespace is normalised first: line breaks and block separators
+    differ between the two paths and are not what is being measured.
+    """
+    text, truth = " ".join(text.split()), " ".join(truth.split())
+    if not truth:
+        return 1.0
+    matcher = difflib.SequenceMatcher(None, text, truth, autojunk=False)
+    return sum(block.size for block in matcher.get_matching_blocks()) / len(truth)
+
+
+def wide_capture(monitors, seed):
+    """monitors text captures side by side, with their text in order"""
+    parts = [text_capture(seed=seed * monitors + i) for i in range(monitors)]
+    width, height = parts[0][0].size
+    image = Image.new("RGB", (width * monitors, height))
+    for i, (part, _truth) in enumerate(parts):
+        image.paste(part, (i * width, 0))
+    return image, "\n".join(truth for _part, truth in parts)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--frames", type=int, default=5)
+    parser.add_argument("--monitors", type=int, default=1)
+    parser.add_argument("--tesseract", default=TESSERACT_CMD)
+    args = parser.parse_args()
+
+    frames = [wide_capture(args.monitors, seed) for seed in range(args.frames)]
+
+    # Preprocessing cost alone, which needs no tesseract
+    times = []
+    for image, _truth in frames:
+        t = time.perf_counter()
+        gray = to_grayscale(image)
+        text_regions(region_mask(gray, DEFAULT_PREPROCESS["radius"], DEFAULT_PREPROCESS["offset"]))
+        times.append((time.perf_counter() - t) * 1000)
+    width, height = frames[0][0].size
+    print(f"Region detection: {statistics.median(times):.1f} ms per {width}x{height} frame")
+
+    try:
+        import pytesseract
+    except ImportError:
+        print("pytesseract is not installed; skipping the OCR comparison")
+        return 1
+    if os.path.exists(args.tesseract):
+        pytesseract.pytesseract.tesseract_cmd = args.tesseract
+
+    def recognise(source, config=""):
+        return pytesseract.image_to_string(source, lang="eng", config=config)
+
+    def recognise_data(source, config=""):
+        return pytesseract.image_to_data(source, lang="eng", config=config,
+                                         output_type=pytesseract.Output.DICT)
+
+    settings = {"preprocess": DEFAULT_PREPROCESS, "tiles": DEFAULT_TILES}
+    paths = [("full frame", lambda image: recognise(image)),
+             ("preprocessed", lambda image: ocr_preprocessed(image, DEFAULT_PREPROCESS, recognise))]
+    if args.monitors > 1:
+        paths.append(("tiled", lambda image: ocr_tiled(
+            image, grid_tiles(image.size, DEFAULT_TILES["size"], DEFAULT_TILES["overlap"]),
+            settings, recognise_data, os.cpu_count() or 1)))
+    try:
+        recognise(frames[0][0].crop((0, 0, 64, 64)))
+    except pytesseract.pytesseract.TesseractNotFoundError:
+        print("Tesseract OCR is not installed; skipping the OCR comparison")
+        return 1
+
+    print(f"{'path':14} {'median ms':>10} {'accuracy':>9}")
+    results = {}
+    for label, run in paths:
+        times, scores = [], []
+        for image, truth in frames:
+            t = time.perf_counter()
+            text = run(image)
+            times.append((time.perf_counter() - t) * 1000)
+            scores.append(accuracy(text, truth))
+        results[label] = statistics.median(times)
+        print(f"{label:14} {results[label]:10.0f} {statistics.mean(scores):9.1%}")
+    for label in list(results)[1:]:
+        print(f"Speed-up of {label}: {results['full frame'] / results[label]:.1f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+===========================================================
+    Project Name : Screen Shot Manager
+    File Name    : bench_preview.py
+    Author       : Vignesh Kumar B
+    Created On   : 2026-10-18
+    Description  : Preview first-frame latency benchmark
+===========================================================
+
+Measures how long it takes from selecting a screenshot to having pixels
+ready for the preview canvas, for an 8K (7680x4320) synthetic capture:
+
+  legacy        Image.open + full LANCZOS resize (the old show_preview)
+  first, cold   first frame of a new capture: a flat placeholder sized
+                from the file header (no thumbnail cached yet)
+  final, cold   background render of a new capture: decode, build the
+                thumbnail tiers, LANCZOS; the placeholder shows until then
+  first, warm   quick first frame from the cached thumbnail tier
+  final, warm   background LANCZOS render from the thumbnail cache
+
+The 30 ms target applies to both first frames.  The cold final frame is
+reported against it too: on an 8K capture it misses the target by far,
+which is the time a user looks at the placeholder.
+
+Usage: python benchmarks/bench_preview.py [--runs N] [--box WxH]
+"""
+
+import argparse
+import os
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from PIL import Image  # noqa: E402
+
+from delta_store import screenshot_size  # noqa: E402
+from preview_cache import fit_size, quick_preview  # noqa: E402
+from thumbnail_cache import ThumbnailCache  # noqa: E402
+from synthetic import desktop_capture  # noqa: E402
+
+
+FIRST_FRAME_TARGET_MS = 30.0
+
+
+def time_ms(fn, runs):
+    samples = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - start) * 1000)
+    return statistics.median(samples)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--box", default="900x650", help="preview canvas size")
+    args = parser.parse_args()
+    box = tuple(int(v) for v in args.box.lower().split("x"))
+
+    workdir = tempfile.mkdtemp(prefix="ssm_bench_")
+    try:
+        path = os.path.join(workdir, "ss_01012026_120000.png")
+        desktop_capture((7680, 4320)).save(path, "PNG")
+
+        def legacy():
+            image = Image.open(path)
+            image.resize(fit_size(image.size, box), Image.Resampling.LANCZOS)
+
+        def first_cold():
+            # ScreenshotApp.render_quick_preview on a thumbnail miss
+            size = fit_size(screenshot_size(path), box)
+            return Image.new("RGB", size, "#313244")
+
+        def render(cache):
+            # ScreenshotApp.render_preview
+            image, source_size = cache.get(path, box)
+            return image.resize(fit_size(source_size, box), Image.Resampling.LANCZOS)
+
+        cold_caches = iter(ThumbnailCache(os.path.join(workdir, f"cold{i}"))
+                           for i in range(args.runs))
+
+        def final_cold():
+            render(next(cold_caches))
+
+        cache = ThumbnailCache(os.path.join(workdir, "thumbs"))
+        render(cache)
+
+        def first_warm():
+            quick_preview(cache.peek(path), fit_size(screenshot_size(path), box))
+
+        results = [("legacy", time_ms(legacy, args.runs)),
+                   ("first, cold", time_ms(first_cold, args.runs)),
+                   ("final, cold", time_ms(final_cold, args.runs)),
+                   ("first, warm", time_ms(first_warm, args.runs)),
+                   ("final, warm", time_ms(lambda: render(cache), args.runs))]
+
+        print(f"8K capture, preview box {box[0]}x{box[1]}, median of {args.runs} runs")
+        for name, ms in results:
+            print(f"  {name:<24} {ms:8.1f} ms")
+
+        results = dict(results)
+        passed = True
+        print(f"Target < {FIRST_FRAME_TARGET_MS:.0f} ms:")
+        for name in ("first, cold", "first, warm", "final, cold"):
+            ok = results[name] < FIRST_FRAME_TARGET_MS
+            if name.startswith("first"):
+                passed = passed and ok
+                print(f"  {name:<24} {'PASS' if ok else 'FAIL'}")
+            else:
+                # Not gated: the placeholder is on screen meanwhile
+                print(f"  {name:<24} {'met' if ok else 'MISSED'} (placeholder shown "
+                      f"for {results[name]:.0f} ms on a new capture)")
+        return 0 if passed else 1
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+===========================================================
+    Project Name : Screen Shot Manager
+    File Name    : bench_search.py
+    Author       : Vignesh Kumar B
+    Created On   : 2026-10-18
+    Description  : OCR text search latency benchmark
+===========================================================
+
+Fills a search index with OCR-like text for N screenshots (error dialogs,
+logs, ticket numbers, config values) and times typical searches, including
+the prefix queries issued while a word is still being typed.
+
+Usage: python benchmarks/bench_search.py [--docs N] [--runs N]
+"""
+
+import argparse
+import os
+import random
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from search_index import SearchIndex  # noqa: E402
+
+# Target from the search-as-you-type requirement
+BUDGET_MS = 50.0
+
+WORDS = ("error failed connection timeout server request response user file "
+         "build deploy config value setting window dialog button cancel retry "
+         "exception null pointer stack trace line module import database query "
+         "select update insert delete table column index memory disk network "
+         "proxy certificate expired invalid token session login password").split()
+
+QUERIES = ("timeout", "connection refused", "ERR-4012", "TCK-77", "cert",
+           "NullPointerException", "db_pool_size", "zzzz-no-match")
+
+
+def document(rng, i):
+    words = [rng.choice(WORDS) for _ in range(rng.randint(40, 160))]
+    if i % 7 == 0:
+        words.insert(rng.randrange(len(words)), f"ERR-{rng.randint(1000, 9999)}")
+    if i % 11 == 0:
+        words.insert(rng.randrange(len(words)), f"TCK-{rng.randint(1, 99999)}")
+    if i % 13 == 0:
+        words.append("java.lang.NullPointerException at com.example.Service")
+    if i % 17 == 0:
+        words.append(f"db_pool_size = {rng.randint(1, 64)}")
+    if i % 5 == 0:
+        words.append("connection refused")
+    return " ".join(words)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--docs", type=int, default=100000)
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+
+    workdir = tempfile.mkdtemp(prefix="ssm_bench_")
+    try:
+        index = SearchIndex(os.path.join(workdir, "search.sqlite3"))
+        rng = random.Random(42)
+        start = time.perf_counter()
+        batch = []
+        for i in range(args.docs):
+            batch.append((f"ss_{i:08d}.png", document(rng, i)))
+            if len(batch) == 5000:
+                index.add_many(batch)
+                batch = []
+        index.add_many(batch)
+        print(f"Indexed {args.docs} documents in {time.perf_counter() - start:.1f} s")
+
+        worst, worst_text = 0.0, ""
+        print(f"{'query':24} {'hits':>6} {'median ms':>10} {'max ms':>8}")
+        for query in QUERIES:
+            # Also time each prefix, as typed
+            for end in range(1, len(query) + 1):
+                times = []
+                for _ in range(args.runs):
+                    t = time.perf_counter()
+                    hits = index.search(query[:end])
+                    times.append((time.perf_counter() - t) * 1000)
+                if max(times) > worst:
+                    worst, worst_text = max(times), query[:end]
+            print(f"{query:24} {len(hits):6d} {statistics.median(times):10.2f} {max(times):8.2f}")
+
+        index.close()
+        print(f"Slowest keystroke: {worst:.1f} ms for {worst_text!r} (budget {BUDGET_MS:.0f} ms) - "
+              f"{'PASS' if worst <= BUDGET_MS else 'FAIL'}")
+        return 0 if worst <= BUDGET_MS else 1
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+===========================================================
+    Project Name : Screen Shot Manager
+    File Name    : bench_split.py
+    Author       : Vignesh Kumar B
+    Created On   : 2026-10-18
+    Description  : Split capture parallel encode benchmark
+===========================================================
+
+Writes a multi-monitor desktop through the capture pipeline as one image
+on one worker (the old behaviour), as one file per monitor and as a grid
+of tiles, with one worker per core, and reports the time until every
+file is on disk, the speedup over the single image and the bytes
+written.  The speedup is bounded by the number of cores and parts.
+
+Usage: python benchmarks/bench_split.py [--size WxH] [--monitors N] [--grid CxR]
+                                        [--workers N] [--encoder NAME] [--runs N]
+"""
+
+import argparse
+import os
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from capture_backends import get_backend  # noqa: E402
+from capture_pipeline import CapturePipeline  # noqa: E402
+from capture_split import part_suffixes, split_boxes  # noqa: E402
+from encoders import DEFAULT_PROFILE, ENCODER_PROFILES, get_profile  # noqa: E402
+
+
+def write_capture(image, boxes, mode, workers, encoder, folder):
+    """Milliseconds from submit until every part is written, and bytes"""
+    parts = [image.crop(box) for box in boxes] if boxes else [image]
+    pipeline = CapturePipeline(workers=workers, queue_depth=1, policy="block")
+    suffixes = part_suffixes(mode, len(parts)) if boxes else [""]
+    filepaths = pipeline.reserve_set(folder, "bench", suffixes, encoder.ext)
+    start = time.perf_counter()
+    pipeline.submit_set([(part, filepath, None) for part, filepath in zip(parts, filepaths)],
+                        encoder)
+    pipeline.close(wait=True)
+    elapsed = (time.perf_counter() - start) * 1000
+    size = sum(os.path.getsize(filepath) for filepath in filepaths)
+    for filepath in filepaths:
+        os.remove(filepath)
+    return elapsed, size
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--size", default="5760x1080", help="whole desktop")
+    parser.add_argument("--monitors", type=int, default=3, help="side-by-side monitors")
+    parser.add_argument("--grid", default="4x2", help="tiles, columns x rows")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--encoder", default=DEFAULT_PROFILE, choices=sorted(ENCODER_PROFILES))
+    parser.add_argument("--runs", type=int, default=5, help="captures per layout (median)")
+    args = parser.parse_args()
+    size = tuple(int(v) for v in args.size.lower().split("x"))
+    grid = tuple(int(v) for v in args.grid.lower().split("x"))
+
+    backend = get_backend("synthetic", size=size, monitors=args.monitors)
+    encoder = get_profile(args.encoder)
+    layouts = [
+        ("single", "off", None, 1),
+        ("monitors", "monitors", split_boxes(size, backend.monitors(), "monitors"), args.workers),
+        ("tiles", "tiles", split_boxes(size, [], "tiles", grid), args.workers),
+    ]
+    print(f"{size[0]}x{size[1]} synthetic desktop, {args.monitors} monitor(s), "
+          f"{args.encoder}, {args.workers} worker(s) on {os.cpu_count()} core(s), "
+          f"median of {args.runs}\n")
+    print(f"{'layout':<10}{'parts':>6}{'workers':>8}{'ms':>9}{'speedup':>9}{'KB':>9}")
+
+    folder = tempfile.mkdtemp(prefix="bench_split_")
+    baseline = None
+    try:
+        for label, mode, boxes, workers in layouts:
+            results = [write_capture(backend.grab(), boxes, mode, workers, encoder, folder)
+                       for _ in range(args.runs)]
+            ms = statistics.median(elapsed for elapsed, _ in results)
+            kb = statistics.mean(size for _, size in results) / 1024
+            if baseline is None:
+                baseline = ms
+            print(f"{label:<10}{len(boxes or [None]):>6}{workers:>8}{ms:>9.1f}"
+                  f"{baseline / ms:>8.2f}x{kb:>9.0f}")
+    finally:
+        backend.close()
+        shutil.rmtree(folder, ignore_errors=True)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+===========================================================
+    Project Name : Screen Shot Manager
+    File Name    : bench_startup.py
+    Author       : Vignesh Kumar B
+    Created On   : 2026-10-18
+    Description  : Cold start timing report for the application
+===========================================================
+
+Starts screenshot_app.py with --startup-report on a folder of N
+screenshots and reports the time from launching the process to the first
+drawn frame and to a filled file list, plus the import time of every
+module, split into those loaded before the first frame and those
+deferred until after it.  Needs a display (on Linux CI: xvfb-run).
+
+Usage: python benchmarks/bench_startup.py [--files N] [--runs N] [--budget-ms MS]
+"""
+
+import argparse
+import io
+import json
+import os
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+APP = os.path.join(ROOT, "screenshot_app.py")
+
+# Launch to first frame target
+BUDGET_MS = 300.0
+
+
+def make_folder(folder, count):
+    """count small captures with distinct names (contents do not matter)"""
+    from PIL import Image
+    buffer = io.BytesIO()
+    Image.new("RGB", (64, 36), (40, 40, 60)).save(buffer, "PNG")
+    data = buffer.getvalue()
+    for i in range(count):
+        day, second = divmod(i, 86400)
+        name = f"ss_{1 + day % 28:02d}102026_{second // 3600:02d}{second // 60 % 60:02d}{second % 60:02d}.png"
+        with open(os.path.join(folder, name), "wb") as f:
+            f.write(data)
+
+
+def launch(folder, importtime=False):
+    """Run the app once; returns (report dict, launch time, stderr)"""
+    command = [sys.executable] + (["-X", "importtime"] if importtime else []) + \
+        [APP, "--folder", folder, "--startup-report"]
+    launched = time.time()
+    result = subprocess.run(command, cwd=ROOT, capture_output=True, text=True, timeout=120)
+    lines = [line for line in result.stdout.splitlines() if line.startswith("{")]
+    if result.returncode != 0 or not lines:
+        raise RuntimeError(f"screenshot_app.py failed ({result.returncode}):\n{result.stderr[-2000:]}")
+    return json.loads(lines[-1]), launched, result.stderr
+
+
+def import_times(stderr):
+    """{module: cumulative ms} of the imports made directly by the app"""
+    times = {}
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _self, cumulative, name = line[len("import time:"):].split("|")
+        # Nested imports are indented below the module that made them
+        if not name.startswith(" ") or name.startswith("  ") or not cumulative.strip().isdigit():
+            continue
+        times[name.strip()] = int(cumulative) / 1000
+    return times
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--files", type=int, default=5000)
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--budget-ms", type=float, default=BUDGET_MS,
+                        help="fail if launch to first frame takes longer")
+    parser.add_argument("--top", type=int, default=15, help="modules listed per phase")
+    args = parser.parse_args()
+
+    workdir = tempfile.mkdtemp(prefix="ssm_bench_")
+    try:
+        make_folder(workdir, args.files)
+
+        # One warm-up run fills the catalog and writes the .pyc files, as
+        # on any start after the first
+        launch(workdir)
+        first_frame, launch_ms, list_ms, ready_ms = [], [], [], []
+        for _ in range(args.runs):
+            report, launched, _stderr = launch(workdir)
+            first_frame.append(report["first_frame_ms"])
+            launch_ms.append((report["first_frame_at"] - launched) * 1000)
+            list_ms.append(report["list_ms"])
+            ready_ms.append(report["ready_ms"])
+
+        report, _launched, stderr = launch(workdir, importtime=True)
+        eager = set(report["first_frame_modules"])
+        times = import_times(stderr)
+        for phase, names in (("before first frame", [n for n in times if n in eager]),
+                             ("deferred", [n for n in times if n not in eager])):
+            print(f"Imports {phase}: {sum(times[n] for n in names):.1f} ms")
+            for name in sorted(names, key=times.get, reverse=True)[:args.top]:
+                print(f"  {name:32} {times[name]:8.1f} ms")
+
+        print(f"\n{report['files']} files, median of {args.runs} runs:")
+        print(f"  launch to first frame  {statistics.median(launch_ms):8.1f} ms")
+        print(f"  module to first frame  {statistics.median(first_frame):8.1f} ms")
+        print(f"  module to filled list  {statistics.median(list_ms):8.1f} ms")
+        print(f"  module to ready        {statistics.median(ready_ms):8.1f} ms")
+        worst = max(launch_ms)
+        print(f"Slowest launch to first frame: {worst:.1f} ms (budget {args.budget_ms:.0f} ms) - "
+              f"{'PASS' if worst <= args.budget_ms else 'FAIL'}")
+        return 0 if worst <= args.budget_ms else 1
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
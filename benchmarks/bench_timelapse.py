@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+===========================================================
+    Project Name : Screen Shot Manager
+    File Name    : bench_timelapse.py
+    Author       : Vignesh Kumar B
+    Created On   : 2026-10-18
+    Description  : Timelapse scheduler drift and backpressure
+===========================================================
+
+Runs a timelapse session on the synthetic backend and compares it with
+a naive "capture, then sleep(interval)" loop: how late each capture
+starts against its slot (start + n * interval), the drift of the last
+frame, and frames written, dropped and missed.  A slow encoder
+(png-max by default) on a short interval shows the backpressure: the
+encode queue never grows past its depth, frames are dropped instead.
+
+Usage: python benchmarks/bench_timelapse.py [--interval S] [--frames N] [--encoder NAME]
+"""
+
+import argparse
+import os
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from capture_backends import get_backend  # noqa: E402
+from encoders import ENCODER_PROFILES  # noqa: E402
+from screenshot_core import ScreenshotCore  # noqa: E402
+
+
+def open_core(folder, encoder, size):
+    core = ScreenshotCore(folder, encoder_profile=encoder, capture_backend="synthetic",
+                          capture_queue_depth=4, capture_queue_policy="block")
+    core._grabber = get_backend("synthetic", size=size)
+    return core
+
+
+def record_starts(core):
+    """Wrap core.capture_parts to log when every capture starts"""
+    starts, capture_parts = [], core.capture_parts
+    peak = [0]
+
+    def timed(*args, **kwargs):
+        starts.append(time.monotonic())
+        peak[0] = max(peak[0], core.capture_pipeline.pending())
+        return capture_parts(*args, **kwargs)
+
+    core.capture_parts = timed
+    return starts, peak
+
+
+def lateness_ms(starts, origin, interval):
+    """ms each capture started after the slot it belongs to"""
+    return [(start - origin - round((start - origin) / interval) * interval) * 1000
+            for start in starts]
+
+
+def run_naive(core, interval, frames):
+    starts, peak = record_starts(core)
+    origin = time.monotonic()
+    for _ in range(frames):
+        core.capture_parts()
+        time.sleep(interval)
+    core.capture_pipeline.close(wait=True)
+    late = [(start - origin - i * interval) * 1000 for i, start in enumerate(starts)]
+    return {"frames": len(starts), "dropped": 0, "missed": 0, "peak": peak[0], "late": late,
+            "drift": late[-1]}
+
+
+def run_session(core, interval, frames):
+    starts, peak = record_starts(core)
+    origin = time.monotonic()
+    session = core.start_timelapse(interval, count=frames)
+    session.wait()
+    core.capture_pipeline.close(wait=True)
+    stats = session.snapshot()
+    late = lateness_ms(starts, origin, interval)
+    return {"frames": stats.frames, "dropped": stats.dropped, "missed": stats.missed,
+            "peak": peak[0], "late": late, "drift": late[-1]}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--interval", type=float, default=0.25, help="seconds between frames")
+    parser.add_argument("--frames", type=int, default=40)
+    parser.add_argument("--encoder", default="png-max", choices=sorted(ENCODER_PROFILES))
+    parser.add_argument("--size", default="2560x1440")
+    args = parser.parse_args()
+    size = tuple(int(v) for v in args.size.lower().split("x"))
+
+    print(f"{args.frames} ticks every {args.interval:g} s, {size[0]}x{size[1]} synthetic "
+          f"frames, {args.encoder}, encode queue depth 4\n")
+    print(f"{'scheduler':<12}{'frames':>7}{'dropped':>8}{'missed':>7}{'peak queue':>11}"
+          f"{'late ms (median)':>18}{'late ms (max)':>15}{'end drift ms':>14}")
+    for label, run in (("sleep loop", run_naive), ("timelapse", run_session)):
+        folder = tempfile.mkdtemp(prefix="bench_timelapse_")
+        core = open_core(folder, args.encoder, size)
+        try:
+            result = run(core, args.interval, args.frames)
+        finally:
+            core.close(wait=True)
+            shutil.rmtree(folder, ignore_errors=True)
+        print(f"{label:<12}{result['frames']:>7}{result['dropped']:>8}{result['missed']:>7}"
+              f"{result['peak']:>11}{statistics.median(result['late']):>18.1f}"
+              f"{max(result['late']):>15.1f}{result['drift']:>14.1f}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
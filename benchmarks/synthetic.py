@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+===========================================================
+    Project Name : Screen Shot Manager
+    File Name    : synthetic.py
+    Author       : Vignesh Kumar B
+    Created On   : 2026-10-18
+    Description  : Synthetic screenshot corpus for benchmarks
+===========================================================
+"""
+
+import random
+
+from PIL import Image, ImageDraw, ImageFilter, ImageFont
+
+
+BACKGROUND = (30, 30, 46)
+PANEL = (49, 50, 68)
+TEXT = (205, 214, 244)
+ACCENT = (137, 180, 250)
+
+
+def desktop_capture(size=(1920, 1080), panels=3, seed=0):
+    """Text-heavy desktop: side-by-side log panes under a title bar"""
+    rng = random.Random(seed)
+    image = Image.new("RGB", size, BACKGROUND)
+    draw = ImageDraw.Draw(image)
+    width, height = size
+    pane = width // panels
+    for i in range(panels):
+        x = i * pane
+        draw.rectangle([x + 20, 60, x + pane - 20, height - 60],
+                       fill=(PANEL[0] + i * 10, PANEL[1], PANEL[2]), outline=ACCENT, width=3)
+        for row, y in enumerate(range(120, height - 120, 24)):
+            draw.text((x + 40, y),
+                      f"[{row:04d}] INFO worker-{i} processed batch {rng.randrange(10007)}",
+                      fill=TEXT)
+    draw.rectangle([0, 0, width, 40], fill=(24, 24, 37))
+    return image
+
+
+def dialog_capture(size=(1920, 1080), seed=0):
+    """Flat UI: a few solid panels, buttons and short labels"""
+    rng = random.Random(seed)
+    image = Image.new("RGB", size, (240, 240, 240))
+    draw = ImageDraw.Draw(image)
+    width, height = size
+    draw.rectangle([0, 0, width, 32], fill=(0, 120, 215))
+    box = [width // 4, height // 4, width * 3 // 4, height * 3 // 4]
+    draw.rectangle(box, fill=(255, 255, 255), outline=(160, 160, 160), width=1)
+    for i in range(8):
+        y = box[1] + 40 + i * 36
+        draw.text((box[0] + 30, y), f"Setting {i + 1}: value {rng.randrange(100)}", fill=(20, 20, 20))
+        draw.rectangle([box[2] - 160, y - 4, box[2] - 40, y + 20], fill=(225, 225, 225),
+                       outline=(173, 173, 173))
+    draw.rectangle([box[2] - 220, box[3] - 60, box[2] - 40, box[3] - 24], fill=(0, 120, 215))
+    draw.text((box[2] - 160, box[3] - 50), "OK", fill=(255, 255, 255))
+    return image
+
+
+def wallpaper_capture(size=(1920, 1080), seed=0):
+    """Photographic-ish desktop: smooth gradient plus noise, few windows"""
+    rng = random.Random(seed)
+    gradient = Image.linear_gradient("L").resize(size)
+    noise = Image.effect_noise(size, 24).filter(ImageFilter.GaussianBlur(1))
+    image = Image.merge("RGB", (gradient, noise, gradient.transpose(Image.Transpose.FLIP_LEFT_RIGHT)))
+    draw = ImageDraw.Draw(image)
+    for _ in range(3):
+        x, y = rng.randrange(size[0] // 2), rng.randrange(size[1] // 2)
+        draw.rectangle([x, y, x + size[0] // 3, y + size[1] // 3], fill=PANEL, outline=ACCENT)
+    return image
+
+
+def text_capture(size=(1920, 1080), seed=0):
+    """Screenshot with known text; returns (image, text in reading order)
+
+    A dark-theme editor pane, a light error dialog, a picture and a lot of
+    empty desktop, drawn with a 15 px TrueType font like real UI text.
+    """
+    rng = random.Random(seed)
+    font = ImageFont.load_default(size=15)
+    width, height = size
+    image = wallpaper_capture(size, seed=seed)
+    draw = ImageDraw.Draw(image)
+    draw.rectangle([0, height - 48, width, height], fill=(24, 24, 37))
+    lines = []
+
+    # Editor pane, light text on dark
+    pane = [40, 60, width // 2 - 20, height // 2 + 120]
+    draw.rectangle(pane, fill=BACKGROUND, outline=ACCENT, width=2)
+    for i in range(14):
+        line = (f"{i + 1:3d}  config.set(\"db_pool_size\", {rng.randrange(2, 64)})  "
+                f"# retry={rng.randrange(1, 9)} timeout={rng.randrange(5, 120)}s")
+        draw.text((pane[0] + 16, pane[1] + 16 + i * 24), line, fill=TEXT, font=font)
+        lines.append(line)
+
+    # Error dialog, dark text on light
+    box = [width // 2 + 40, 120, width - 80, 420]
+    draw.rectangle(box, fill=(250, 250, 250), outline=(160, 160, 160), width=1)
+    draw.rectangle([box[0], box[1], box[2], box[1] + 32], fill=(0, 120, 215))
+    title = "Deployment failed"
+    draw.text((box[0] + 12, box[1] + 7), title, fill=(255, 255, 255), font=font)
+    lines.append(title)
+    for i, line in enumerate((
+            f"Error ERR-{rng.randrange(1000, 9999)}: connection to build server refused.",
+            f"Ticket TCK-{rng.randrange(10000, 99999)} has been opened for this failure.",
+            "Check the proxy certificate and try again.")):
+        draw.text((box[0] + 24, box[1] + 60 + i * 28), line, fill=(20, 20, 20), font=font)
+        lines.append(line)
+
+    # Picture with no text
+    photo = Image.effect_noise((width // 4, height // 4), 80).convert("RGB")
+    image.paste(photo, (width // 2 + 80, height // 2 + 60))
+    return image, "\n".join(lines)
+
+
+CORPUS = {
+    "desktop": desktop_capture,
+    "dialog": dialog_capture,
+    "wallpaper": wallpaper_capture,
+}
+
+
+def corpus(size=(1920, 1080), frames_per_kind=2):
+    """Yield (kind, image) pairs covering every synthetic screenshot kind"""
+    for kind, make in CORPUS.items():
+        for seed in range(frames_per_kind):
+            yield kind, make(size, seed=seed)
@@ -0,0 +1,621 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+===========================================================
+    Project Name : Screen Shot Manager
+    File Name    : capture_backends.py
+    Author       : Vignesh Kumar B
+    Created On   : 2026-10-18
+    Description  : Screen capture backends
+===========================================================
+
+A backend turns the screen (or a box of it) into a PIL image:
+
+- "imagegrab": PIL.ImageGrab, works on Windows, macOS and X11
+- "x11-shm": the X11 MIT shared-memory extension through ctypes; the
+  server copies pixels straight into memory shared with this process,
+  with no socket transfer.  Linux only, works against Xvfb too
+- "synthetic": generated desktop frames, no display needed (tests, CI
+  and benchmarks)
+
+Every backend grabs just a box when asked, so region and active-window
+captures (active_window_box()) cost a fraction of a full desktop.
+monitors() gives the monitor layout inside a full grab, for captures
+split into one file per monitor.
+
+"auto" picks x11-shm when an X display with MIT-SHM is available and
+falls back to imagegrab.
+"""
+
+import contextlib
+import os
+import sys
+import threading
+
+
+class CaptureUnavailableError(OSError):
+    """The backend cannot run here (no display, missing library, ...)"""
+
+
+class CaptureBackend:
+    """Base class; grab() may be called from any thread"""
+
+    name = None
+    label = None
+
+    def grab(self, bbox=None):
+        """RGB image of the screen, or of bbox (left, top, right, bottom)"""
+        raise NotImplementedError
+
+    def size(self):
+        """(width, height) of the whole capture area"""
+        raise NotImplementedError
+
+    def active_window_box(self):
+        """Box of the foreground window, in grab() coordinates"""
+        raise CaptureUnavailableError(f"The {self.name} backend cannot find the active window")
+
+    def monitors(self):
+        """Box of every monitor, in the coordinates of a full grab()
+
+        The default is one monitor covering the whole capture area.
+        """
+        return [(0, 0) + tuple(self.size())]
+
+    def close(self):
+        pass
+
+
+def clip_box(box, size):
+    """box limited to (0, 0) - size, or None if nothing is left"""
+    left, top = max(box[0], 0), max(box[1], 0)
+    right, bottom = min(box[2], size[0]), min(box[3], size[1])
+    return (left, top, right, bottom) if right > left and bottom > top else None
+
+
+def _win32_foreground_box():
+    """Screen box of the foreground window, without its invisible
+    resize borders (DWM extended frame bounds) when available"""
+    import ctypes
+    from ctypes import wintypes
+
+    user32 = ctypes.windll.user32
+    hwnd = user32.GetForegroundWindow()
+    if not hwnd:
+        raise CaptureUnavailableError("There is no active window")
+    rect = wintypes.RECT()
+    DWMWA_EXTENDED_FRAME_BOUNDS = 9
+    try:
+        failed = ctypes.windll.dwmapi.DwmGetWindowAttribute(
+            hwnd, DWMWA_EXTENDED_FRAME_BOUNDS, ctypes.byref(rect), ctypes.sizeof(rect))
+    except OSError:
+        failed = True
+    if failed and not user32.GetWindowRect(hwnd, ctypes.byref(rect)):
+        raise CaptureUnavailableError("Cannot read the active window's position")
+    return rect.left, rect.top, rect.right, rect.bottom
+
+
+def _win32_monitors(all_screens):
+    """Monitor boxes relative to what ImageGrab.grab(all_screens) returns:
+    the virtual screen, or the primary monitor alone"""
+    import win32api
+
+    rects = [rect for _monitor, _dc, rect in win32api.EnumDisplayMonitors()]
+    if not all_screens:
+        # The primary monitor has its top-left corner at (0, 0)
+        rects = [rect for rect in rects if rect[:2] == (0, 0)] or rects[:1]
+    left, top = min(r[0] for r in rects), min(r[1] for r in rects)
+    return [(r[0] - left, r[1] - top, r[2] - left, r[3] - top) for r in rects]
+
+
+def _win32_grab_box(bbox):
+    """BitBlt of just bbox from the desktop (virtual screen coordinates)
+
+    ImageGrab always copies the whole screen and crops afterwards.
+    """
+    from PIL import Image
+    import win32con
+    import win32gui
+    import win32ui
+
+    CAPTUREBLT = 0x40000000  # include layered (translucent) windows
+    left, top, right, bottom = bbox
+    width, height = right - left, bottom - top
+    desktop = win32gui.GetDesktopWindow()
+    desktop_dc = win32gui.GetWindowDC(desktop)
+    source = win32ui.CreateDCFromHandle(desktop_dc)
+    memory = source.CreateCompatibleDC()
+    bitmap = win32ui.CreateBitmap()
+    try:
+        bitmap.CreateCompatibleBitmap(source, width, height)
+        memory.SelectObject(bitmap)
+        memory.BitBlt((0, 0), (width, height), source, (left, top),
+                      win32con.SRCCOPY | CAPTUREBLT)
+        bits = bitmap.GetBitmapBits(True)
+    finally:
+        memory.DeleteDC()
+        source.DeleteDC()
+        win32gui.ReleaseDC(desktop, desktop_dc)
+        win32gui.DeleteObject(bitmap.GetHandle())
+    return Image.frombuffer("RGB", (width, height), bits, "raw", "BGRX", 0, 1)
+
+
+class ImageGrabBackend(CaptureBackend):
+    """PIL.ImageGrab (GDI BitBlt on Windows, XCB on Linux)"""
+
+    name = "imagegrab"
+    label = "PIL ImageGrab"
+
+    def __init__(self, all_screens=False):
+        try:
+            from PIL import ImageGrab
+        except ImportError as e:
+            raise CaptureUnavailableError(f"PIL.ImageGrab is not available: {e}") from e
+        self._grab = ImageGrab.grab
+        self.all_screens = all_screens
+        self._size = None
+
+    def grab(self, bbox=None):
+        if bbox is not None and sys.platform == "win32":
+            try:
+                return _win32_grab_box(bbox)
+            except ImportError:
+                pass
+        try:
+            image = self._grab(bbox=bbox, all_screens=self.all_screens)
+        except OSError as e:
+            # e.g. "X connection failed" on a machine without a display
+            raise CaptureUnavailableError(f"Screen capture failed: {e}") from e
+        return image if image.mode == "RGB" else image.convert("RGB")
+
+    def size(self):
+        # ImageGrab has no query; costs one grab, then cached
+        if self._size is None:
+            self._size = self.grab().size
+        return self._size
+
+    def active_window_box(self):
+        if sys.platform != "win32":
+            return super().active_window_box()
+        return _win32_foreground_box()
+
+    def monitors(self):
+        if sys.platform == "win32":
+            try:
+                return _win32_monitors(self.all_screens)
+            except Exception:
+                # No pywin32, or the monitors changed mid-query
+                pass
+        return super().monitors()
+
+
+_X11_TYPES = None
+
+
+def _x11_types():
+    """(XImage, XShmSegmentInfo) ctypes structures, defined on first use"""
+    global _X11_TYPES
+    if _X11_TYPES is None:
+        import ctypes
+
+        class XImage(ctypes.Structure):
+            _fields_ = [("width", ctypes.c_int), ("height", ctypes.c_int),
+                        ("xoffset", ctypes.c_int), ("format", ctypes.c_int),
+                        ("data", ctypes.c_void_p), ("byte_order", ctypes.c_int),
+                        ("bitmap_unit", ctypes.c_int), ("bitmap_bit_order", ctypes.c_int),
+                        ("bitmap_pad", ctypes.c_int), ("depth", ctypes.c_int),
+                        ("bytes_per_line", ctypes.c_int), ("bits_per_pixel", ctypes.c_int),
+                        ("red_mask", ctypes.c_ulong), ("green_mask", ctypes.c_ulong),
+                        ("blue_mask", ctypes.c_ulong), ("obdata", ctypes.c_void_p),
+                        ("funcs", ctypes.c_void_p * 6)]
+
+        class XShmSegmentInfo(ctypes.Structure):
+            _fields_ = [("shmseg", ctypes.c_ulong), ("shmid", ctypes.c_int),
+                        ("shmaddr", ctypes.c_void_p), ("readOnly", ctypes.c_int)]
+
+        _X11_TYPES = (XImage, XShmSegmentInfo)
+    return _X11_TYPES
+
+
+# Xlib has one error handler per process, shared with Tk.  Ours is
+# installed once and only swallows errors of a display that is trapping
+# them right now (display pointer -> list of errors); every other error
+# goes to the handler that was installed before it.
+_X11_TRAPS = {}
+_X11_HANDLER = None
+_X11_HANDLER_LOCK = threading.Lock()
+
+
+def _install_x11_error_handler(x11):
+    global _X11_HANDLER
+    with _X11_HANDLER_LOCK:
+        if _X11_HANDLER is not None:
+            return
+        import ctypes
+
+        ErrorHandler = ctypes.CFUNCTYPE(ctypes.c_int, ctypes.c_void_p, ctypes.c_void_p)
+        previous = None
+
+        def handler(display, event):
+            errors = _X11_TRAPS.get(display)
+            if errors is not None:
+                errors.append(1)
+                return 0
+            return previous(display, event) if previous else 0
+
+        # Kept referenced for the life of the process
+        _X11_HANDLER = ErrorHandler(handler)
+        address = x11.XSetErrorHandler(_X11_HANDLER)
+        previous = ErrorHandler(address) if address else None
+
+
+class X11ShmBackend(CaptureBackend):
+    """XShmGetImage into a shared-memory segment (Linux, X11/Xvfb)
+
+    One segment is kept per capture size (the whole screen plus the most
+    recent box), so repeated grabs allocate nothing but the returned
+    image.
+    """
+
+    name = "x11-shm"
+    label = "X11 shared memory"
+
+    ZPIXMAP = 2
+    IPC_PRIVATE, IPC_CREAT, IPC_RMID = 0, 0o1000, 0
+    MAX_SEGMENTS = 2
+
+    def __init__(self, display=None):
+        if not sys.platform.startswith("linux"):
+            raise CaptureUnavailableError("The x11-shm backend needs Linux")
+        display = display or os.environ.get("DISPLAY")
+        if not display:
+            raise CaptureUnavailableError("No X display (DISPLAY is not set)")
+
+        import ctypes
+        import ctypes.util
+        self._ctypes = ctypes
+        XImage, self._SegmentInfo = _x11_types()
+        libs = {}
+        for lib in ("X11", "Xext", "c"):
+            path = ctypes.util.find_library(lib)
+            if path is None:
+                raise CaptureUnavailableError(f"lib{lib} not found")
+            libs[lib] = ctypes.CDLL(path, use_errno=True)
+        x11, xext, libc = self._x11, self._xext, self._libc = libs["X11"], libs["Xext"], libs["c"]
+
+        void_p, c_int, c_uint, c_ulong = ctypes.c_void_p, ctypes.c_int, ctypes.c_uint, ctypes.c_ulong
+        for func, restype, argtypes in (
+                (x11.XOpenDisplay, void_p, [ctypes.c_char_p]),
+                (x11.XCloseDisplay, c_int, [void_p]),
+                (x11.XDefaultScreen, c_int, [void_p]),
+                (x11.XDefaultRootWindow, c_ulong, [void_p]),
+                (x11.XDisplayWidth, c_int, [void_p, c_int]),
+                (x11.XDisplayHeight, c_int, [void_p, c_int]),
+                (x11.XDefaultVisual, void_p, [void_p, c_int]),
+                (x11.XDefaultDepth, c_int, [void_p, c_int]),
+                (x11.XSync, c_int, [void_p, c_int]),
+                (x11.XFree, c_int, [void_p]),
+                (x11.XInternAtom, c_ulong, [void_p, ctypes.c_char_p, c_int]),
+                (x11.XGetWindowProperty, c_int,
+                 [void_p, c_ulong, c_ulong, ctypes.c_long, ctypes.c_long, c_int, c_ulong,
+                  ctypes.POINTER(c_ulong), ctypes.POINTER(c_int), ctypes.POINTER(c_ulong),
+                  ctypes.POINTER(c_ulong), ctypes.POINTER(void_p)]),
+                (x11.XGetGeometry, c_int,
+                 [void_p, c_ulong, ctypes.POINTER(c_ulong), ctypes.POINTER(c_int),
+                  ctypes.POINTER(c_int), ctypes.POINTER(c_uint), ctypes.POINTER(c_uint),
+                  ctypes.POINTER(c_uint), ctypes.POINTER(c_uint)]),
+                (x11.XTranslateCoordinates, c_int,
+                 [void_p, c_ulong, c_ulong, c_int, c_int, ctypes.POINTER(c_int),
+                  ctypes.POINTER(c_int), ctypes.POINTER(c_ulong)]),
+                (x11.XSetErrorHandler, void_p, [void_p]),
+                (xext.XShmQueryExtension, c_int, [void_p]),
+                (xext.XShmCreateImage, ctypes.POINTER(XImage),
+                 [void_p, void_p, c_uint, c_int, void_p, ctypes.POINTER(self._SegmentInfo),
+                  c_uint, c_uint]),
+                (xext.XShmAttach, c_int, [void_p, ctypes.POINTER(self._SegmentInfo)]),
+                (xext.XShmDetach, c_int, [void_p, ctypes.POINTER(self._SegmentInfo)]),
+                (xext.XShmGetImage, c_int,
+                 [void_p, c_ulong, ctypes.POINTER(XImage), c_int, c_int, c_ulong]),
+                (libc.shmget, c_int, [c_int, ctypes.c_size_t, c_int]),
+                (libc.shmat, void_p, [c_int, void_p, c_int]),
+                (libc.shmdt, c_int, [void_p]),
+                (libc.shmctl, c_int, [c_int, c_int, void_p])):
+            func.restype, func.argtypes = restype, argtypes
+
+        self._display = x11.XOpenDisplay(display.encode())
+        if not self._display:
+            raise CaptureUnavailableError(f"Cannot open X display {display}")
+        if not xext.XShmQueryExtension(self._display):
+            x11.XCloseDisplay(self._display)
+            raise CaptureUnavailableError(f"X display {display} has no MIT-SHM extension")
+        screen = x11.XDefaultScreen(self._display)
+        self._root = x11.XDefaultRootWindow(self._display)
+        self._visual = x11.XDefaultVisual(self._display, screen)
+        self._depth = x11.XDefaultDepth(self._display, screen)
+        self._size = (x11.XDisplayWidth(self._display, screen),
+                      x11.XDisplayHeight(self._display, screen))
+        self._all_planes = (1 << (8 * ctypes.sizeof(c_ulong))) - 1
+        _install_x11_error_handler(x11)
+        self._xinerama = None
+        path = ctypes.util.find_library("Xinerama")
+        if path is not None:
+            self._xinerama = ctypes.CDLL(path)
+            self._xinerama.XineramaIsActive.restype = c_int
+            self._xinerama.XineramaIsActive.argtypes = [void_p]
+            self._xinerama.XineramaQueryScreens.restype = void_p
+            self._xinerama.XineramaQueryScreens.argtypes = [void_p, ctypes.POINTER(c_int)]
+        # size -> (XImage pointer, segment info), oldest first
+        self._segments = {}
+        # One Display connection; Xlib calls on it must not interleave
+        self._lock = threading.Lock()
+
+    def size(self):
+        return self._size
+
+    def monitors(self):
+        """Monitor boxes from Xinerama, or the whole screen without it"""
+        ctypes = self._ctypes
+        if self._xinerama is None:
+            return super().monitors()
+
+        class ScreenInfo(ctypes.Structure):
+            _fields_ = [("screen_number", ctypes.c_int), ("x_org", ctypes.c_short),
+                        ("y_org", ctypes.c_short), ("width", ctypes.c_short),
+                        ("height", ctypes.c_short)]
+
+        boxes = []
+        with self._lock:
+            if self._display is None or not self._xinerama.XineramaIsActive(self._display):
+                return super().monitors()
+            count = ctypes.c_int()
+            screens = self._xinerama.XineramaQueryScreens(self._display, ctypes.byref(count))
+            if screens:
+                for info in ctypes.cast(screens, ctypes.POINTER(ScreenInfo))[:count.value]:
+                    box = clip_box((info.x_org, info.y_org, info.x_org + info.width,
+                                    info.y_org + info.height), self._size)
+                    if box is not None:
+                        boxes.append(box)
+                self._x11.XFree(screens)
+        return boxes or super().monitors()
+
+    def active_window_box(self):
+        """Box of the window named by the window manager's
+        _NET_ACTIVE_WINDOW, frame excluded"""
+        ctypes, x11 = self._ctypes, self._x11
+        c_int, c_uint, c_ulong = ctypes.c_int, ctypes.c_uint, ctypes.c_ulong
+        with self._lock, self._trap_errors() as errors:
+            atom = x11.XInternAtom(self._display, b"_NET_ACTIVE_WINDOW", 1)
+            actual_type, actual_format = c_ulong(), c_int()
+            count, remaining, data = c_ulong(), c_ulong(), ctypes.c_void_p()
+            window = 0
+            if atom and x11.XGetWindowProperty(
+                    self._display, self._root, atom, 0, 1, 0, 0, ctypes.byref(actual_type),
+                    ctypes.byref(actual_format), ctypes.byref(count), ctypes.byref(remaining),
+                    ctypes.byref(data)) == 0 and data.value:
+                if actual_format.value == 32 and count.value:
+                    # Format 32 properties are arrays of C longs
+                    window = ctypes.cast(data, ctypes.POINTER(c_ulong))[0]
+                x11.XFree(data)
+            if not window:
+                raise CaptureUnavailableError("The window manager reports no active window")
+
+            root, x, y = c_ulong(), c_int(), c_int()
+            width, height, border, depth = c_uint(), c_uint(), c_uint(), c_uint()
+            child = c_ulong()
+            found = x11.XGetGeometry(self._display, window, ctypes.byref(root), ctypes.byref(x),
+                                     ctypes.byref(y), ctypes.byref(width), ctypes.byref(height),
+                                     ctypes.byref(border), ctypes.byref(depth)) and \
+                x11.XTranslateCoordinates(self._display, window, self._root, 0, 0,
+                                          ctypes.byref(x), ctypes.byref(y), ctypes.byref(child))
+            x11.XSync(self._display, 0)
+            if errors or not found:
+                raise CaptureUnavailableError("The active window went away")
+        box = clip_box((x.value, y.value, x.value + width.value, y.value + height.value),
+                       self._size)
+        if box is None:
+            raise CaptureUnavailableError("The active window is off screen")
+        return box
+
+    @contextlib.contextmanager
+    def _trap_errors(self):
+        """Collect X errors of this display instead of letting Xlib exit
+        the process (call with self._lock held)
+
+        A window can be destroyed between asking for its id and its
+        geometry.  Only this connection's errors are trapped; Tk's (or
+        any other display's) still reach their own handler.
+        """
+        errors = []
+        _X11_TRAPS[self._display] = errors
+        try:
+            yield errors
+        finally:
+            self._x11.XSync(self._display, 0)
+            del _X11_TRAPS[self._display]
+
+    def _segment(self, size):
+        """Shared-memory XImage of size, created on first use"""
+        segment = self._segments.pop(size, None)
+        if segment is None:
+            if len(self._segments) >= self.MAX_SEGMENTS:
+                self._free(self._segments.pop(next(iter(self._segments))))
+            segment = self._create(size)
+        # Most recently used last
+        self._segments[size] = segment
+        return segment
+
+    def _create(self, size):
+        ctypes, x11, xext, libc = self._ctypes, self._x11, self._xext, self._libc
+        info = self._SegmentInfo()
+        ximage = xext.XShmCreateImage(self._display, self._visual, self._depth, self.ZPIXMAP,
+                                      None, ctypes.byref(info), size[0], size[1])
+        if not ximage:
+            raise CaptureUnavailableError("XShmCreateImage failed")
+        image = ximage.contents
+        if image.bits_per_pixel != 32 or image.byte_order != 0:
+            x11.XFree(ximage)
+            raise CaptureUnavailableError(f"Unsupported X visual ({image.bits_per_pixel} bpp, "
+                                          f"byte order {image.byte_order})")
+
+        info.shmid = libc.shmget(self.IPC_PRIVATE, image.bytes_per_line * image.height,
+                                 self.IPC_CREAT | 0o600)
+        if info.shmid < 0:
+            x11.XFree(ximage)
+            raise CaptureUnavailableError(f"shmget failed: {os.strerror(ctypes.get_errno())}")
+        address = libc.shmat(info.shmid, None, 0)
+        if address in (None, ctypes.c_void_p(-1).value):
+            libc.shmctl(info.shmid, self.IPC_RMID, None)
+            x11.XFree(ximage)
+            raise CaptureUnavailableError(f"shmat failed: {os.strerror(ctypes.get_errno())}")
+        info.shmaddr = image.data = address
+        info.readOnly = 0
+        attached = xext.XShmAttach(self._display, ctypes.byref(info))
+        x11.XSync(self._display, 0)
+        # Removed now, freed by the kernel once both sides detach (even if
+        # this process dies)
+        libc.shmctl(info.shmid, self.IPC_RMID, None)
+        if not attached:
+            libc.shmdt(address)
+            x11.XFree(ximage)
+            raise CaptureUnavailableError("XShmAttach failed")
+        return ximage, info
+
+    def _free(self, segment):
+        ximage, info = segment
+        self._xext.XShmDetach(self._display, self._ctypes.byref(info))
+        self._x11.XSync(self._display, 0)
+        self._libc.shmdt(info.shmaddr)
+        # The pixels were shared memory and obdata points at info; free
+        # only the XImage structure itself
+        self._x11.XFree(ximage)
+
+    def grab(self, bbox=None):
+        from PIL import Image
+
+        left, top, right, bottom = bbox or ((0, 0) + self._size)
+        size = (right - left, bottom - top)
+        # The server answers a box outside the root window with BadMatch,
+        # which Xlib's default error handler turns into process exit
+        if left < 0 or top < 0 or right > self._size[0] or bottom > self._size[1] or \
+                min(size) < 1:
+            raise ValueError(f"Capture box {bbox} is outside the {self._size[0]}x{self._size[1]} screen")
+        with self._lock:
+            if self._display is None:
+                raise CaptureUnavailableError("Capture backend is closed")
+            ximage, _info = self._segment(size)
+            if not self._xext.XShmGetImage(self._display, self._root, ximage, left, top,
+                                           self._all_planes):
+                raise CaptureUnavailableError(f"XShmGetImage failed for {bbox or 'the screen'}")
+            image = ximage.contents
+            pixels = (self._ctypes.c_char * (image.bytes_per_line * image.height)).from_address(
+                image.data)
+            # BGRX -> RGB decodes into memory of its own, so the segment
+            # can be reused by the next grab straight away
+            return Image.frombuffer("RGB", size, pixels, "raw", "BGRX", image.bytes_per_line, 1)
+
+    def close(self):
+        with self._lock:
+            if self._display is None:
+                return
+            for segment in self._segments.values():
+                self._free(segment)
+            self._segments.clear()
+            self._x11.XCloseDisplay(self._display)
+            self._display = None
+
+
+class SyntheticBackend(CaptureBackend):
+    """Generated desktop frames, no display needed
+
+    Every grab is the same desktop with a frame counter and a moving
+    block, so consecutive captures differ a little, as real ones do.
+    static=True returns identical frames (duplicate detection tests).
+    window is the box active_window_box() reports (default: the first
+    pane).  monitors is how many side-by-side monitors the desktop
+    reports (default: one per 16:9 of width, e.g. 3 for 5760x1080).
+    """
+
+    name = "synthetic"
+    label = "Synthetic frames"
+
+    def __init__(self, size=(1920, 1080), static=False, window=None, monitors=None):
+        from PIL import Image, ImageDraw
+
+        self._size = tuple(size)
+        self.static = static
+        self.frames = 0
+        self._draw = ImageDraw.Draw
+        self._lock = threading.Lock()
+
+        width, height = self._size
+        base = Image.new("RGB", self._size, (30, 30, 46))
+        draw = ImageDraw.Draw(base)
+        draw.rectangle([0, 0, width, 32], fill=(24, 24, 37))
+        panes = max(1, width // 640)
+        pane = width // panes
+        for i in range(panes):
+            x = i * pane
+            draw.rectangle([x + 16, 48, x + pane - 16, height - 16], fill=(49 + i * 10, 50, 68),
+                           outline=(137, 180, 250), width=2)
+            for row, y in enumerate(range(64, height - 40, 20)):
+                draw.text((x + 28, y), f"[{row:04d}] INFO worker-{i} processed batch {row * 37 % 1009}",
+                          fill=(205, 214, 244))
+        self._base = base
+        self.window = tuple(window) if window else (16, 48, min(pane - 16, width), height - 16)
+        self.monitor_count = monitors or max(1, round(width * 9 / (16 * height)))
+
+    def size(self):
+        return self._size
+
+    def monitors(self):
+        width, height = self._size
+        count = self.monitor_count
+        return [(width * i // count, 0, width * (i + 1) // count, height) for i in range(count)]
+
+    def active_window_box(self):
+        box = clip_box(self.window, self._size)
+        if box is None:
+            raise CaptureUnavailableError("The active window is off screen")
+        return box
+
+    def grab(self, bbox=None):
+        with self._lock:
+            self.frames += 1
+            frame = self.frames
+        image = self._base.copy()
+        if not self.static:
+            draw = self._draw(image)
+            draw.rectangle([8, 8, 220, 26], fill=(24, 24, 37))
+            draw.text((12, 10), f"frame {frame}", fill=(249, 226, 175))
+            width, height = self._size
+            x = (frame * 37) % max(width - 64, 1)
+            draw.rectangle([x, height // 2, x + 63, height // 2 + 63], fill=(166, 227, 161))
+        return image.crop(bbox) if bbox else image
+
+
+CAPTURE_BACKENDS = {
+    backend.name: backend for backend in (ImageGrabBackend, X11ShmBackend, SyntheticBackend)
+}
+
+DEFAULT_BACKEND = "auto"
+
+
+def check_backend(name):
+    """Raise ValueError unless name is a backend name or "auto" """
+    if name != "auto" and name not in CAPTURE_BACKENDS:
+        raise ValueError(f"Unknown capture backend: {name!r} "
+                         f"(choose from auto, {', '.join(CAPTURE_BACKENDS)})")
+
+
+def get_backend(name=DEFAULT_BACKEND, **options):
+    """Create a capture backend; raises CaptureUnavailableError if it
+    cannot run here.  options go to a named backend's constructor."""
+    check_backend(name)
+    if name != "auto":
+        return CAPTURE_BACKENDS[name](**options)
+    if sys.platform.startswith("linux") and os.environ.get("DISPLAY"):
+        try:
+            return X11ShmBackend()
+        except CaptureUnavailableError:
+            pass
+    return ImageGrabBackend()
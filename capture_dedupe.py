@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+===========================================================
+    Project Name : Screen Shot Manager
+    File Name    : capture_dedupe.py
+    Author       : Vignesh Kumar B
+    Created On   : 2026-10-18
+    Description  : Capture-time duplicate screenshot detection
+===========================================================
+"""
+
+import threading
+from collections import deque
+
+from PIL import Image, ImageChops, ImageStat
+
+
+# What to do with a duplicate capture: not write it at all, or save it as
+# a hard link to the earlier file (no encode, no extra disk space)
+DEDUPE_ACTIONS = ("skip", "link")
+
+# Longest side of the sampled grayscale signature
+SIGNATURE_SIZE = 512
+
+
+def frame_signature(image, size=SIGNATURE_SIZE):
+    """Grayscale point-sampled copy of a frame, a few ms even for 3x4K
+
+    NEAREST sampling only touches the sampled pixels, so the cost does
+    not grow with the full frame size the way a box filter does.
+    """
+    scale = min(size / max(image.size), 1.0)
+    sampled = image.resize((max(int(image.width * scale), 1), max(int(image.height * scale), 1)),
+                           Image.Resampling.NEAREST)
+    return sampled.convert("L")
+
+
+def signature_distance(a, b):
+    """Mean absolute difference of two signatures, 0.0 (same) to 1.0"""
+    if a.size != b.size:
+        return 1.0
+    return ImageStat.Stat(ImageChops.difference(a, b)).mean[0] / 255.0
+
+
+class CaptureRecord:
+    """A recent capture: where it went and how it looked"""
+
+    __slots__ = ("filepath", "size", "signature", "frame")
+
+    def __init__(self, filepath, size, signature, frame):
+        self.filepath = filepath
+        self.size = size
+        self.signature = signature
+        self.frame = frame
+
+
+class CaptureDeduplicator:
+    """Compares new frames with recent captures before they are encoded
+
+    threshold is the largest signature distance (0.0-1.0) still treated
+    as a duplicate.  With threshold 0 a match must be pixel-identical:
+    equal signatures are confirmed against the full previous frame, which
+    is kept in memory for the most recent keep_frames captures only.
+    A split capture is remembered part by part (see set_parts()).
+    """
+
+    def __init__(self, threshold=0.0, history=8, keep_frames=2):
+        self.threshold = threshold
+        self.history = history
+        self.keep_frames = keep_frames
+        self.parts = 1
+        self._records = deque(maxlen=history)
+        self._lock = threading.Lock()
+
+    def signature(self, image):
+        return frame_signature(image)
+
+    def find(self, image, signature):
+        """Path of a recent capture that image duplicates, or None"""
+        with self._lock:
+            records = list(reversed(self._records))
+
+        for record in records:
+            if record.size != image.size:
+                continue
+            if signature_distance(signature, record.signature) > self.threshold:
+                continue
+            if self.threshold > 0:
+                return record.filepath
+            if record.frame is not None and ImageChops.difference(
+                    record.frame, image).getbbox() is None:
+                return record.filepath
+        return None
+
+    def remember(self, image, signature, filepath):
+        """Record a capture that is being written to filepath"""
+        with self._lock:
+            self._records.append(CaptureRecord(filepath, image.size, signature, image))
+            # Only the newest few full frames stay in memory
+            for record in list(self._records)[:-self.keep_frames * self.parts or None]:
+                record.frame = None
+
+    def set_parts(self, parts):
+        """Captures now come in parts files each; keep as many captures"""
+        with self._lock:
+            if parts != self.parts:
+                self.parts = parts
+                self._records = deque(self._records, maxlen=self.history * parts)
+
+    def forget(self, filepath):
+        """Stop matching against filepath (dropped, deleted or renamed)"""
+        with self._lock:
+            kept = [record for record in self._records if record.filepath != filepath]
+            self._records.clear()
+            self._records.extend(kept)
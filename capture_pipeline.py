@@ -0,0 +1,271 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+===========================================================
+    Project Name : Screen Shot Manager
+    File Name    : capture_pipeline.py
+    Author       : Vignesh Kumar B
+    Created On   : 2026-10-18
+    Description  : Background encode/write pool for captures
+===========================================================
+"""
+
+import os
+import shutil
+import threading
+import time
+from collections import deque
+
+from encoders import DEFAULT_PROFILE, get_profile
+from ocr_cache import content_hash
+
+
+# What submit() does when the queue is already full
+QUEUE_POLICIES = ("block", "drop_oldest", "drop_newest")
+
+
+def link_or_copy(source, filepath):
+    """Hard-link filepath to source, copying where links are unsupported"""
+    try:
+        os.link(source, filepath)
+    except OSError:
+        shutil.copy2(source, filepath)
+
+
+class CaptureJob:
+    """A captured frame waiting to be encoded"""
+
+    def __init__(self, image, filepath, encoder, link_to=None, captured_at=None):
+        self.image = image
+        self.filepath = filepath
+        self.encoder = encoder
+        # Duplicate of an earlier capture: link to it instead of encoding
+        self.link_to = link_to
+        self.captured_at = time.time() if captured_at is None else captured_at
+        self.linked = False
+
+
+class CapturePipeline:
+    """Bounded pool of worker threads that encode captured frames to disk
+
+    The hotkey handler only grabs the raw frame and calls submit(); PNG
+    encoding and the disk write happen on the workers.  submit_set()
+    queues the parts of a split capture (one per monitor or tile) as one
+    capture whose parts are encoded by several workers at once.  The
+    queue depth counts captures, not parts.  Callbacks run on
+    the worker thread, so GUI users must marshal them (e.g. root.after).
+    With a Catalog, every written file is recorded there (capture time,
+    dimensions, hash, encoder) before on_saved runs.
+    """
+
+    def __init__(self, workers=2, queue_depth=4, policy="drop_oldest",
+                 on_saved=None, on_error=None, on_dropped=None, catalog=None):
+        if policy not in QUEUE_POLICIES:
+            raise ValueError(f"Unknown queue policy: {policy!r}")
+        if queue_depth < 1 or workers < 1:
+            raise ValueError("workers and queue_depth must be at least 1")
+
+        self.queue_depth = queue_depth
+        self.policy = policy
+        self.on_saved = on_saved
+        self.on_error = on_error
+        self.on_dropped = on_dropped
+        self.catalog = catalog
+
+        self.submitted = 0
+        self.saved = 0
+        self.dropped = 0
+        self.failed = 0
+        # Frames actually encoded (not linked) and the time spent on them
+        self.encoded = 0
+        self.encode_seconds = 0.0
+
+        self._jobs = deque()
+        self._reserved = set()
+        self._cond = threading.Condition()
+        self._closed = False
+        self._threads = []
+        for i in range(workers):
+            thread = threading.Thread(target=self._worker, daemon=True,
+                                      name=f"capture-encoder-{i}")
+            thread.start()
+            self._threads.append(thread)
+
+    def reserve_path(self, folder, stem, ext=".png"):
+        """Return a free path for stem+ext, unique among queued jobs too"""
+        with self._cond:
+            candidate = os.path.join(folder, f"{stem}{ext}")
+            counter = 1
+            while candidate in self._reserved or os.path.exists(candidate):
+                candidate = os.path.join(folder, f"{stem}_{counter}{ext}")
+                counter += 1
+            self._reserved.add(candidate)
+            return candidate
+
+    def reserve_set(self, folder, stem, suffixes, ext=".png"):
+        """Free paths stem+suffix+ext for every suffix, sharing one stem
+
+        If any of them is taken, the whole set moves to stem_1, stem_2, ...
+        so its parts keep a common prefix.
+        """
+        with self._cond:
+            base, counter = stem, 1
+            while True:
+                candidates = [os.path.join(folder, f"{base}{suffix}{ext}") for suffix in suffixes]
+                if not any(path in self._reserved or os.path.exists(path)
+                           for path in candidates):
+                    break
+                base = f"{stem}_{counter}"
+                counter += 1
+            self._reserved.update(candidates)
+            return candidates
+
+    def submit(self, image, filepath, encoder=None, link_to=None, captured_at=None):
+        """Queue a frame for encoding; returns False if it was dropped
+
+        encoder is an EncoderProfile (default: the fast PNG profile).  With
+        link_to the frame is a duplicate of that (possibly still queued)
+        capture and is stored as a hard link to it once it is written;
+        the frame is only encoded if link_to never reaches the disk.
+        captured_at (Unix time, default now) is what the catalog records.
+        """
+        return self.submit_set([(image, filepath, link_to)], encoder, captured_at)
+
+    def submit_set(self, parts, encoder=None, captured_at=None):
+        """Queue the parts of one capture; returns False if it was dropped
+
+        parts are (image, filepath, link_to) tuples as for submit().  They
+        share a queue slot and are dropped together, but are taken by
+        different workers so they encode in parallel.
+        """
+        encoder = encoder or get_profile(DEFAULT_PROFILE)
+        captured_at = time.time() if captured_at is None else captured_at
+        capture = deque(CaptureJob(image, filepath, encoder, link_to, captured_at)
+                        for image, filepath, link_to in parts)
+        evicted = None
+
+        with self._cond:
+            if self._closed:
+                raise RuntimeError("Capture pipeline is closed")
+
+            if len(self._jobs) >= self.queue_depth:
+                if self.policy == "drop_newest":
+                    evicted = capture
+                elif self.policy == "drop_oldest":
+                    # Parts already taken by a worker are still written
+                    evicted = self._jobs.popleft()
+                else:
+                    while len(self._jobs) >= self.queue_depth and not self._closed:
+                        self._cond.wait()
+
+            if evicted is not None:
+                self.dropped += len(evicted)
+                for job in evicted:
+                    self._reserved.discard(job.filepath)
+                self._cond.notify_all()
+
+            if evicted is not capture:
+                self._jobs.append(capture)
+                self.submitted += len(capture)
+                self._cond.notify_all()
+
+        if evicted is not None and self.on_dropped:
+            for job in evicted:
+                self.on_dropped(job.filepath)
+        return evicted is not capture
+
+    def pending(self):
+        """Number of frames (or parts) waiting for a worker"""
+        with self._cond:
+            return sum(len(capture) for capture in self._jobs)
+
+    def full(self):
+        """True when the next submit() would block or drop a capture"""
+        with self._cond:
+            return len(self._jobs) >= self.queue_depth
+
+    def stats(self):
+        """Snapshot of the counters as a dict"""
+        with self._cond:
+            return {"submitted": self.submitted, "saved": self.saved, "dropped": self.dropped,
+                    "failed": self.failed, "encoded": self.encoded,
+                    "encode_seconds": self.encode_seconds}
+
+    def close(self, wait=True):
+        """Stop accepting frames; optionally wait for queued ones to finish"""
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+        if wait:
+            for thread in self._threads:
+                thread.join()
+
+    def _worker(self):
+        while True:
+            with self._cond:
+                while not self._jobs and not self._closed:
+                    self._cond.wait()
+                if not self._jobs:
+                    return
+                capture = self._jobs[0]
+                job = capture.popleft()
+                if not capture:
+                    self._jobs.popleft()
+                    # Wake producers blocked on a full queue
+                    self._cond.notify_all()
+
+            try:
+                started = time.perf_counter()
+                if job.link_to is not None:
+                    self._write_link(job)
+                else:
+                    job.encoder.save(job.image, job.filepath)
+                encode_seconds = time.perf_counter() - started
+            except Exception as e:
+                with self._cond:
+                    self.failed += 1
+                    self._reserved.discard(job.filepath)
+                    self._cond.notify_all()
+                if self.on_error:
+                    self.on_error(job.filepath, e)
+                continue
+
+            self._record(job)
+            with self._cond:
+                self.saved += 1
+                if not job.linked:
+                    self.encoded += 1
+                    self.encode_seconds += encode_seconds
+                self._reserved.discard(job.filepath)
+                # Wake link jobs waiting for this file
+                self._cond.notify_all()
+            if self.on_saved:
+                self.on_saved(job.filepath)
+
+    def _write_link(self, job):
+        # The original may still be encoding on another worker
+        with self._cond:
+            while job.link_to in self._reserved:
+                self._cond.wait()
+        if os.path.exists(job.link_to):
+            link_or_copy(job.link_to, job.filepath)
+            job.linked = True
+        else:
+            # The original was dropped or failed; store this frame instead
+            job.encoder.save(job.image, job.filepath)
+
+    def _record(self, job):
+        if self.catalog is None:
+            return
+        try:
+            if job.linked:
+                self.catalog.record_link(job.filepath, job.captured_at, job.link_to)
+            else:
+                # A lossy encoder stores other pixels than the frame's;
+                # the catalog scanner hashes those files from disk
+                digest = content_hash(job.image) if job.encoder.lossless else None
+                self.catalog.record(job.filepath, job.captured_at, job.image.size,
+                                    job.encoder.name, digest)
+        except Exception:
+            # The file is written; the catalog scanner fills the row in
+            pass
@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+===========================================================
+    Project Name : Screen Shot Manager
+    File Name    : capture_split.py
+    Author       : Vignesh Kumar B
+    Created On   : 2026-10-18
+    Description  : Split captures into per-monitor or tile files
+===========================================================
+
+A multi-monitor desktop grabbed as one image is one PNG, encoded on one
+core.  Split into parts (one per monitor, or a grid of tiles), each part
+is its own job on the capture pipeline and the encoders run in parallel.
+
+The parts of one capture form a capture set: ss_18102026_101500_m1.png,
+ss_18102026_101500_m2.png, ... for monitors, ..._t1, ..._t2, ... for
+tiles.  They share the capture time, so they are listed together.
+"""
+
+import re
+
+
+# "off" stores one image; "monitors" one file per monitor (a single
+# monitor stays whole); "tiles" a grid of columns x rows files
+SPLIT_MODES = ("off", "monitors", "tiles")
+
+DEFAULT_GRID = (2, 2)
+
+_SUFFIX = {"monitors": "m", "tiles": "t"}
+
+# <set>_m<n>.<ext> or <set>_t<n>.<ext>
+_PART = re.compile(r"^(?P<set>.+)_(?P<kind>[mt])(?P<index>\d+)\.[^.]+$")
+
+
+def check_split(mode, grid=DEFAULT_GRID):
+    """Raise ValueError unless mode and grid are usable"""
+    if mode not in SPLIT_MODES:
+        raise ValueError(f"Unknown split mode: {mode!r} (choose from {', '.join(SPLIT_MODES)})")
+    if len(grid) != 2 or min(grid) < 1:
+        raise ValueError(f"Tile grid must be two numbers of at least 1, not {grid!r}")
+
+
+def grid_boxes(size, grid=DEFAULT_GRID):
+    """columns x rows boxes covering size, left to right, top to bottom"""
+    width, height = size
+    columns, rows = grid
+    xs = [width * i // columns for i in range(columns + 1)]
+    ys = [height * i // rows for i in range(rows + 1)]
+    return [(xs[col], ys[row], xs[col + 1], ys[row + 1])
+            for row in range(rows) for col in range(columns)
+            if xs[col + 1] > xs[col] and ys[row + 1] > ys[row]]
+
+
+def split_boxes(size, monitors, mode, grid=DEFAULT_GRID):
+    """Boxes to cut a frame of size into, or None to keep it whole
+
+    monitors are the monitor boxes in frame coordinates (see
+    CaptureBackend.monitors()); parts outside the frame are dropped.
+    """
+    if mode == "monitors":
+        boxes = []
+        for left, top, right, bottom in monitors:
+            left, top = max(left, 0), max(top, 0)
+            right, bottom = min(right, size[0]), min(bottom, size[1])
+            if right > left and bottom > top:
+                boxes.append((left, top, right, bottom))
+        # Left to right, top to bottom
+        boxes.sort(key=lambda box: (box[1], box[0]))
+    elif mode == "tiles":
+        boxes = grid_boxes(size, grid)
+    else:
+        return None
+    return boxes if len(boxes) > 1 else None
+
+
+def part_suffixes(mode, count):
+    """File name suffixes of the count parts of a split capture"""
+    return [f"_{_SUFFIX[mode]}{i}" for i in range(1, count + 1)]
+
+
+def capture_set(name):
+    """Name of the capture set file name belongs to, or None"""
+    match = _PART.match(name)
+    return match.group("set") if match else None
+
+
+def part_index(name):
+    """1-based position of name in its capture set, or None"""
+    match = _PART.match(name)
+    return int(match.group("index")) if match else None
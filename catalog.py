@@ -0,0 +1,420 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+===========================================================
+    Project Name : Screen Shot Manager
+    File Name    : catalog.py
+    Author       : Vignesh Kumar B
+    Created On   : 2026-10-18
+    Description  : Screenshot metadata catalog (SQLite)
+===========================================================
+"""
+
+import bisect
+import os
+import re
+import sqlite3
+import threading
+from datetime import datetime
+
+from delta_store import is_delta, open_screenshot
+from ocr_cache import content_hash
+
+
+# Sort keys offered by the file list -> catalog column.  Each column has
+# an index on (column, name), so every order is an index scan.
+SORT_COLUMNS = {
+    "captured": "captured_at",
+    "name": "name",
+    "size": "bytes",
+    "dimensions": "pixels",
+    "encoder": "encoder",
+    "hash": "content_hash",
+}
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS files (
+    name TEXT PRIMARY KEY,
+    captured_at REAL NOT NULL,
+    bytes INTEGER NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    width INTEGER,
+    height INTEGER,
+    pixels INTEGER,
+    content_hash TEXT,
+    encoder TEXT
+);
+""" + "".join(f"CREATE INDEX IF NOT EXISTS files_{column} ON files ({column}, name);\n"
+              for column in SORT_COLUMNS.values() if column != "name")
+
+# ss_DDMMYYYY_HHMMSS, also inside crop names (..._cropped_DDMMYYYY_HHMMSS)
+_TIMESTAMP = re.compile(r"(\d{8})_(\d{6})")
+
+
+def capture_time(name, fallback):
+    """Capture time of name as a Unix timestamp
+
+    Taken from the last timestamp in the file name (a crop saved as a new
+    file is dated when it was cropped); fallback (e.g. the mtime) for
+    names without one.
+    """
+    for date, time_of_day in reversed(_TIMESTAMP.findall(name)):
+        try:
+            return datetime(int(date[4:]), int(date[2:4]), int(date[:2]), int(time_of_day[:2]),
+                            int(time_of_day[2:4]), int(time_of_day[4:])).timestamp()
+        except ValueError:
+            continue
+    return fallback
+
+
+def detect_encoder(filepath, image):
+    """Best guess at how an existing file was stored
+
+    Captures made by the app record their encoder profile name; for other
+    files only the container is known ("png", "png-palette", "webp",
+    "delta").
+    """
+    if is_delta(filepath):
+        return "delta"
+    fmt = (image.format or os.path.splitext(filepath)[1].lstrip(".")).lower()
+    if fmt == "png" and image.mode == "P":
+        return "png-palette"
+    return fmt
+
+
+class Catalog:
+    """Capture time, dimensions, size, content hash and encoder per file
+
+    Rows are keyed by file name.  Capture time and size come from the
+    folder scan (cheap: name and stat data only); dimensions, hash and
+    encoder are recorded by the capture pipeline for new captures and
+    filled in for other files by CatalogScanner.  Safe to share between
+    the Tk thread and background threads.
+    """
+
+    def __init__(self, db_path):
+        self.db_path = db_path
+        self._lock = threading.RLock()
+        os.makedirs(os.path.dirname(db_path) or ".", exist_ok=True)
+        self._db = sqlite3.connect(db_path, timeout=10, check_same_thread=False)
+        with self._lock:
+            self._db.execute("PRAGMA journal_mode=WAL")
+            self._db.execute("PRAGMA synchronous=NORMAL")
+            self._db.executescript(_SCHEMA)
+            self._db.commit()
+
+    def __len__(self):
+        with self._lock:
+            return self._db.execute("SELECT COUNT(*) FROM files").fetchone()[0]
+
+    def get(self, name):
+        """Metadata of name as a dict, or None"""
+        with self._lock:
+            cursor = self._db.execute("SELECT * FROM files WHERE name = ?", (name,))
+            row = cursor.fetchone()
+            if row is None:
+                return None
+            return dict(zip((column[0] for column in cursor.description), row))
+
+    def record(self, filepath, captured_at, size, encoder, digest=None, st=None):
+        """Store everything about a file just written
+
+        size is (width, height).  Without digest the content hash is left
+        for the scanner (e.g. a lossy encoder changed the pixels).
+        """
+        st = st or os.stat(filepath)
+        width, height = size
+        with self._lock:
+            self._db.execute(
+                "INSERT OR REPLACE INTO files VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (os.path.basename(filepath), captured_at, st.st_size, st.st_mtime_ns,
+                 width, height, width * height, digest, encoder))
+            self._db.commit()
+
+    def record_link(self, filepath, captured_at, source):
+        """Store a file written as a link (or copy) of source"""
+        st = os.stat(filepath)
+        with self._lock:
+            self._db.execute(
+                "INSERT OR REPLACE INTO files "
+                "SELECT ?, ?, ?, ?, width, height, pixels, content_hash, encoder "
+                "FROM files WHERE name = ?",
+                (os.path.basename(filepath), captured_at, st.st_size, st.st_mtime_ns,
+                 os.path.basename(source)))
+            self._db.commit()
+
+    def sync(self, diff, entries, full=False):
+        """Bring the catalog in line with a FileIndex diff
+
+        entries are the FileIndex entries after the diff.  New and changed
+        files get a row (or keep theirs if its stat data still matches)
+        with the metadata left for the scanner; renamed files keep their
+        row, capture time included.  With full (after a complete folder
+        scan) rows of files that disappeared while the app was not running
+        are dropped as well.
+        """
+        with self._lock:
+            for old, new in diff.renamed:
+                self._db.execute("DELETE FROM files WHERE name = ?", (new,))
+                self._db.execute("UPDATE files SET name = ? WHERE name = ?", (new, old))
+            self._db.executemany("DELETE FROM files WHERE name = ?",
+                                 [(name,) for name in diff.removed])
+
+            names = diff.added + diff.changed
+            known = self._stat_rows(names)
+            inserts, updates = [], []
+            for name in names:
+                entry = entries[name]
+                if name not in known:
+                    inserts.append((name, capture_time(name, entry.mtime_ns / 1e9),
+                                    entry.size, entry.mtime_ns))
+                elif known[name] != (entry.mtime_ns, entry.size):
+                    updates.append((entry.size, entry.mtime_ns, name))
+            self._db.executemany(
+                "INSERT INTO files (name, captured_at, bytes, mtime_ns) VALUES (?, ?, ?, ?)",
+                inserts)
+            # Content changed (e.g. cropped): same capture, new pixels
+            self._db.executemany(
+                "UPDATE files SET bytes = ?, mtime_ns = ?, width = NULL, height = NULL, "
+                "pixels = NULL, content_hash = NULL, encoder = NULL WHERE name = ?", updates)
+
+            if full:
+                stale = [(name,) for name, in self._db.execute("SELECT name FROM files")
+                         if name not in entries]
+                self._db.executemany("DELETE FROM files WHERE name = ?", stale)
+            self._db.commit()
+
+    def unscanned(self, limit=100):
+        """Names whose dimensions/hash/encoder are not known yet"""
+        with self._lock:
+            return [name for name, in self._db.execute(
+                "SELECT name FROM files WHERE content_hash IS NULL LIMIT ?", (limit,))]
+
+    def keys(self, sort, names=None):
+        """[(sort value, name)] for names (default: every file), ascending
+
+        The order is that of an index scan over (column, name); missing
+        values (NULL) come first.
+        """
+        column = SORT_COLUMNS[sort]
+        order = column if column == "name" else f"{column}, name"
+        with self._lock:
+            if names is None:
+                return self._db.execute(
+                    f"SELECT {column}, name FROM files ORDER BY {order}").fetchall()
+            rows = []
+            names = list(names)
+            for i in range(0, len(names), 500):
+                chunk = names[i:i + 500]
+                rows += self._db.execute(
+                    f"SELECT {column}, name FROM files WHERE name IN "
+                    f"({', '.join('?' * len(chunk))})", chunk).fetchall()
+            return rows
+
+    def close(self):
+        with self._lock:
+            self._db.close()
+
+    def _stat_rows(self, names):
+        if len(names) > 5000:
+            # e.g. the first scan after a start: one pass over the table
+            wanted = set(names)
+            return {name: (mtime_ns, size) for name, mtime_ns, size in
+                    self._db.execute("SELECT name, mtime_ns, bytes FROM files")
+                    if name in wanted}
+        known = {}
+        for i in range(0, len(names), 500):
+            chunk = names[i:i + 500]
+            for name, mtime_ns, size in self._db.execute(
+                    f"SELECT name, mtime_ns, bytes FROM files WHERE name IN "
+                    f"({', '.join('?' * len(chunk))})", chunk):
+                known[name] = (mtime_ns, size)
+        return known
+
+
+def _sort_key(value, name):
+    # NULL first, as in SQLite; never compares None with a value
+    return (0, 0, name) if value is None else (1, value, name)
+
+
+class CatalogView:
+    """File names in catalog order; a drop-in source for VirtualListbox
+
+    The full order is read with one indexed query (reload); folder diffs
+    and scanned metadata then move single rows with bisect, so a new
+    capture does not re-read anything.  index_of() bisects too, so a
+    lookup right after a change costs O(log n), not a rebuild.
+    """
+
+    def __init__(self, catalog, sort="captured", descending=True):
+        self.catalog = catalog
+        self.sort = sort
+        self.descending = descending
+        self._keys = []  # ascending sort keys
+        self._key_of = {}
+        self.reload()
+
+    def __len__(self):
+        return len(self._keys)
+
+    def __getitem__(self, row):
+        if isinstance(row, slice):
+            return [self[i] for i in range(*row.indices(len(self)))]
+        if row < 0:
+            row += len(self)
+        if not 0 <= row < len(self):
+            raise IndexError(row)
+        if self.descending:
+            row = len(self._keys) - 1 - row
+        return self._keys[row][2]
+
+    def __contains__(self, name):
+        return name in self._key_of
+
+    def names(self):
+        """All names in display order"""
+        names = [key[2] for key in self._keys]
+        return names[::-1] if self.descending else names
+
+    def index_of(self, name):
+        """Row of name, or None when it is not listed"""
+        key = self._key_of.get(name)
+        if key is None:
+            return None
+        row = bisect.bisect_left(self._keys, key)
+        return len(self._keys) - 1 - row if self.descending else row
+
+    def set_sort(self, sort, descending):
+        if sort not in SORT_COLUMNS:
+            raise ValueError(f"Unknown sort key: {sort!r}")
+        self.sort, self.descending = sort, descending
+        self.reload()
+
+    def reload(self):
+        self._keys = [_sort_key(value, name) for value, name in self.catalog.keys(self.sort)]
+        self._key_of = {key[2]: key for key in self._keys}
+
+    def apply(self, diff):
+        """Follow a FileIndex diff (after Catalog.sync)"""
+        if len(diff.added) + len(diff.changed) > 1000:
+            # e.g. the first scan; one query beats thousands of inserts
+            self.reload()
+            return
+        for name in diff.removed:
+            self._remove(name)
+        self.update(diff.added + diff.changed)
+
+    def update(self, names):
+        """Re-read the sort value of names (new, changed or just scanned)"""
+        for value, name in self.catalog.keys(self.sort, names):
+            self._remove(name)
+            key = _sort_key(value, name)
+            bisect.insort(self._keys, key)
+            self._key_of[name] = key
+
+    def _remove(self, name):
+        key = self._key_of.pop(name, None)
+        if key is not None:
+            del self._keys[bisect.bisect_left(self._keys, key)]
+
+
+class CatalogScanner:
+    """Background thread that fills in the metadata of unscanned files
+
+    Decoding a screenshot for its hash is not free, so files are handled
+    one at a time with a short pause between them.  on_scanned(names)
+    runs on the scanner thread after each group of files.  A file that
+    changed since the last sync is left alone until the next wake().
+    """
+
+    def __init__(self, folder, catalog, pause=0.05, on_scanned=None):
+        self.folder = folder
+        self.catalog = catalog
+        self.pause = pause
+        self.on_scanned = on_scanned
+        self._wake = threading.Event()
+        self._woken = False
+        self._stopped = False
+        self._thread = None
+
+    def start(self):
+        self._thread = threading.Thread(target=self._run, daemon=True, name="catalog-scanner")
+        self._thread.start()
+
+    def wake(self):
+        """New files were added to the catalog (or changed rows reset)"""
+        self._woken = True
+        self._wake.set()
+
+    def stop(self):
+        self._stopped = True
+        self._wake.set()
+
+    def _run(self):
+        failed = set()
+        # Rewritten since the last sync: retried once a sync wakes us, not
+        # polled every pause
+        deferred = set()
+        while not self._stopped:
+            self._wake.clear()
+            if self._woken:
+                self._woken = False
+                deferred.clear()
+            skip = failed | deferred
+            names = [name for name in self.catalog.unscanned(limit=100 + len(skip))
+                     if name not in skip]
+            if not names:
+                self._wake.wait()
+                continue
+            scanned = []
+            for name in names[:25]:
+                if self._stopped:
+                    return
+                result = self._scan(name)
+                if result:
+                    scanned.append(name)
+                elif result is None:
+                    deferred.add(name)
+                else:
+                    failed.add(name)
+                self._wake.wait(self.pause)
+            if scanned and self.on_scanned:
+                self.on_scanned(scanned)
+
+    def scan_pending(self):
+        """Scan every unscanned file now, on the calling thread
+
+        For command line use, where no background thread is running.
+        Returns the names scanned.
+        """
+        scanned, skipped = [], set()
+        while True:
+            names = [name for name in self.catalog.unscanned(limit=100 + len(skipped))
+                     if name not in skipped]
+            if not names:
+                return scanned
+            for name in names:
+                if self._scan(name):
+                    scanned.append(name)
+                else:
+                    skipped.add(name)
+
+    def _scan(self, name):
+        """True when done, False when the file cannot be read, None to retry"""
+        filepath = os.path.join(self.folder, name)
+        try:
+            row = self.catalog.get(name)
+            if row is None:
+                return True
+            st = os.stat(filepath)
+            if (st.st_mtime_ns, st.st_size) != (row["mtime_ns"], row["bytes"]):
+                # Rewritten since the folder was scanned; the catalog row is
+                # reset by the next sync
+                return None
+            with open_screenshot(filepath) as image:
+                image.load()
+                self.catalog.record(filepath, row["captured_at"], image.size,
+                                    detect_encoder(filepath, image), content_hash(image), st)
+            return True
+        except Exception:
+            return False
@@ -0,0 +1,252 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+===========================================================
+    Project Name : Screen Shot Manager
+    File Name    : delta_store.py
+    Author       : Vignesh Kumar B
+    Created On   : 2026-10-18
+    Description  : Keyframe + changed-tile screenshot storage
+===========================================================
+
+A delta screenshot (.ssd) is a small zip holding manifest.json and
+tiles.png.  The manifest names a keyframe PNG in the keyframe folder and
+lists the tiles that differ from it; tiles.png packs those tiles into an
+atlas.  Keyframes live outside the screenshot list, so deleting any
+listed entry never breaks another one.
+"""
+
+import io
+import json
+import math
+import os
+import threading
+import time
+import zipfile
+
+from PIL import Image, ImageChops
+
+from encoders import DELTA_EXTENSION, atomic_save, file_mode, get_profile
+
+
+FORMAT_VERSION = 1
+TILE_SIZE = 64
+
+
+def is_delta(filepath):
+    return filepath.lower().endswith(DELTA_EXTENSION)
+
+
+def read_manifest(filepath):
+    with zipfile.ZipFile(filepath) as archive:
+        return json.loads(archive.read("manifest.json"))
+
+
+def open_screenshot(filepath):
+    """Open any screenshot as a PIL image, rebuilding delta entries"""
+    if not is_delta(filepath):
+        return Image.open(filepath)
+
+    with zipfile.ZipFile(filepath) as archive:
+        manifest = json.loads(archive.read("manifest.json"))
+        atlas_data = archive.read("tiles.png") if manifest["tiles"] else None
+
+    keyframe_path = os.path.join(os.path.dirname(os.path.abspath(filepath)),
+                                 manifest["keyframe_dir"], manifest["keyframe"])
+    image = Image.open(keyframe_path)
+    image.load()
+    if atlas_data is None:
+        return image
+
+    image = image.copy()
+    atlas = Image.open(io.BytesIO(atlas_data))
+    tile = manifest["tile"]
+    per_row = manifest["atlas_columns"]
+    for i, (col, row) in enumerate(manifest["tiles"]):
+        ax, ay = (i % per_row) * tile, (i // per_row) * tile
+        image.paste(atlas.crop((ax, ay, ax + tile, ay + tile)), (col * tile, row * tile))
+    return image
+
+
+def screenshot_size(filepath):
+    """(width, height) of any screenshot without decoding pixels"""
+    if is_delta(filepath):
+        return tuple(read_manifest(filepath)["size"])
+    with Image.open(filepath) as image:
+        return image.size
+
+
+def export_png(filepath, dest=None):
+    """Write any screenshot out as a normal PNG; returns the PNG path"""
+    if dest is None:
+        dest = os.path.splitext(filepath)[0] + ".png"
+    atomic_save(open_screenshot(filepath), dest, "PNG")
+    return dest
+
+
+def changed_tiles(keyframe, image, tile=TILE_SIZE):
+    """(col, row) of every tile where image differs from keyframe
+
+    Done with whole-image operations in C: per-pixel max channel
+    difference, binarise, then two box reductions whose non-zero cells
+    mark tiles with at least one changed pixel.
+    """
+    diff = ImageChops.difference(keyframe, image)
+    bands = diff.split()
+    changed = bands[0]
+    for band in bands[1:]:
+        changed = ImageChops.lighter(changed, band)
+
+    step = int(math.isqrt(tile))
+    if step * step != tile:
+        raise ValueError("tile size must be a perfect square (e.g. 64)")
+    mask = changed.point(lambda v: 255 if v else 0)
+    mask = mask.reduce(step).point(lambda v: 255 if v else 0).reduce(step)
+
+    data = mask.tobytes()
+    width = mask.width
+    return [(i % width, i // width) for i, value in enumerate(data) if value]
+
+
+class DeltaStore:
+    """Encoder that stores frames as changed tiles against a keyframe
+
+    Has the same save(image, filepath) / ext interface as an
+    EncoderProfile, so the capture pipeline can use it directly.  A new
+    keyframe is started when the frame size changes, when more than
+    max_changed of the tiles differ, or after max_deltas frames.
+    """
+
+    name = "delta"
+    label = "Keyframe + delta tiles"
+    ext = DELTA_EXTENSION
+    lossless = True
+
+    def __init__(self, keyframe_dir, tile=TILE_SIZE, max_changed=0.5, max_deltas=100):
+        self.keyframe_dir = keyframe_dir
+        self.tile = tile
+        self.max_changed = max_changed
+        self.max_deltas = max_deltas
+        self.keyframe_encoder = get_profile("png-fast")
+        self.tile_encoder = get_profile("png-fast")
+
+        self._keyframe = None
+        self._keyframe_name = None
+        self._deltas = 0
+        self._counter = 0
+        self._lock = threading.Lock()
+        os.makedirs(keyframe_dir, exist_ok=True)
+
+    def save(self, image, filepath):
+        """Store image at filepath as a delta against the current keyframe"""
+        image = self._normalise(image)
+        with self._lock:
+            tiles = None
+            keyframe = self._keyframe
+            if keyframe is not None and keyframe.size == image.size and \
+                    keyframe.mode == image.mode and self._deltas < self.max_deltas:
+                tiles = changed_tiles(keyframe, image, self.tile)
+                total = math.ceil(image.width / self.tile) * math.ceil(image.height / self.tile)
+                if len(tiles) > total * self.max_changed:
+                    tiles = None
+
+            if tiles is None:
+                self._keyframe_name = self._write_keyframe(image)
+                self._keyframe = image
+                self._deltas = 0
+                tiles = []
+            else:
+                self._deltas += 1
+            keyframe_name = self._keyframe_name
+
+        self._write_delta(image, filepath, keyframe_name, tiles)
+
+    def save_keyframe(self, image, filepath):
+        """Store image as its own keyframe without changing the current one
+
+        Used when an entry is rewritten outside the capture sequence,
+        e.g. by a crop.
+        """
+        image = self._normalise(image)
+        with self._lock:
+            keyframe_name = self._write_keyframe(image)
+        self._write_delta(image, filepath, keyframe_name, [])
+
+    def prune_keyframes(self, folder):
+        """Delete keyframes no delta entry in folder refers to any more"""
+        started = time.time()
+        with self._lock:
+            referenced = {self._keyframe_name}
+        try:
+            with os.scandir(folder) as it:
+                for entry in it:
+                    if is_delta(entry.name):
+                        try:
+                            referenced.add(read_manifest(entry.path)["keyframe"])
+                        except (OSError, KeyError, ValueError, zipfile.BadZipFile):
+                            continue
+            with os.scandir(self.keyframe_dir) as it:
+                for entry in it:
+                    # Keyframes started while scanning may not be referenced yet
+                    if entry.name.endswith(".png") and entry.name not in referenced and \
+                            entry.stat().st_mtime < started - 1:
+                        os.remove(entry.path)
+        except OSError:
+            pass
+
+    def _normalise(self, image):
+        if image.mode not in ("RGB", "RGBA"):
+            image = image.convert("RGBA" if "A" in image.getbands() else "RGB")
+        return image
+
+    def _write_keyframe(self, image):
+        self._counter += 1
+        name = f"kf_{time.strftime('%Y%m%d_%H%M%S')}_{os.getpid()}_{self._counter}.png"
+        self.keyframe_encoder.save(image, os.path.join(self.keyframe_dir, name))
+        return name
+
+    def _write_delta(self, image, filepath, keyframe_name, tiles):
+        tile = self.tile
+        columns = max(1, math.ceil(math.sqrt(len(tiles))))
+        manifest = {
+            "version": FORMAT_VERSION,
+            "keyframe": keyframe_name,
+            "keyframe_dir": os.path.relpath(self.keyframe_dir,
+                                            os.path.dirname(os.path.abspath(filepath))),
+            "size": list(image.size),
+            "mode": image.mode,
+            "tile": tile,
+            "atlas_columns": columns,
+            "tiles": [list(t) for t in tiles],
+        }
+
+        buffer = io.BytesIO()
+        with zipfile.ZipFile(buffer, "w", zipfile.ZIP_STORED) as archive:
+            archive.writestr("manifest.json", json.dumps(manifest))
+            if tiles:
+                rows = math.ceil(len(tiles) / columns)
+                atlas = Image.new(image.mode, (columns * tile, rows * tile))
+                for i, (col, row) in enumerate(tiles):
+                    box = (col * tile, row * tile, (col + 1) * tile, (row + 1) * tile)
+                    atlas.paste(image.crop(box), ((i % columns) * tile, (i // columns) * tile))
+                tile_data = io.BytesIO()
+                self.tile_encoder.encode(atlas, tile_data)
+                archive.writestr("tiles.png", tile_data.getvalue())
+
+        _write_bytes_atomic(filepath, buffer.getvalue())
+
+
+def _write_bytes_atomic(filepath, data):
+    tmp_path = os.path.join(os.path.dirname(filepath) or ".",
+                            f".{os.path.basename(filepath)}.{threading.get_ident()}.tmp")
+    try:
+        with open(tmp_path, "wb") as handle:
+            handle.write(data)
+        os.chmod(tmp_path, file_mode(filepath))
+        os.replace(tmp_path, filepath)
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
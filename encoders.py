@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+===========================================================
+    Project Name : Screen Shot Manager
+    File Name    : encoders.py
+    Author       : Vignesh Kumar B
+    Created On   : 2026-10-18
+    Description  : Screenshot storage encoder profiles
+===========================================================
+"""
+
+import os
+import stat
+import tempfile
+
+from PIL import Image
+
+
+# Read once at import: os.umask can only be read by setting it, which is
+# not safe while other threads create files
+_UMASK = os.umask(0o022)
+os.umask(_UMASK)
+
+
+def file_mode(filepath):
+    """Permission bits for a file written to filepath: those of the file
+    it replaces, else what a plain open() would give (0666 & ~umask)"""
+    try:
+        return stat.S_IMODE(os.stat(filepath).st_mode)
+    except OSError:
+        return 0o666 & ~_UMASK
+
+
+def atomic_save(image, filepath, fmt=None, **params):
+    """Save image through a temp file and rename it into place
+
+    Readers (the file list, watchers, other tools) never see a
+    half-written file, and an existing file is only replaced once the
+    new data is completely on disk.  fmt defaults to the format implied
+    by the file extension.  The file gets the permissions of the one it
+    replaces (mkstemp alone would leave it owner-only).
+    """
+    if fmt is None:
+        fmt = Image.registered_extensions()[os.path.splitext(filepath)[1].lower()]
+    folder = os.path.dirname(filepath) or "."
+    fd, tmp_path = tempfile.mkstemp(dir=folder, prefix=".", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as handle:
+            image.save(handle, fmt, **params)
+        os.chmod(tmp_path, file_mode(filepath))
+        os.replace(tmp_path, filepath)
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+def quantize_palette(image):
+    """Reduce to a 256-colour palette; exact for flat UI screenshots"""
+    if image.mode not in ("RGB", "RGBA"):
+        image = image.convert("RGBA" if "A" in image.getbands() else "RGB")
+    return image.quantize(colors=256, method=Image.Quantize.FASTOCTREE)
+
+
+class EncoderProfile:
+    """How a screenshot is written: container, extension and settings"""
+
+    def __init__(self, name, label, fmt, ext, params=None, prepare=None, lossless=True):
+        self.name = name
+        self.label = label
+        self.fmt = fmt
+        self.ext = ext
+        self.params = params or {}
+        self.prepare = prepare
+        self.lossless = lossless
+
+    def save(self, image, filepath):
+        """Encode image to filepath (atomically)"""
+        if self.prepare is not None:
+            image = self.prepare(image)
+        atomic_save(image, filepath, self.fmt, **self.params)
+
+    def encode(self, image, handle):
+        """Encode image to an open binary file object"""
+        if self.prepare is not None:
+            image = self.prepare(image)
+        image.save(handle, self.fmt, **self.params)
+
+
+ENCODER_PROFILES = {
+    profile.name: profile for profile in (
+        EncoderProfile("png", "PNG (Pillow default)", "PNG", ".png"),
+        EncoderProfile("png-fast", "Fast PNG", "PNG", ".png", {"compress_level": 1}),
+        EncoderProfile("png-max", "Max-compression PNG", "PNG", ".png",
+                       {"optimize": True}),
+        EncoderProfile("webp-lossless", "Lossless WebP", "WEBP", ".webp",
+                       {"lossless": True, "quality": 50, "method": 4}),
+        EncoderProfile("png-palette", "Palette PNG (flat UI shots)", "PNG", ".png",
+                       {"compress_level": 6}, prepare=quantize_palette, lossless=False),
+    )
+}
+
+DEFAULT_PROFILE = "png-fast"
+
+# Keyframe + delta entries written by delta_store.DeltaStore
+DELTA_EXTENSION = ".ssd"
+
+# Every extension the app stores screenshots under
+SCREENSHOT_EXTENSIONS = tuple(sorted({profile.ext for profile in ENCODER_PROFILES.values()} |
+                                     {DELTA_EXTENSION}))
+
+
+def get_profile(name):
+    """Look up an encoder profile by name"""
+    try:
+        return ENCODER_PROFILES[name]
+    except KeyError:
+        raise ValueError(f"Unknown encoder profile: {name!r} "
+                         f"(choose from {', '.join(ENCODER_PROFILES)})") from None
+
+
+def profile_for_path(filepath, preferred=DEFAULT_PROFILE):
+    """Lossless profile to use when rewriting an existing file in place"""
+    ext = os.path.splitext(filepath)[1].lower()
+    profile = ENCODER_PROFILES.get(preferred)
+    if profile is not None and profile.ext == ext and profile.lossless:
+        return profile
+    for profile in ENCODER_PROFILES.values():
+        if profile.ext == ext and profile.lossless:
+            return profile
+    return None
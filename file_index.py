@@ -0,0 +1,191 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+===========================================================
+    Project Name : Screen Shot Manager
+    File Name    : file_index.py
+    Author       : Vignesh Kumar B
+    Created On   : 2026-10-18
+    Description  : Incremental index of the screenshot folder
+===========================================================
+"""
+
+import bisect
+import os
+
+
+class FileEntry:
+    """A screenshot file and the stat fields used to spot changes"""
+
+    __slots__ = ("name", "mtime_ns", "size", "ino", "dev")
+
+    def __init__(self, name, mtime_ns, size, ino=0, dev=0):
+        self.name = name
+        self.mtime_ns = mtime_ns
+        self.size = size
+        self.ino = ino
+        self.dev = dev
+
+    @classmethod
+    def from_stat(cls, name, st):
+        return cls(name, st.st_mtime_ns, st.st_size, st.st_ino, st.st_dev)
+
+    def signature(self):
+        return (self.mtime_ns, self.size)
+
+    def identity(self):
+        """(inode, device), or None where the platform does not report
+        it (st_ino is 0 for os.scandir entries on Windows)"""
+        return (self.ino, self.dev) if self.ino else None
+
+    def same_file(self, other):
+        """Could other be this file under another name?
+
+        Equal size and mtime alone also match a copy made with copy2 (or
+        any other file that happens to share them); the inode tells those
+        apart where it is known.
+        """
+        if self.signature() != other.signature():
+            return False
+        identity, other_identity = self.identity(), other.identity()
+        return identity is None or other_identity is None or identity == other_identity
+
+
+class IndexDiff:
+    """What changed in the index since the previous update
+
+    removed_rows are row numbers before the update, highest first;
+    added_rows are row numbers after it, lowest first.  Deleting the
+    former and then inserting the latter turns the old listing into the
+    new one.
+    """
+
+    def __init__(self):
+        self.added = []
+        self.removed = []
+        self.changed = []
+        self.renamed = []
+        self.removed_rows = []
+        self.added_rows = []
+
+    def __bool__(self):
+        return bool(self.added or self.removed or self.changed)
+
+
+class FileIndex:
+    """In-process index of screenshot files, in reverse name order
+
+    Built with os.scandir so each entry keeps its stat data, updated
+    incrementally, and able to answer "which row is this name" in
+    O(log n) by bisecting the sorted names, with no table to rebuild.
+    Its diffs feed the metadata catalog, which orders the file list by
+    capture time (see catalog.CatalogView).
+    """
+
+    def __init__(self, folder, extensions=(".png",)):
+        self.folder = folder
+        self.extensions = tuple(extensions)
+        self.entries = {}
+        self._ascending = []
+
+    def __len__(self):
+        return len(self._ascending)
+
+    def __getitem__(self, row):
+        """Name shown at row (rows are in reverse name order)"""
+        if isinstance(row, slice):
+            return [self[i] for i in range(*row.indices(len(self)))]
+        if row < 0:
+            row += len(self)
+        if not 0 <= row < len(self):
+            raise IndexError(row)
+        return self._ascending[len(self._ascending) - 1 - row]
+
+    def __contains__(self, name):
+        return name in self.entries
+
+    def names(self):
+        """All names in display order"""
+        return self._ascending[::-1]
+
+    def index_of(self, name):
+        """Row of name, or None when it is not indexed"""
+        if name not in self.entries:
+            return None
+        return len(self._ascending) - 1 - bisect.bisect_left(self._ascending, name)
+
+    def is_screenshot(self, name):
+        return name.lower().endswith(self.extensions) and not name.startswith(".")
+
+    def scan(self):
+        """Rescan the whole folder and return the difference"""
+        current = {}
+        with os.scandir(self.folder) as it:
+            for dir_entry in it:
+                if not self.is_screenshot(dir_entry.name):
+                    continue
+                try:
+                    if not dir_entry.is_file():
+                        continue
+                    st = dir_entry.stat()
+                except OSError:
+                    continue
+                current[dir_entry.name] = FileEntry.from_stat(dir_entry.name, st)
+
+        names = set(current) | set(self.entries)
+        return self._apply(current, names)
+
+    def update_names(self, names):
+        """Re-stat only the given names and return the difference"""
+        current = {}
+        for name in names:
+            if not self.is_screenshot(name):
+                continue
+            try:
+                st = os.stat(os.path.join(self.folder, name))
+            except OSError:
+                continue
+            current[name] = FileEntry.from_stat(name, st)
+        return self._apply(current, set(names))
+
+    def _apply(self, current, names):
+        diff = IndexDiff()
+        old_rows = {}
+        for name in names:
+            old = self.entries.get(name)
+            new = current.get(name)
+            if old is None and new is not None:
+                diff.added.append(name)
+            elif old is not None and new is None:
+                diff.removed.append(name)
+                old_rows[name] = self.index_of(name)
+            elif old is not None and old.signature() != new.signature():
+                diff.changed.append(name)
+
+        if not diff:
+            return diff
+
+        # A removed and an added name that are the same file (identical
+        # stat data and inode) is a rename
+        removed_by_sig = {}
+        for name in diff.removed:
+            removed_by_sig.setdefault(self.entries[name].signature(), []).append(name)
+        for name in diff.added:
+            entry = current[name]
+            candidates = removed_by_sig.get(entry.signature(), [])
+            for i, old in enumerate(candidates):
+                if self.entries[old].same_file(entry):
+                    diff.renamed.append((candidates.pop(i), name))
+                    break
+
+        for name in diff.removed:
+            del self.entries[name]
+            del self._ascending[bisect.bisect_left(self._ascending, name)]
+        for name in diff.added:
+            bisect.insort(self._ascending, name)
+        for name in diff.added + diff.changed:
+            self.entries[name] = current[name]
+
+        diff.removed_rows = sorted(old_rows.values(), reverse=True)
+        diff.added_rows = sorted(self.index_of(name) for name in diff.added)
+        return diff
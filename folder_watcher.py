@@ -0,0 +1,260 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+===========================================================
+    Project Name : Screen Shot Manager
+    File Name    : folder_watcher.py
+    Author       : Vignesh Kumar B
+    Created On   : 2026-10-18
+    Description  : Screenshot folder change watcher
+===========================================================
+"""
+
+import ctypes
+import ctypes.util
+import os
+import select
+import struct
+import sys
+import threading
+import time
+
+
+# inotify(7) constants
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_DELETE_SELF = 0x00000400
+IN_MOVE_SELF = 0x00000800
+IN_Q_OVERFLOW = 0x00004000
+IN_CLOEXEC = 0o2000000
+
+INOTIFY_MASK = (IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE |
+                IN_DELETE | IN_DELETE_SELF | IN_MOVE_SELF)
+INOTIFY_EVENT = struct.Struct("iIII")
+
+
+class FolderWatcher:
+    """Reports changed file names in a folder, debounced and coalesced
+
+    on_change(names, rescan) receives the set of names that changed since
+    the last call; rescan is True when events were lost and the caller
+    should rescan the folder instead.  Calls are handed to deliver(fn),
+    the app's UI queue (ScreenshotApp.post), so a burst of hundreds of
+    files becomes a single update on the Tk thread.
+
+    Uses inotify on Linux, ReadDirectoryChangesW on Windows and falls
+    back to polling with os.scandir everywhere else.
+    """
+
+    def __init__(self, folder, on_change, deliver=None, accept=None,
+                 debounce=0.25, max_delay=1.0, poll_interval=2.0, backend="auto"):
+        self.folder = folder
+        self.on_change = on_change
+        self.deliver = deliver or (lambda fn: fn())
+        self.accept = accept or (lambda name: True)
+        self.debounce = debounce
+        self.max_delay = max_delay
+        self.poll_interval = poll_interval
+        self.backend = self._choose_backend(backend)
+
+        self._pending = set()
+        self._rescan = False
+        self._first_event = None
+        self._last_event = None
+        self._cond = threading.Condition()
+        self._stopped = threading.Event()
+        self._threads = []
+        self._wake_fds = None
+
+    def start(self):
+        """Start watching in background threads"""
+        reader = {
+            "inotify": self._run_inotify,
+            "windows": self._run_windows,
+            "polling": self._run_polling,
+        }[self.backend]
+        if self.backend == "inotify":
+            self._wake_fds = os.pipe()
+        for target, name in ((reader, "folder-watcher"), (self._run_flusher, "folder-watcher-flush")):
+            thread = threading.Thread(target=target, daemon=True, name=name)
+            thread.start()
+            self._threads.append(thread)
+
+    def stop(self):
+        """Stop watching; pending events are discarded"""
+        self._stopped.set()
+        with self._cond:
+            self._cond.notify_all()
+        with self._cond:
+            if self._wake_fds:
+                try:
+                    os.write(self._wake_fds[1], b"x")
+                except OSError:
+                    pass
+
+    def _choose_backend(self, backend):
+        if backend != "auto":
+            return backend
+        if sys.platform.startswith("linux") and _load_libc() is not None:
+            return "inotify"
+        if sys.platform == "win32":
+            try:
+                import win32file  # noqa: F401
+                return "windows"
+            except ImportError:
+                pass
+        return "polling"
+
+    # Event coalescing
+
+    def _record(self, names=(), rescan=False):
+        names = {name for name in names if self.accept(name)}
+        if not names and not rescan:
+            return
+        with self._cond:
+            now = time.monotonic()
+            if self._first_event is None:
+                self._first_event = now
+            self._last_event = now
+            self._pending.update(names)
+            self._rescan = self._rescan or rescan
+            self._cond.notify_all()
+
+    def _run_flusher(self):
+        while not self._stopped.is_set():
+            with self._cond:
+                while self._first_event is None and not self._stopped.is_set():
+                    self._cond.wait()
+                if self._stopped.is_set():
+                    return
+
+                # Wait for a quiet period, but never longer than max_delay
+                now = time.monotonic()
+                due = min(self._last_event + self.debounce,
+                          self._first_event + self.max_delay)
+                if now < due:
+                    self._cond.wait(due - now)
+                    continue
+
+                names, rescan = self._pending, self._rescan
+                self._pending, self._rescan = set(), False
+                self._first_event = self._last_event = None
+
+            self.deliver(lambda: self.on_change(names, rescan))
+
+    # Backends
+
+    def _run_inotify(self):
+        libc = _load_libc()
+        fd = libc.inotify_init1(IN_CLOEXEC)
+        if fd < 0:
+            self._fallback_to_polling()
+            return
+        wd = libc.inotify_add_watch(fd, os.fsencode(self.folder), INOTIFY_MASK)
+        if wd < 0:
+            os.close(fd)
+            self._fallback_to_polling()
+            return
+
+        wake_r = self._wake_fds[0]
+        try:
+            while not self._stopped.is_set():
+                ready, _, _ = select.select([fd, wake_r], [], [])
+                if wake_r in ready:
+                    break
+                data = os.read(fd, 64 * 1024)
+                names, rescan = set(), False
+                offset = 0
+                while offset < len(data):
+                    _, mask, _, length = INOTIFY_EVENT.unpack_from(data, offset)
+                    offset += INOTIFY_EVENT.size
+                    name = data[offset:offset + length].rstrip(b"\0")
+                    offset += length
+                    if mask & (IN_Q_OVERFLOW | IN_DELETE_SELF | IN_MOVE_SELF):
+                        rescan = True
+                    elif name:
+                        names.add(os.fsdecode(name))
+                self._record(names, rescan)
+        finally:
+            os.close(fd)
+            self._close_wake_fds()
+
+    def _run_windows(self):
+        import pywintypes
+        import win32con
+        import win32file
+
+        try:
+            handle = win32file.CreateFile(
+                self.folder, 0x0001,  # FILE_LIST_DIRECTORY
+                win32con.FILE_SHARE_READ | win32con.FILE_SHARE_WRITE | win32con.FILE_SHARE_DELETE,
+                None, win32con.OPEN_EXISTING, win32con.FILE_FLAG_BACKUP_SEMANTICS, None)
+        except pywintypes.error:
+            self._fallback_to_polling()
+            return
+
+        flags = (win32con.FILE_NOTIFY_CHANGE_FILE_NAME |
+                 win32con.FILE_NOTIFY_CHANGE_SIZE |
+                 win32con.FILE_NOTIFY_CHANGE_LAST_WRITE)
+        try:
+            while not self._stopped.is_set():
+                results = win32file.ReadDirectoryChangesW(handle, 64 * 1024, False, flags, None, None)
+                # An empty result means the buffer overflowed
+                self._record((name for _, name in results), rescan=not results)
+        except pywintypes.error:
+            if not self._stopped.is_set():
+                self._record(rescan=True)
+        finally:
+            handle.Close()
+
+    def _run_polling(self):
+        snapshot = self._snapshot()
+        while not self._stopped.wait(self.poll_interval):
+            current = self._snapshot()
+            changed = {name for name in snapshot.keys() | current.keys()
+                       if snapshot.get(name) != current.get(name)}
+            snapshot = current
+            self._record(changed)
+
+    def _fallback_to_polling(self):
+        self.backend = "polling"
+        # Polling wakes on _stopped; the inotify wake pipe is not needed
+        self._close_wake_fds()
+        self._run_polling()
+
+    def _close_wake_fds(self):
+        # Under _cond so stop() never writes to a closed (or reused) fd
+        with self._cond:
+            wake_fds, self._wake_fds = self._wake_fds, None
+        for wake_fd in wake_fds or ():
+            os.close(wake_fd)
+
+    def _snapshot(self):
+        snapshot = {}
+        try:
+            with os.scandir(self.folder) as it:
+                for entry in it:
+                    if not self.accept(entry.name):
+                        continue
+                    try:
+                        st = entry.stat()
+                    except OSError:
+                        continue
+                    snapshot[entry.name] = (st.st_mtime_ns, st.st_size)
+        except OSError:
+            pass
+        return snapshot
+
+
+def _load_libc():
+    """libc with the inotify calls, or None when unavailable"""
+    try:
+        libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+        libc.inotify_init1
+        libc.inotify_add_watch
+    except (OSError, AttributeError):
+        return None
+    return libc
@@ -0,0 +1,161 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+===========================================================
+    Project Name : Screen Shot Manager
+    File Name    : ocr_cache.py
+    Author       : Vignesh Kumar B
+    Created On   : 2026-10-18
+    Description  : Persistent OCR result cache (SQLite)
+===========================================================
+"""
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+
+
+# Total size of cached OCR text before LRU eviction kicks in
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS texts (
+    content_hash TEXT NOT NULL,
+    settings_key TEXT NOT NULL,
+    text TEXT NOT NULL,
+    bytes INTEGER NOT NULL,
+    last_used REAL NOT NULL,
+    PRIMARY KEY (content_hash, settings_key)
+);
+CREATE INDEX IF NOT EXISTS texts_last_used ON texts (last_used);
+CREATE TABLE IF NOT EXISTS files (
+    path TEXT PRIMARY KEY,
+    mtime_ns INTEGER NOT NULL,
+    size INTEGER NOT NULL,
+    content_hash TEXT NOT NULL
+);
+"""
+
+
+def content_hash(image):
+    """Hash of the decoded pixels; equal for equal images in any container"""
+    digest = hashlib.sha1(f"{image.mode}|{image.width}x{image.height}|".encode("ascii"))
+    digest.update(image.tobytes())
+    return digest.hexdigest()
+
+
+def settings_key(settings):
+    """Stable key for a dict of OCR settings (language, config, ...)"""
+    return hashlib.sha1(json.dumps(settings, sort_keys=True).encode("utf-8")).hexdigest()[:16]
+
+
+class OcrCache:
+    """OCR text keyed by pixel content hash and OCR settings
+
+    A second table remembers the content hash of each file by path, mtime
+    and size, so a repeat lookup of an unchanged file needs no decode at
+    all.  A file that is overwritten (e.g. by a crop) no longer matches
+    its row and is hashed again; renamed or hard-linked copies still hit
+    by content.  Several processes may read the database at once (the OCR
+    workers do), but only the owning process should store and evict.
+    """
+
+    def __init__(self, db_path, max_bytes=DEFAULT_MAX_BYTES):
+        self.db_path = db_path
+        self.max_bytes = max_bytes
+        self._lock = threading.RLock()
+
+        os.makedirs(os.path.dirname(db_path) or ".", exist_ok=True)
+        self._db = sqlite3.connect(db_path, timeout=10, check_same_thread=False)
+        with self._lock:
+            self._db.execute("PRAGMA journal_mode=WAL")
+            self._db.execute("PRAGMA synchronous=NORMAL")
+            self._db.executescript(_SCHEMA)
+            self._db.commit()
+            # Running size of texts, kept in step by store() and _evict()
+            # so a store does not sum the whole table
+            self._total_bytes = self._db.execute(
+                "SELECT COALESCE(SUM(bytes), 0) FROM texts").fetchone()[0]
+
+    def lookup_file(self, filepath, key):
+        """Cached text of filepath if it is unchanged since it was stored"""
+        try:
+            st = os.stat(filepath)
+        except OSError:
+            return None
+        with self._lock:
+            row = self._db.execute(
+                "SELECT content_hash FROM files WHERE path = ? AND mtime_ns = ? AND size = ?",
+                (os.path.abspath(filepath), st.st_mtime_ns, st.st_size)).fetchone()
+        return None if row is None else self.lookup_content(row[0], key)
+
+    def lookup_content(self, digest, key):
+        """Cached text for pixel content digest, or None"""
+        with self._lock:
+            row = self._db.execute(
+                "SELECT text FROM texts WHERE content_hash = ? AND settings_key = ?",
+                (digest, key)).fetchone()
+            if row is None:
+                return None
+            try:
+                self._db.execute(
+                    "UPDATE texts SET last_used = ? WHERE content_hash = ? AND settings_key = ?",
+                    (time.time(), digest, key))
+                self._db.commit()
+            except sqlite3.OperationalError:
+                # Read-only use from a worker while the owner writes
+                self._db.rollback()
+            return row[0]
+
+    def store(self, filepath, mtime_ns, size, digest, key, text):
+        """Remember text for digest and that filepath (at mtime/size) has it"""
+        data = text.encode("utf-8")
+        with self._lock:
+            row = self._db.execute(
+                "SELECT bytes FROM texts WHERE content_hash = ? AND settings_key = ?",
+                (digest, key)).fetchone()
+            self._db.execute(
+                "INSERT OR REPLACE INTO texts VALUES (?, ?, ?, ?, ?)",
+                (digest, key, text, len(data), time.time()))
+            self._total_bytes += len(data) - (row[0] if row else 0)
+            self._db.execute(
+                "INSERT OR REPLACE INTO files VALUES (?, ?, ?, ?)",
+                (os.path.abspath(filepath), mtime_ns, size, digest))
+            self._evict()
+            self._db.commit()
+
+    def invalidate(self, filepath):
+        """Forget the content hash of filepath (its text stays for copies)"""
+        with self._lock:
+            self._db.execute("DELETE FROM files WHERE path = ?", (os.path.abspath(filepath),))
+            self._db.commit()
+
+    def stats(self):
+        """(entries, total text bytes)"""
+        with self._lock:
+            count, total = self._db.execute(
+                "SELECT COUNT(*), COALESCE(SUM(bytes), 0) FROM texts").fetchone()
+        return count, total
+
+    def close(self):
+        with self._lock:
+            self._db.close()
+
+    def _evict(self):
+        total = self._total_bytes
+        if total <= self.max_bytes:
+            return
+        # Oldest first until back under the cap
+        doomed = []
+        for rowid, size in self._db.execute("SELECT rowid, bytes FROM texts ORDER BY last_used"):
+            if total <= self.max_bytes:
+                break
+            doomed.append((rowid,))
+            total -= size
+        self._db.executemany("DELETE FROM texts WHERE rowid = ?", doomed)
+        self._total_bytes = total
+        self._db.execute(
+            "DELETE FROM files WHERE content_hash NOT IN (SELECT content_hash FROM texts)")
@@ -0,0 +1,194 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+===========================================================
+    Project Name : Screen Shot Manager
+    File Name    : ocr_indexer.py
+    Author       : Vignesh Kumar B
+    Created On   : 2026-10-18
+    Description  : Background OCR indexing of the screenshot folder
+===========================================================
+"""
+
+import json
+import os
+import threading
+import time
+from collections import deque
+
+from ocr_pool import OcrPool, TesseractMissingError
+
+
+class OcrIndexer:
+    """Low-priority thread that OCRs every screenshot into the search index
+
+    New captures (enqueue) are handled before the backlog of older files,
+    newest first.  Progress survives a restart: the search index itself
+    records which files are done, and a small checkpoint file remembers
+    files that failed so they are not retried on every start.
+
+    The indexer uses its own single idle-priority OCR worker and sleeps
+    between files so that it uses at most cpu_share of one core.  It
+    stops between files while any pause reason is set (pause/resume,
+    e.g. "user", "crop", "ocr") and for idle_seconds after touch().
+    """
+
+    def __init__(self, folder, search_index, cache=None, settings=None, checkpoint_path=None,
+                 cpu_share=0.25, idle_seconds=10.0, on_indexed=None):
+        self.folder = folder
+        self.search_index = search_index
+        self.checkpoint_path = checkpoint_path
+        self.cpu_share = min(max(cpu_share, 0.01), 1.0)
+        self.idle_seconds = idle_seconds
+        # on_indexed(name) runs on the indexer thread
+        self.on_indexed = on_indexed
+        self.pool = OcrPool(workers=1, settings=settings, cache=cache, low_priority=True)
+
+        self.indexed = 0
+        self.failed = {}  # name -> error message
+
+        self._new = deque()
+        self._backlog = []
+        self._pause_reasons = set()
+        self._last_activity = 0.0
+        self._cond = threading.Condition()
+        self._stopped = False
+        self._thread = None
+        self._load_checkpoint()
+
+    def start(self, names):
+        """Start indexing; names are all screenshots currently in the folder
+
+        Replaces anything enqueued before the start (e.g. by the initial
+        folder scan).
+        """
+        done = self.search_index.names()
+        with self._cond:
+            self._new.clear()
+            # names come newest first; the backlog is popped from the end
+            self._backlog = [name for name in reversed(list(names))
+                             if name not in done and name not in self.failed]
+        self._thread = threading.Thread(target=self._run, daemon=True, name="ocr-indexer")
+        self._thread.start()
+
+    def enqueue(self, names):
+        """Index these (new or changed) files before the backlog"""
+        with self._cond:
+            for name in names:
+                self.failed.pop(name, None)
+                self._new.append(name)
+            self._cond.notify_all()
+
+    def pause(self, reason="user"):
+        with self._cond:
+            self._pause_reasons.add(reason)
+
+    def resume(self, reason="user"):
+        with self._cond:
+            self._pause_reasons.discard(reason)
+            self._cond.notify_all()
+
+    def is_paused(self, reason="user"):
+        with self._cond:
+            return reason in self._pause_reasons
+
+    def touch(self):
+        """The user is busy (e.g. capturing); back off for idle_seconds"""
+        with self._cond:
+            self._last_activity = time.monotonic()
+
+    def pending(self):
+        """Files still waiting to be indexed"""
+        with self._cond:
+            return len(self._new) + len(self._backlog)
+
+    def stop(self):
+        """Stop after the current file and save the checkpoint"""
+        with self._cond:
+            self._stopped = True
+            self._cond.notify_all()
+        self.pool.shutdown(wait=False)
+        self._save_checkpoint()
+
+    def _next(self):
+        """Wait until indexing may proceed and return the next name, or None"""
+        with self._cond:
+            while not self._stopped:
+                if self._pause_reasons or not (self._new or self._backlog):
+                    self._cond.wait()
+                    continue
+                idle_for = time.monotonic() - self._last_activity
+                if idle_for < self.idle_seconds:
+                    self._cond.wait(self.idle_seconds - idle_for)
+                    continue
+                return self._new.popleft() if self._new else self._backlog.pop()
+            return None
+
+    def _run(self):
+        since_checkpoint = 0
+        while True:
+            name = self._next()
+            if name is None:
+                return
+            filepath = os.path.join(self.folder, name)
+            if not os.path.exists(filepath):
+                continue
+
+            started = time.monotonic()
+            batch = self.pool.submit([filepath])
+            batch.wait()
+            if batch.cancelled:
+                return
+            error = batch.errors.get(filepath)
+            if isinstance(error, TesseractMissingError):
+                # Nothing can be indexed until OCR is installed
+                with self._cond:
+                    self._new.appendleft(name)
+                self.pause("unavailable")
+                continue
+            if error is None:
+                self.search_index.add(name, batch.results[filepath])
+                with self._cond:
+                    self.indexed += 1
+                if self.on_indexed:
+                    self.on_indexed(name)
+            else:
+                with self._cond:
+                    self.failed[name] = str(error)
+
+            since_checkpoint += 1
+            if since_checkpoint >= 25:
+                self._save_checkpoint()
+                since_checkpoint = 0
+
+            # Duty cycle: idle long enough after each file that the time
+            # spent working is cpu_share of the total
+            resume_at = time.monotonic() + (time.monotonic() - started) * \
+                (1 - self.cpu_share) / self.cpu_share
+            with self._cond:
+                while not self._stopped and time.monotonic() < resume_at:
+                    self._cond.wait(resume_at - time.monotonic())
+
+    def _load_checkpoint(self):
+        if not self.checkpoint_path:
+            return
+        try:
+            with open(self.checkpoint_path, "r", encoding="utf-8") as handle:
+                data = json.load(handle)
+        except (OSError, ValueError):
+            return
+        self.failed = dict(data.get("failed", {}))
+
+    def _save_checkpoint(self):
+        if not self.checkpoint_path:
+            return
+        with self._cond:
+            data = {"failed": dict(self.failed),
+                    "pending": len(self._new) + len(self._backlog)}
+        tmp_path = self.checkpoint_path + ".tmp"
+        try:
+            with open(tmp_path, "w", encoding="utf-8") as handle:
+                json.dump(data, handle)
+            os.replace(tmp_path, self.checkpoint_path)
+        except OSError:
+            pass
@@ -0,0 +1,316 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+===========================================================
+    Project Name : Screen Shot Manager
+    File Name    : ocr_pool.py
+    Author       : Vignesh Kumar B
+    Created On   : 2026-10-18
+    Description  : OCR jobs run in a pool of worker processes
+===========================================================
+
+Frozen builds (PyInstaller) must call multiprocessing.freeze_support()
+at the top of the __main__ block, otherwise every worker process starts
+another copy of the application.
+"""
+
+import os
+import sys
+import threading
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+from delta_store import is_delta, open_screenshot
+from ocr_cache import OcrCache, content_hash, settings_key
+from ocr_preprocess import DEFAULT_PREPROCESS, ocr_preprocessed
+from ocr_tiles import DEFAULT_TILES, ocr_tiled, plan_tiles
+
+
+TESSERACT_CMD = r'C:\Program Files\Tesseract-OCR\tesseract.exe'
+
+# Passed to tesseract and the preprocessing stage; part of the OCR cache key
+DEFAULT_SETTINGS = {"lang": "eng", "config": "", "preprocess": DEFAULT_PREPROCESS,
+                    "tiles": DEFAULT_TILES}
+
+
+class OcrError(Exception):
+    """OCR of one file failed; the message is shown to the user"""
+
+
+class TesseractMissingError(OcrError):
+    """pytesseract or the tesseract executable is not installed"""
+
+
+_worker_cache = None
+
+
+def _lower_priority():
+    """Run this process (and the tesseract it starts) at idle priority"""
+    try:
+        if sys.platform == "win32":
+            import win32api
+            import win32process
+            win32process.SetPriorityClass(win32api.GetCurrentProcess(),
+                                          win32process.IDLE_PRIORITY_CLASS)
+        else:
+            os.nice(15)
+    except Exception:
+        pass
+
+
+def _init_worker(cache_path=None, low_priority=False):
+    global _worker_cache
+    # Parallelism comes from the pool; one tesseract thread per process
+    # avoids oversubscribing the cores
+    os.environ.setdefault("OMP_THREAD_LIMIT", "1")
+    if low_priority:
+        _lower_priority()
+    if cache_path:
+        try:
+            _worker_cache = OcrCache(cache_path)
+        except Exception:
+            _worker_cache = None
+
+
+def ocr_file(filepath, tesseract_cmd=TESSERACT_CMD, settings=DEFAULT_SETTINGS, tile_workers=1):
+    """OCR one screenshot; runs inside a worker process
+
+    Returns (mtime_ns, size, content_hash, text).  Only the path crosses
+    the process boundary.  The pixels are hashed first; when the OCR
+    cache already has text for them (a renamed or linked copy) tesseract
+    is not run at all.  With preprocessing enabled only the detected
+    text blocks are recognised (see ocr_preprocess); otherwise plain
+    image files are handed to tesseract by path, without a re-encode.
+    Very large captures are cut into tiles that are recognised on up to
+    tile_workers threads (see ocr_tiles).
+    """
+    try:
+        st = os.stat(filepath)
+        image = open_screenshot(filepath)
+        image.load()
+    except OSError as e:
+        raise OcrError(f"Cannot read {os.path.basename(filepath)}: {e}") from None
+    digest = content_hash(image)
+    key = settings_key(settings)
+    if _worker_cache is not None:
+        text = _worker_cache.lookup_content(digest, key)
+        if text is not None:
+            return st.st_mtime_ns, st.st_size, digest, text
+
+    try:
+        import pytesseract
+    except ImportError:
+        raise TesseractMissingError(
+            "pytesseract is not installed.\nRun: pip install pytesseract==0.3.13") from None
+
+    if os.path.exists(tesseract_cmd):
+        pytesseract.pytesseract.tesseract_cmd = tesseract_cmd
+
+    def recognise(source, config=""):
+        return pytesseract.image_to_string(source, lang=settings["lang"],
+                                           config=f"{settings['config']} {config}".strip())
+
+    def recognise_data(source, config=""):
+        return pytesseract.image_to_data(source, lang=settings["lang"],
+                                         config=f"{settings['config']} {config}".strip(),
+                                         output_type=pytesseract.Output.DICT)
+
+    try:
+        preprocess = settings.get("preprocess")
+        tiles = plan_tiles(image.size, settings["tiles"]) if settings.get("tiles") else None
+        if tiles:
+            text = ocr_tiled(image, tiles, settings, recognise_data, tile_workers)
+        elif preprocess and preprocess["enabled"]:
+            text = ocr_preprocessed(image, preprocess, recognise)
+        else:
+            text = recognise(image if is_delta(filepath) else filepath)
+        return st.st_mtime_ns, st.st_size, digest, text.strip()
+    except pytesseract.pytesseract.TesseractNotFoundError:
+        # Re-raised as our own type: pytesseract's exceptions do not
+        # survive pickling back to the parent process
+        raise TesseractMissingError(
+            "Tesseract OCR is not installed.\n"
+            "Download it from: https://github.com/UB-Mannheim/tesseract/wiki") from None
+    except Exception as e:
+        raise OcrError(str(e)) from None
+
+
+class OcrBatch:
+    """One OCR request: one or more files, results in request order"""
+
+    def __init__(self, filepaths):
+        self.filepaths = list(dict.fromkeys(filepaths))
+        self.results = {}  # filepath -> text
+        self.errors = {}  # filepath -> OcrError
+        self.cancelled = False
+        self.futures = []
+        self.finished = threading.Event()
+
+    @property
+    def total(self):
+        return len(self.filepaths)
+
+    @property
+    def completed(self):
+        return len(self.results) + len(self.errors)
+
+    @property
+    def done(self):
+        return self.cancelled or self.completed == self.total
+
+    def wait(self, timeout=None):
+        """Block until the batch finished or was cancelled and the
+        pool's on_done callback has returned"""
+        return self.finished.wait(timeout)
+
+
+class OcrPool:
+    """Runs OCR batches on worker processes, one file per task
+
+    on_progress(batch) is called after each file and on_done(batch) once
+    the whole batch finished or was cancelled.  Both run on a pool
+    thread, so GUI users must marshal them to their UI thread.
+
+    Cancelling drops files that have not started yet; files already in
+    a tesseract run finish in the background and their results are
+    discarded.  The worker processes are started on first use.
+
+    With an OcrCache, files whose text is cached complete immediately
+    without reaching a worker, and every new result is stored.
+    low_priority runs the workers at idle CPU priority.
+    """
+
+    def __init__(self, workers=None, tesseract_cmd=TESSERACT_CMD, settings=None,
+                 cache=None, on_progress=None, on_done=None, low_priority=False):
+        self.workers = workers or os.cpu_count() or 1
+        self.low_priority = low_priority
+        self.tesseract_cmd = tesseract_cmd
+        self.settings = dict(settings or DEFAULT_SETTINGS)
+        self.cache = cache
+        self.on_progress = on_progress
+        self.on_done = on_done
+
+        self._executor = None
+        self._batches = []
+        self._lock = threading.Lock()
+
+    def submit(self, filepaths):
+        """Start OCR of filepaths; returns the OcrBatch"""
+        batch = OcrBatch(filepaths)
+        with self._lock:
+            self._batches.append(batch)
+            # The worker slots are shared between the files of the batch;
+            # a single large capture gets all of them for its tiles
+            tile_workers = max(1, self.workers // max(len(batch.filepaths), 1))
+            for filepath in batch.filepaths:
+                batch.futures.append(self._submit_one(filepath, tile_workers))
+
+        if not batch.filepaths:
+            self._finish(batch)
+        for filepath, future in zip(batch.filepaths, batch.futures):
+            future.add_done_callback(
+                lambda f, path=filepath: self._on_file_done(batch, path, f))
+        return batch
+
+    def busy(self):
+        """True while any batch is still running"""
+        with self._lock:
+            return bool(self._batches)
+
+    def cancel(self, batch=None):
+        """Cancel batch, or every running batch"""
+        with self._lock:
+            batches = [batch] if batch is not None else list(self._batches)
+            batches = [item for item in batches if not item.done]
+            for item in batches:
+                item.cancelled = True
+        # Outside the lock: cancel() runs the done callbacks right away
+        for item in batches:
+            for future in item.futures:
+                future.cancel()
+            self._finish(item)
+
+    def shutdown(self, wait=True):
+        """Cancel everything and stop the worker processes"""
+        self.cancel()
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=wait, cancel_futures=True)
+
+    def _submit_one(self, filepath, tile_workers=1):
+        if self.cache is not None:
+            try:
+                text = self.cache.lookup_file(filepath, settings_key(self.settings))
+            except Exception:
+                text = None
+            if text is not None:
+                future = Future()
+                future.set_result((None, None, None, text))
+                return future
+
+        if self._executor is None:
+            self._executor = self._new_executor()
+        try:
+            return self._executor.submit(ocr_file, filepath, self.tesseract_cmd,
+                                         self.settings, tile_workers)
+        except BrokenProcessPool:
+            # A worker died (e.g. killed by the OS); start a fresh pool
+            self._executor = self._new_executor()
+            return self._executor.submit(ocr_file, filepath, self.tesseract_cmd,
+                                         self.settings, tile_workers)
+
+    def _new_executor(self):
+        cache_path = self.cache.db_path if self.cache is not None else None
+        return ProcessPoolExecutor(max_workers=self.workers, initializer=_init_worker,
+                                   initargs=(cache_path, self.low_priority))
+
+    def _store(self, filepath, result):
+        mtime_ns, size, digest, text = result
+        if self.cache is None or digest is None:
+            return
+        try:
+            self.cache.store(filepath, mtime_ns, size, digest,
+                             settings_key(self.settings), text)
+        except Exception:
+            # A cache failure must never lose the OCR result
+            pass
+
+    def _on_file_done(self, batch, filepath, future):
+        if future.cancelled():
+            return
+        error = future.exception()
+        if error is None:
+            # Cached even if the batch was cancelled meanwhile
+            result = future.result()
+            self._store(filepath, result)
+
+        with self._lock:
+            if batch.cancelled:
+                return
+            if error is None:
+                batch.results[filepath] = result[3]
+            elif isinstance(error, OcrError):
+                batch.errors[filepath] = error
+            else:
+                # Worker crashed (BrokenProcessPool) or similar
+                batch.errors[filepath] = OcrError(str(error) or type(error).__name__)
+            finished = batch.completed == batch.total
+
+        if self.on_progress:
+            self.on_progress(batch)
+        if finished:
+            self._finish(batch)
+
+    def _finish(self, batch):
+        with self._lock:
+            if batch not in self._batches:
+                return
+            self._batches.remove(batch)
+        # wait() returns only after on_done (which stores the text in the
+        # search index), so a caller may close everything once it returns
+        try:
+            if self.on_done:
+                self.on_done(batch)
+        finally:
+            batch.finished.set()
@@ -0,0 +1,262 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+===========================================================
+    Project Name : Screen Shot Manager
+    File Name    : ocr_preprocess.py
+    Author       : Vignesh Kumar B
+    Created On   : 2026-10-18
+    Description  : Image preprocessing and text regions for OCR
+===========================================================
+
+Screenshots are mostly empty space, window chrome and pictures with a
+little text.  Instead of giving tesseract the whole colour frame, the
+frame is turned into grayscale, the blocks that look like text are
+found on a cheap binarized copy, and only those blocks are scaled to a
+comfortable DPI, binarized again and recognised.  The per-block text is
+joined in reading order.
+"""
+
+from collections import deque
+
+from PIL import Image, ImageChops, ImageFilter, ImageOps, ImageStat
+
+
+# Every option is part of the OCR cache key (see ocr_pool.DEFAULT_SETTINGS)
+DEFAULT_PREPROCESS = {
+    # Opt-in until benchmarks/bench_ocr.py shows an accuracy gain on real
+    # captures; off, tesseract gets the untouched frame
+    "enabled": False,
+    # Adaptive binarization: a pixel is ink when it differs from the mean
+    # of its (2 * radius + 1)^2 neighbourhood by more than offset.  Works
+    # for dark-on-light and light-on-dark (dark theme) text alike.
+    "binarize": True,
+    "radius": 12,
+    "offset": 24,
+    # Screen pixels per inch (96 at 100% display scaling) and the
+    # resolution text blocks are scaled to before recognition
+    "source_dpi": 96,
+    "target_dpi": 192,
+    # Text-region detection; with regions off the whole frame is used
+    "regions": True,
+    "cell": 8,
+    "min_ink": 0.01,
+    "max_ink": 0.45,
+    "max_regions": 24,
+}
+
+
+def to_grayscale(image):
+    if image.mode == "L":
+        return image
+    if "A" in image.getbands():
+        # Transparent areas become white, not black
+        background = Image.new("RGB", image.size, (255, 255, 255))
+        background.paste(image.convert("RGBA"), mask=image.convert("RGBA").getchannel("A"))
+        image = background
+    return image.convert("L")
+
+
+def ink_masks(gray, radius, offset):
+    """(darker, brighter): 255 where a pixel is darker / brighter than the
+    mean of its neighbourhood by more than offset"""
+    local_mean = gray.filter(ImageFilter.BoxBlur(radius))
+    darker = ImageChops.subtract(local_mean, gray).point(lambda v: 255 if v > offset else 0)
+    brighter = ImageChops.subtract(gray, local_mean).point(lambda v: 255 if v > offset else 0)
+    return darker, brighter
+
+
+def binarize(gray, radius, offset):
+    """Black ink on white paper, whatever the original colours were
+
+    The background is the most common tone, so a bright median means
+    dark text (ink is darker than its surroundings) and vice versa.
+    """
+    darker, brighter = ink_masks(gray, radius, offset)
+    ink = darker if ImageStat.Stat(gray).median[0] >= 128 else brighter
+    return ImageOps.invert(ink)
+
+
+def scale_factor(options):
+    """How much to enlarge text blocks to reach target_dpi
+
+    Never shrinks: text captured on a HiDPI screen is already large.
+    """
+    return min(max(options["target_dpi"] / max(options["source_dpi"], 1), 1.0), 4.0)
+
+
+def remove_lines(mask, length=48):
+    """Drop straight horizontal/vertical ink runs of at least length px
+
+    Window borders, separators and table rules would otherwise connect
+    every block of text on the screen into one region.  A box-reduced
+    copy is (nearly) fully inked only where a run covers a whole
+    length-wide cell; the strokes of text never are.
+    """
+    width, height = mask.size
+    lines = Image.new("L", mask.size, 0)
+    for size in ((width // length, height), (width, height // length)):
+        if min(size) < 1:
+            continue
+        runs = mask.resize(size, Image.Resampling.BOX).point(lambda v: 255 if v >= 200 else 0)
+        # Grown by a pixel across the rule (cheap at this size) to take
+        # its anti-aliased edges too
+        runs = runs.filter(ImageFilter.MaxFilter(3))
+        lines = ImageChops.lighter(lines, runs.resize(mask.size, Image.Resampling.NEAREST))
+    return ImageChops.subtract(mask, lines)
+
+
+def region_mask(gray, radius, offset):
+    """Ink of both polarities with rules and borders removed
+
+    Each polarity is cleaned separately: the halo on the bright side of
+    dark text forms long runs too, but removing it leaves the glyphs.
+    """
+    darker, brighter = ink_masks(gray, radius, offset)
+    return ImageChops.lighter(remove_lines(darker), remove_lines(brighter))
+
+
+def text_regions(mask, cell=8, min_ink=0.01, max_ink=0.45):
+    """Pixel boxes of blocks that look like text, from an ink mask
+
+    The mask is reduced to a grid of cell x cell squares; squares with
+    some ink are grown by one cell so letters, words and lines of a block
+    touch, and connected groups of squares become candidate blocks.
+    Blocks with too little ink are specks, blocks with too much or with
+    ink on every row are pictures or filled shapes; all are skipped.
+    """
+    # Cells with only a few stray ink pixels are noise
+    grid = mask.reduce(cell).point(lambda v: 255 if v >= 12 else 0).filter(ImageFilter.MaxFilter(3))
+    width, height = grid.size
+    data = grid.tobytes()
+    seen = bytearray(len(data))
+
+    regions = []
+    for start in range(len(data)):
+        if not data[start] or seen[start]:
+            continue
+        seen[start] = 1
+        queue = deque([start])
+        x0, y0, x1, y1 = width, height, 0, 0
+        while queue:
+            i = queue.popleft()
+            x, y = i % width, i // width
+            x0, y0, x1, y1 = min(x0, x), min(y0, y), max(x1, x), max(y1, y)
+            for j in (i - 1 if x else -1, i + 1 if x + 1 < width else -1,
+                      i - width, i + width):
+                if 0 <= j < len(data) and data[j] and not seen[j]:
+                    seen[j] = 1
+                    queue.append(j)
+
+        box = (x0 * cell, y0 * cell,
+               min((x1 + 1) * cell, mask.width), min((y1 + 1) * cell, mask.height))
+        # The box includes the one-cell growth on each side, so anything
+        # smaller is a speck or the remnant of a removed border
+        if box[2] - box[0] < 4 * cell or box[3] - box[1] < 3 * cell:
+            continue
+        block = mask.crop(box)
+        ink = block.histogram()[255] / (block.width * block.height)
+        if min_ink <= ink <= max_ink and _has_line_gaps(block):
+            regions.append(box)
+    return regions
+
+
+def _has_line_gaps(block, min_gap_rows=0.1):
+    """True if enough pixel rows of block are (nearly) free of ink
+
+    Lines of text are separated by leading; noise, photos and gradients
+    have ink on every row.
+    """
+    rows = block.resize((1, block.height), Image.Resampling.BOX).tobytes()
+    empty = sum(1 for value in rows if value < 6)
+    return empty >= min_gap_rows * len(rows)
+
+
+def reading_order(boxes):
+    """Sort boxes top to bottom, and left to right within a row
+
+    Boxes whose vertical extents overlap by at least half of the shorter
+    one are in the same row.
+    """
+    rows = []
+    for box in sorted(boxes, key=lambda b: (b[1], b[0])):
+        for row in rows:
+            top, bottom = row["top"], row["bottom"]
+            overlap = min(bottom, box[3]) - max(top, box[1])
+            if overlap >= min(bottom - top, box[3] - box[1]) / 2:
+                row["boxes"].append(box)
+                row["top"], row["bottom"] = min(top, box[1]), max(bottom, box[3])
+                break
+        else:
+            rows.append({"top": box[1], "bottom": box[3], "boxes": [box]})
+    rows.sort(key=lambda row: row["top"])
+    return [box for row in rows for box in sorted(row["boxes"], key=lambda b: b[0])]
+
+
+# White margin around each prepared block; keeps tesseract from clipping
+# edge glyphs
+BORDER = 10
+
+
+def prepare_block(gray, box, options):
+    """Crop, enlarge and binarize one block for recognition"""
+    block = gray.crop(box)
+    factor = scale_factor(options)
+    if factor > 1.0:
+        block = block.resize((round(block.width * factor), round(block.height * factor)),
+                             Image.Resampling.BICUBIC)
+    if options["binarize"]:
+        block = binarize(block, round(options["radius"] * factor), options["offset"])
+    return ImageOps.expand(block, border=BORDER, fill=255)
+
+
+def text_blocks(image, options):
+    """Prepared blocks of image to recognise, in reading order
+
+    Yields (block, box, config): the prepared image, the box of image it
+    shows and the tesseract config (page segmentation mode and DPI).  A
+    point (x, y) of block is at box[0] + (x - BORDER) / scale_factor()
+    in image.
+    """
+    gray = to_grayscale(image)
+    dpi_config = f"--dpi {round(options['target_dpi'])}"
+
+    if not options["regions"]:
+        box = (0, 0) + gray.size
+        yield prepare_block(gray, box, options), box, f"--psm 3 {dpi_config}"
+        return
+
+    mask = region_mask(gray, options["radius"], options["offset"])
+    boxes = reading_order(text_regions(mask, options["cell"],
+                                       options["min_ink"], options["max_ink"]))
+    if len(boxes) > options["max_regions"]:
+        # Too many separate calls; blank everything but the text blocks
+        # and recognise their union in one go
+        keep = Image.new("L", gray.size, 0)
+        for box in boxes:
+            keep.paste(255, box)
+        page = Image.composite(gray, Image.new("L", gray.size, 255), keep)
+        union = (min(b[0] for b in boxes), min(b[1] for b in boxes),
+                 max(b[2] for b in boxes), max(b[3] for b in boxes))
+        yield prepare_block(page, union, options), union, f"--psm 3 {dpi_config}"
+        return
+
+    for box in boxes:
+        # Small blocks are a few lines of one column; let tesseract work
+        # out the layout of larger ones itself
+        psm = 6 if box[3] - box[1] <= 160 else 3
+        yield prepare_block(gray, box, options), box, f"--psm {psm} {dpi_config}"
+
+
+def ocr_preprocessed(image, options, recognise):
+    """Text of image via the preprocessing pipeline
+
+    recognise(image, config) runs tesseract on one prepared block and
+    returns its text.
+    """
+    texts = []
+    for block, _box, config in text_blocks(image, options):
+        text = recognise(block, config).strip()
+        if text:
+            texts.append(text)
+    return "\n\n".join(texts)
@@ -0,0 +1,200 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+===========================================================
+    Project Name : Screen Shot Manager
+    File Name    : ocr_tiles.py
+    Author       : Vignesh Kumar B
+    Created On   : 2026-10-18
+    Description  : Tiled parallel OCR for very large captures
+===========================================================
+
+A capture of several monitors is too big for one comfortable tesseract
+run.  It is cut into tiles (one per monitor, or a grid of overlapping
+tiles), the tiles are recognised on parallel threads (tesseract is a
+separate process, so the threads really run side by side) and the words
+are merged back into one text.
+
+Every tile owns part of the frame.  For monitor tiles that is the tile
+itself; grid tiles overlap their neighbours by overlap px so no line is
+cut, and each owns the area up to the middle of the overlap bands.  A
+word is kept only by the tile that owns its centre, so the overlap is
+never read twice, and a line cut by a vertical seam is joined again.
+"""
+
+import sys
+from concurrent.futures import ThreadPoolExecutor
+
+from ocr_preprocess import BORDER, scale_factor, text_blocks
+
+
+# Part of the OCR settings (and so of the cache key)
+DEFAULT_TILES = {
+    # "auto" tiles captures larger than min_pixels, one tile per monitor
+    # when the monitor layout fits the image, else a grid; "monitors",
+    # "grid" and "off" force a mode
+    "mode": "auto",
+    "min_pixels": 12_000_000,
+    "size": 2048,
+    "overlap": 256,
+}
+
+
+def grid_tiles(size, tile=2048, overlap=256):
+    """[(box, owned box)] covering size with tiles of at most tile px"""
+    width, height = size
+
+    def spans(length):
+        count = max(1, -(-(length - overlap) // (tile - overlap)))
+        step = length / count
+        cuts = [round(i * step) for i in range(count + 1)]
+        # Owned spans meet at the cuts; tiles reach overlap/2 past them
+        return [(max(cuts[i] - overlap // 2, 0), min(cuts[i + 1] + overlap // 2, length),
+                 cuts[i], cuts[i + 1]) for i in range(count)]
+
+    return [((x0, y0, x1, y1), (ox0, oy0, ox1, oy1))
+            for y0, y1, oy0, oy1 in spans(height)
+            for x0, x1, ox0, ox1 in spans(width)]
+
+
+def monitor_tiles(size):
+    """[(box, box)] per monitor, if the image is a capture of all of them
+
+    None when the monitor layout is unknown or does not match size (a
+    capture from another machine, or a different display scaling).
+    """
+    if sys.platform != "win32":
+        return None
+    try:
+        import win32api
+        rects = [rect for _monitor, _dc, rect in win32api.EnumDisplayMonitors()]
+    except Exception:
+        return None
+    if len(rects) < 2:
+        return None
+    left, top = min(r[0] for r in rects), min(r[1] for r in rects)
+    right, bottom = max(r[2] for r in rects), max(r[3] for r in rects)
+    if (right - left, bottom - top) != tuple(size):
+        return None
+    # Left to right, top to bottom like the text
+    boxes = sorted(((r[0] - left, r[1] - top, r[2] - left, r[3] - top) for r in rects),
+                   key=lambda b: (b[1], b[0]))
+    return [(box, box) for box in boxes]
+
+
+def plan_tiles(size, options):
+    """Tiles for an image of size, or None to OCR it in one piece"""
+    mode = options["mode"]
+    if mode == "off" or (mode == "auto" and size[0] * size[1] < options["min_pixels"]):
+        return None
+    if mode in ("auto", "monitors"):
+        tiles = monitor_tiles(size)
+        if tiles:
+            return tiles
+    return grid_tiles(size, options["size"], options["overlap"])
+
+
+def _words(data, origin, factor, border):
+    """Words of one image_to_data result as lines in frame coordinates
+
+    Returns [(paragraph key, [(left, top, right, bottom, text), ...])].
+    """
+    lines = {}
+    for i, text in enumerate(data["text"]):
+        text = text.strip()
+        if not text or float(data["conf"][i]) < 0:
+            continue
+        left = origin[0] + (data["left"][i] - border) / factor
+        top = origin[1] + (data["top"][i] - border) / factor
+        word = (left, top, left + data["width"][i] / factor, top + data["height"][i] / factor, text)
+        key = (data["block_num"][i], data["par_num"][i], data["line_num"][i])
+        lines.setdefault(key, []).append(word)
+    return [(key[:2], words) for key, words in lines.items()]
+
+
+def read_tile(image, tile, index, settings, recognise_data):
+    """Lines of one tile that it owns, as dicts in reading order"""
+    box, owned = tile
+    crop = image.crop(box)
+    preprocess = settings.get("preprocess")
+    if preprocess and preprocess["enabled"]:
+        factor = scale_factor(preprocess)
+        jobs = [(block, (box[0] + block_box[0], box[1] + block_box[1]), config, factor, BORDER)
+                for block, block_box, config in text_blocks(crop, preprocess)]
+    else:
+        jobs = [(crop, box[:2], "", 1.0, 0)]
+
+    lines = []
+    for number, (block, origin, config, factor, border) in enumerate(jobs):
+        for paragraph, words in _words(recognise_data(block, config), origin, factor, border):
+            words = [w for w in words
+                     if owned[0] <= (w[0] + w[2]) / 2 < owned[2]
+                     and owned[1] <= (w[1] + w[3]) / 2 < owned[3]]
+            if words:
+                lines.append({
+                    "tile": index,
+                    "paragraph": (index, number) + paragraph,
+                    "box": [min(w[0] for w in words), min(w[1] for w in words),
+                            max(w[2] for w in words), max(w[3] for w in words)],
+                    "text": " ".join(w[4] for w in words),
+                })
+    return lines
+
+
+def _join_seams(tiles, per_tile, overlap):
+    """Append line pieces cut by a vertical seam to their left part"""
+    if not overlap:
+        return
+    right_of = {}
+    for index, (_box, owned) in enumerate(tiles):
+        for other, (_other_box, other_owned) in enumerate(tiles):
+            if other_owned[0] == owned[2] and other_owned[1] == owned[1]:
+                right_of[index] = other
+
+    for index in range(len(tiles)):
+        for line in per_tile[index]:
+            tile = index
+            while line.get("joined") is None and tile in right_of:
+                seam = tiles[tile][1][2]
+                if seam - line["box"][2] > overlap:
+                    break
+                height = line["box"][3] - line["box"][1]
+                middle = (line["box"][1] + line["box"][3]) / 2
+                tile = right_of[tile]
+                for piece in per_tile[tile]:
+                    if ("joined" not in piece and piece["box"][0] - seam <= overlap
+                            and abs((piece["box"][1] + piece["box"][3]) / 2 - middle) <= height / 2):
+                        piece["joined"] = True
+                        line["text"] += " " + piece["text"]
+                        line["box"][2:] = [max(line["box"][2], piece["box"][2]),
+                                           max(line["box"][3], piece["box"][3])]
+                        break
+                else:
+                    break
+
+
+def ocr_tiled(image, tiles, settings, recognise_data, workers=1):
+    """Text of image read tile by tile on up to workers threads
+
+    recognise_data(image, config) runs tesseract on one block and
+    returns pytesseract's image_to_data dictionary.  Paragraphs are
+    separated by a blank line, as in a plain tesseract run.
+    """
+    with ThreadPoolExecutor(max_workers=max(1, min(workers, len(tiles)))) as executor:
+        per_tile = list(executor.map(
+            lambda item: read_tile(image, item[1], item[0], settings, recognise_data),
+            enumerate(tiles)))
+
+    _join_seams(tiles, per_tile, settings["tiles"]["overlap"])
+
+    paragraphs = []
+    last = None
+    for lines in per_tile:
+        for line in lines:
+            if line.get("joined"):
+                continue
+            if line["paragraph"] != last:
+                paragraphs.append([])
+                last = line["paragraph"]
+            paragraphs[-1].append(line["text"])
+    return "\n\n".join("\n".join(lines) for lines in paragraphs)
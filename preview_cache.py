@@ -0,0 +1,213 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+===========================================================
+    Project Name : Screen Shot Manager
+    File Name    : preview_cache.py
+    Author       : Vignesh Kumar B
+    Created On   : 2026-10-18
+    Description  : In-memory preview cache with prefetch
+===========================================================
+"""
+
+import os
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+
+from PIL import Image
+
+
+# Default RAM budget for decoded preview bitmaps
+DEFAULT_BUDGET_BYTES = 96 * 1024 * 1024
+
+
+def image_nbytes(image):
+    """Approximate memory held by a decoded PIL image"""
+    return image.width * image.height * len(image.getbands())
+
+
+def fit_size(image_size, box, padding=0.95):
+    """Size an image is shown at inside box (never upscaled)"""
+    img_width, img_height = image_size
+    scale = min(box[0] / img_width, box[1] / img_height, 1)
+    return max(int(img_width * scale * padding), 1), max(int(img_height * scale * padding), 1)
+
+
+def quick_preview(image, size):
+    """Cheap first-frame downscale: integer reduce, then BILINEAR
+
+    Quality is noticeably below LANCZOS; it is only shown until the
+    high-quality render replaces it.
+    """
+    factor = max(1, min(image.width // max(size[0], 1), image.height // max(size[1], 1)))
+    if factor > 1:
+        image = image.reduce(factor)
+    if image.mode not in ("RGB", "RGBA", "L"):
+        image = image.convert("RGBA")
+    return image.resize(size, Image.Resampling.BILINEAR)
+
+
+class PreviewCache:
+    """Byte-bounded LRU of decoded, already scaled preview images
+
+    render(filepath, box) produces the display-ready image; it is called
+    on the Tk thread for misses and on worker threads for prefetches, so
+    it must not touch Tk.  Keys include mtime and size, so overwritten
+    files never return a stale bitmap.
+    """
+
+    def __init__(self, render, budget_bytes=DEFAULT_BUDGET_BYTES, prefetch_workers=2):
+        self.render = render
+        self.budget_bytes = budget_bytes
+
+        self.hits = 0
+        self.misses = 0
+        self.prefetched = 0
+
+        self._entries = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self._pending = {}
+        # Key of the latest get_async(); prefetch() never cancels it
+        self._wanted = None
+        self._executor = ThreadPoolExecutor(max_workers=prefetch_workers,
+                                            thread_name_prefix="preview-prefetch")
+        # Renders for the current selection never queue behind prefetches
+        self._render_executor = ThreadPoolExecutor(max_workers=1,
+                                                   thread_name_prefix="preview-render")
+
+    def get(self, filepath, box):
+        """Return the preview image for filepath scaled to fit box"""
+        key = self._key(filepath, box)
+        with self._lock:
+            image = self._entries.get(key)
+            if image is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return image
+            self.misses += 1
+            future = self._pending.get(key)
+
+        # A prefetch for this file is already decoding it; wait for that
+        if future is not None:
+            if future.cancel():
+                with self._lock:
+                    self._pending.pop(key, None)
+            else:
+                image = future.result()
+                if image is not None:
+                    return image
+
+        image = self.render(filepath, box)
+        self._put(key, image)
+        return image
+
+    def get_async(self, filepath, box):
+        """Return a Future for the preview image; already done on a hit
+
+        Cancelling the future abandons the render if it has not started.
+        A prefetch of the same file that is still queued is replaced by a
+        render on the dedicated worker, so it neither waits behind other
+        prefetches nor gets cancelled by the next prefetch().
+        """
+        key = self._key(filepath, box)
+        with self._lock:
+            image = self._entries.get(key)
+            if image is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                future = Future()
+                future.set_result(image)
+                return future
+            self.misses += 1
+
+            self._wanted = key
+            future = self._pending.get(key)
+            # A queued (not yet running) render is resubmitted; a running
+            # one cannot be cancelled and is reused
+            if future is None or future.cancel() or future.cancelled():
+                future = self._render_executor.submit(self._render_one, filepath, box, key)
+                self._pending[key] = future
+            return future
+
+    def prefetch(self, filepaths, box):
+        """Decode filepaths in the background, dropping older prefetches"""
+        keys = []
+        for filepath in filepaths:
+            try:
+                keys.append((filepath, self._key(filepath, box)))
+            except OSError:
+                continue
+
+        with self._lock:
+            wanted = {key for _, key in keys}
+            for key, future in list(self._pending.items()):
+                if key not in wanted and key != self._wanted and future.cancel():
+                    del self._pending[key]
+
+            for filepath, key in keys:
+                if key in self._entries or key in self._pending:
+                    continue
+                self._pending[key] = self._executor.submit(self._render_one,
+                                                           filepath, box, key, True)
+
+    def invalidate(self, filepath):
+        """Forget every cached size of filepath"""
+        filepath = os.path.abspath(filepath)
+        with self._lock:
+            for key in [k for k in self._entries if k[0] == filepath]:
+                self._bytes -= image_nbytes(self._entries.pop(key))
+
+    def stats(self):
+        """Counters for tuning the budget"""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+                "prefetched": self.prefetched,
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "budget_bytes": self.budget_bytes,
+            }
+
+    def close(self):
+        """Cancel outstanding prefetches"""
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        self._render_executor.shutdown(wait=False, cancel_futures=True)
+
+    def _key(self, filepath, box):
+        filepath = os.path.abspath(filepath)
+        st = os.stat(filepath)
+        return (filepath, st.st_mtime_ns, st.st_size, tuple(box))
+
+    def _render_one(self, filepath, box, key, prefetch=False):
+        try:
+            image = self.render(filepath, box)
+            image.load()
+        except Exception:
+            with self._lock:
+                self._pending.pop(key, None)
+            return None
+        self._put(key, image)
+        with self._lock:
+            self._pending.pop(key, None)
+            if prefetch:
+                self.prefetched += 1
+        return image
+
+    def _put(self, key, image):
+        size = image_nbytes(image)
+        if size > self.budget_bytes:
+            return
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self._bytes -= image_nbytes(old)
+            self._entries[key] = image
+            self._bytes += size
+            while self._bytes > self.budget_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self._bytes -= image_nbytes(evicted)
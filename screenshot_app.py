@@ -15,21 +15,25 @@ __version__ = "1.0.0"
 __license__ = "MIT"  # or any license you prefer
 
 
+import time
+STARTED_AT = time.perf_counter()
+
+# Only what the first frame needs is imported here.  PIL, the storage,
+# OCR and cache modules, keyboard, pystray and win32api are imported on
+# first use, most of them by start_services() after the window is drawn.
 import tkinter as tk
-from tkinter import ttk, messagebox, simpledialog
-from PIL import ImageGrab, Image, ImageTk, ImageDraw
+from tkinter import ttk, messagebox, simpledialog, filedialog
 import os
 from datetime import datetime
-import keyboard
 import threading
-import pystray
-from pystray import MenuItem as item
-from PIL import Image as PILImage
+import queue
 import sys
-import win32api
+from virtual_list import VirtualListbox
+from search_index import SearchResults
+from capture_split import capture_set, part_index
 
 class CropWindow(tk.Toplevel):
-    def __init__(self, master, image_path, colors, refresh_callback, select_callback):
+    def __init__(self, master, image_path, colors, save_callback):
         super().__init__(master)
         self.title("Crop Image")
         self.geometry("800x600")
@@ -38,16 +42,31 @@ class CropWindow(tk.Toplevel):
 
         self.image_path = image_path
         self.colors = colors
-        self.refresh_callback = refresh_callback
-        self.select_callback = select_callback
+        self.save_callback = save_callback
 
-        self.original_image = Image.open(image_path)
+        from delta_store import open_screenshot
+        self.original_image = open_screenshot(image_path)
+        self.original_image.load()
         self.display_image = self.original_image.copy()
         self.tk_image = None
+        self.tk_image_id = None
+
+        # Successively halved copies of the image; redraws sample the
+        # smallest level that is still at least as large as the canvas
+        self.mip_levels = None
+
+        # Where the displayed image sits on the canvas and how many source
+        # pixels one displayed pixel covers, recorded at draw time
+        self.image_offset = (0, 0)
+        self.image_scale = (1.0, 1.0)
 
         self.start_x = None
         self.start_y = None
         self.current_rect = None
+        self.crop_x1 = None
+
+        self.resize_job = None
+        self.drawn_canvas_size = None
 
         self.configure(bg=self.colors['bg'])
 
@@ -88,12 +107,31 @@ class CropWindow(tk.Toplevel):
 
         self.show_image()
 
+    def build_mip_levels(self):
+        """Build the mip chain of the original image (once)"""
+        levels = [self.original_image]
+        if self.original_image.mode not in ("RGB", "RGBA", "L"):
+            levels = [self.original_image.convert("RGBA")]
+        while min(levels[-1].size) >= 512:
+            levels.append(levels[-1].reduce(2))
+        self.mip_levels = levels
+
+    def mip_level_for(self, width, height):
+        """Smallest mip level that still covers width x height"""
+        if self.mip_levels is None:
+            self.build_mip_levels()
+        for level in reversed(self.mip_levels):
+            if level.width >= width and level.height >= height:
+                return level
+        return self.mip_levels[0]
+
     def show_image(self):
+        from PIL import Image, ImageTk
         self.canvas.delete("all")
         canvas_width = self.canvas.winfo_width()
         canvas_height = self.canvas.winfo_height()
 
-        if canvas_width == 0 or canvas_height == 0:
+        if canvas_width <= 1 or canvas_height <= 1:
             # If canvas not yet rendered, schedule a retry
             self.after(10, self.show_image)
             return
@@ -101,19 +139,39 @@ class CropWindow(tk.Toplevel):
         img_width, img_height = self.original_image.size
         scale = min(canvas_width / img_width, canvas_height / img_height, 1.0)
 
-        new_width = int(img_width * scale)
-        new_height = int(img_height * scale)
+        new_width = max(int(img_width * scale), 1)
+        new_height = max(int(img_height * scale), 1)
 
-        self.display_image = self.original_image.resize((new_width, new_height), Image.Resampling.LANCZOS)
+        level = self.mip_level_for(new_width, new_height)
+        if level.size == (new_width, new_height):
+            self.display_image = level
+        else:
+            self.display_image = level.resize((new_width, new_height), Image.Resampling.LANCZOS)
         self.tk_image = ImageTk.PhotoImage(self.display_image)
 
-        self.canvas.create_image(canvas_width / 2, canvas_height / 2, image=self.tk_image, anchor=tk.CENTER)
+        self.tk_image_id = self.canvas.create_image(canvas_width / 2, canvas_height / 2,
+                                                    image=self.tk_image, anchor=tk.CENTER)
+
+        # Remember the mapping used by confirm_crop
+        self.image_offset = ((canvas_width - new_width) / 2, (canvas_height - new_height) / 2)
+        self.image_scale = (img_width / new_width, img_height / new_height)
+        self.drawn_canvas_size = (canvas_width, canvas_height)
 
     def on_resize(self, event):
+        # <Configure> fires continuously while the window edge is dragged;
+        # redraw once the size has settled
+        if self.resize_job is not None:
+            self.after_cancel(self.resize_job)
+        self.resize_job = self.after(80, self.redraw_after_resize)
+
+    def redraw_after_resize(self):
+        self.resize_job = None
+        if (self.canvas.winfo_width(), self.canvas.winfo_height()) == self.drawn_canvas_size:
+            return
         self.show_image()
-        if self.current_rect:
-            self.canvas.delete(self.current_rect)
-            self.current_rect = None
+        # The selection was made against the old layout
+        self.current_rect = None
+        self.crop_x1 = None
 
     def on_mouse_press(self, event):
         self.start_x = self.canvas.canvasx(event.x)
@@ -154,23 +212,15 @@ class CropWindow(tk.Toplevel):
             self.start_y = None
 
     def confirm_crop(self):
-        if not hasattr(self, 'crop_x1') or self.crop_x1 is None:
+        if self.crop_x1 is None:
             messagebox.showwarning("Warning", "Please select a crop area first.")
             return
 
-        # Convert canvas coordinates to original image coordinates
+        # Convert canvas coordinates to original image coordinates using
+        # the placement recorded when the image was drawn
         img_width, img_height = self.original_image.size
-        canvas_width = self.canvas.winfo_width()
-        canvas_height = self.canvas.winfo_height()
-
-        scale_x = img_width / self.display_image.width
-        scale_y = img_height / self.display_image.height
-
-        # Calculate offset of the displayed image on the canvas
-        img_on_canvas_width = self.display_image.width
-        img_on_canvas_height = self.display_image.height
-        offset_x = (canvas_width - img_on_canvas_width) / 2
-        offset_y = (canvas_height - img_on_canvas_height) / 2
+        offset_x, offset_y = self.image_offset
+        scale_x, scale_y = self.image_scale
 
         # Adjust crop coordinates relative to the displayed image and then scale
         x1 = int((self.crop_x1 - offset_x) * scale_x)
@@ -195,21 +245,14 @@ class CropWindow(tk.Toplevel):
                                                 "Do you want to overwrite the original image?\n" \
                                                 "No will save as a new file.")
 
+        # The write happens in the background; the window closes right away
         if save_option is True:  # Overwrite
-            cropped_image.save(self.image_path)
-            self.refresh_callback()
-            self.select_callback(os.path.basename(self.image_path))
-            messagebox.showinfo("Success", "Image cropped and overwritten.")
+            self.save_callback(cropped_image, self.image_path, True)
             self.destroy()
         elif save_option is False:  # Save as new file
-            timestamp = datetime.now().strftime("%d%m%Y_%H%M%S")
-            filename_base, ext = os.path.splitext(os.path.basename(self.image_path))
-            new_filename = f"{filename_base}_cropped_{timestamp}{ext}"
-            new_filepath = os.path.join(os.path.dirname(self.image_path), new_filename)
-            cropped_image.save(new_filepath)
-            self.refresh_callback()
-            self.select_callback(new_filename)
-            messagebox.showinfo("Success", f"Image cropped and saved as {new_filename}.")
+            from screenshot_core import crop_path
+            new_filepath = crop_path(self.image_path, datetime.now())
+            self.save_callback(cropped_image, new_filepath, False)
             self.destroy()
         # If None (cancel), do nothing
 
@@ -249,12 +292,72 @@ class OcrResultWindow(tk.Toplevel):
         close_btn.pack(fill=tk.X, padx=10, pady=(0, 10), ipady=5)
 
 
+class RegionSelector(tk.Toplevel):
+    """Translucent overlay over the whole desktop to drag out a box
+
+    Nothing is captured while it is shown; on_selected(box) gets the box
+    in screen coordinates once the overlay is off the screen, so only
+    that rectangle needs to be grabbed and encoded.
+    """
+
+    # Time for the compositor to remove the overlay before the grab
+    CLEAR_DELAY_MS = 80
+
+    def __init__(self, master, bounds, colors, on_selected):
+        super().__init__(master)
+        self.bounds = bounds
+        self.colors = colors
+        self.on_selected = on_selected
+        left, top, right, bottom = bounds
+        self.overrideredirect(True)
+        self.geometry(f"{right - left}x{bottom - top}{left:+d}{top:+d}")
+        self.attributes("-topmost", True)
+        self.attributes("-alpha", 0.3)
+
+        self.canvas = tk.Canvas(self, bg="black", highlightthickness=0, cursor="crosshair")
+        self.canvas.pack(fill=tk.BOTH, expand=True)
+        self.start = None
+        self.rect = None
+        self.canvas.bind("<ButtonPress-1>", self.on_press)
+        self.canvas.bind("<B1-Motion>", self.on_drag)
+        self.canvas.bind("<ButtonRelease-1>", self.on_release)
+        self.bind("<Escape>", lambda event: self.destroy())
+        self.focus_force()
+        self.grab_set()
+
+    def on_press(self, event):
+        self.start = (event.x_root, event.y_root)
+        self.rect = self.canvas.create_rectangle(event.x, event.y, event.x, event.y,
+                                                 outline=self.colors['accent'], width=2)
+
+    def on_drag(self, event):
+        if self.rect is not None:
+            x0, y0 = self.start[0] - self.bounds[0], self.start[1] - self.bounds[1]
+            self.canvas.coords(self.rect, x0, y0, event.x, event.y)
+
+    def on_release(self, event):
+        if self.start is None:
+            return
+        (x0, y0), (x1, y1) = self.start, (event.x_root, event.y_root)
+        box = (min(x0, x1), min(y0, y1), max(x0, x1), max(y0, y1))
+        master = self.master
+        self.destroy()
+        # A click without a drag is a cancel
+        if box[2] - box[0] >= 2 and box[3] - box[1] >= 2:
+            master.after(self.CLEAR_DELAY_MS, self.on_selected, box)
+
+
 class ScreenshotApp:
-    def __init__(self, root):
+    def __init__(self, root, folder=None, startup_report=False):
         self.root = root
         self.root.title("Screenshot Manager")
         self.root.geometry("900x700")
         
+        # Callbacks from worker threads, run by the Tk thread (see post)
+        self.ui_calls = queue.Queue()
+        self.ui_poll_ms = 30
+        self.root.after(self.ui_poll_ms, self.process_ui_calls)
+        
         # Modern color scheme
         self.colors = {
             'bg': '#1e1e2e',  # Dark background
@@ -278,17 +381,94 @@ class ScreenshotApp:
         self.root.configure(bg=self.colors['bg'])
         
         # Screenshot folder
-        self.screenshot_folder = r"C:\Screenshot"
+        self.screenshot_folder = folder or r"C:\Screenshot"
         self.create_screenshot_folder()
         
+        # Decoded previews kept in RAM; rows this far either side of the
+        # selection are decoded in the background
+        self.preview_cache_bytes = 96 * 1024 * 1024
+        self.preview_prefetch_radius = 3
+        
         # Variables
         self.current_preview = None
         self.preview_photo = None
+        self.preview_generation = 0
+        self.preview_future = None
         self.icon = None
-        self.button_icons = {}
-        
-        # Create button icons
-        self.create_button_icons()
+        self.region_selector = None
+        
+        # Capture pipeline settings: encoder threads (None: 2, or one per
+        # core with split captures), how many grabbed frames may wait for
+        # encoding, and what happens when that queue is full ("block",
+        # "drop_oldest" or "drop_newest")
+        self.capture_workers = None
+        self.capture_queue_depth = 4
+        self.capture_queue_policy = "drop_oldest"
+        
+        # How the screen is grabbed; one of capture_backends.CAPTURE_BACKENDS
+        # ("imagegrab", "x11-shm", "synthetic") or "auto"
+        self.capture_backend = "auto"
+        
+        # Storage encoder for new captures; one of encoders.ENCODER_PROFILES
+        # ("png", "png-fast", "png-max", "webp-lossless", "png-palette")
+        self.encoder_profile = "png-fast"
+        
+        # Duplicate captures: compared with the last few captures before
+        # encoding. Threshold 0.0 means pixel-identical; up to 1.0 accepts
+        # increasingly different frames. Action "skip" writes nothing,
+        # "link" saves the file as a hard link to the earlier capture.
+        self.dedupe_enabled = True
+        self.dedupe_threshold = 0.0
+        self.dedupe_action = "skip"
+        
+        # Storage mode: "standalone" writes every capture with the encoder
+        # profile above; "delta" stores changed tiles against a keyframe
+        self.storage_mode = "standalone"
+        
+        # Split captures (standalone storage only): "off" saves one image,
+        # "monitors" one file per monitor, "tiles" a split_grid of
+        # columns x rows files.  The parts are encoded in parallel and
+        # listed together as one capture set.
+        self.split_mode = "off"
+        self.split_grid = (2, 2)
+        
+        # Timelapse (File menu or tray): a capture every interval seconds
+        # for duration seconds (None: until stopped).  The File menu asks
+        # for both and remembers them; the tray starts with these.
+        self.timelapse_interval = 5.0
+        self.timelapse_duration = 60 * 60
+        
+        # OCR runs in worker processes (one per core by default) so the
+        # window stays responsive; selecting several files OCRs them all
+        self.ocr_workers = None
+        
+        # Tesseract language/config and the preprocessing stage (grayscale,
+        # adaptive binarization, text-region detection, scaling text to
+        # target_dpi); see ocr_preprocess.DEFAULT_PREPROCESS.  Filled in
+        # from ocr_pool.DEFAULT_SETTINGS by start_services()
+        self.ocr_settings = None
+        self.ocr_batch = None
+        
+        # Background indexer: OCRs new captures and the backlog of older
+        # screenshots on one idle-priority worker using at most
+        # ocr_index_cpu_share of a core, waiting while the user captures,
+        # crops or runs OCR
+        self.ocr_index_cpu_share = 0.25
+        
+        # File list order; sort_key is one of catalog.SORT_COLUMNS
+        self.sort_key = "captured"
+        self.sort_descending = True
+        
+        # Search box keystrokes are debounced by search_delay_ms
+        self.search_delay_ms = 120
+        self.search_job = None
+        
+        # Built by start_services() once the window is on screen; until
+        # then the list shows an empty source
+        self.core = None
+        self.file_list = SearchResults("", [])
+        self.startup_report = startup_report
+        self.startup_times = {}
         
         # Setup GUI
         self.setup_gui()
@@ -296,17 +476,122 @@ class ScreenshotApp:
         # Setup menu bar
         self.setup_menu()
         
-        # Load existing screenshots
-        self.refresh_file_list()
-        
-        # Register global hotkey for PrintScreen
-        self.setup_hotkey()
+        # The folder scan, caches, workers and hotkey wait for the first frame
+        self.services_started = False
+        self.root.bind("<Map>", self.on_first_map, add="+")
         
         # Handle window close event
         self.root.protocol("WM_DELETE_WINDOW", self.minimize_to_tray)
         self.root.bind("<Control-p>", lambda event: self.print_file())
         self.root.bind("<Control-Shift-O>", lambda event: self.ocr_image())
+        self.root.bind("<Escape>", lambda event: self.cancel_ocr())
 
+    def on_first_map(self, event):
+        """Start the rest of the application once the window is mapped"""
+        if event.widget is not self.root or self.services_started:
+            return
+        self.services_started = True
+        self.root.after_idle(self.start_services)
+        
+    def start_services(self):
+        """Second half of startup, run after the first frame is drawn
+
+        Imports the storage, OCR and cache modules, builds the core and
+        fills the list from a folder scan.
+        """
+        self.root.update_idletasks()
+        self.startup_times["first_frame_ms"] = (time.perf_counter() - STARTED_AT) * 1000
+        if self.startup_report:
+            # Wall clock too, so a launcher can add interpreter start-up
+            self.startup_times["first_frame_at"] = time.time()
+            self.first_frame_modules = set(sys.modules)
+        
+        from concurrent.futures import ThreadPoolExecutor
+        from ocr_pool import DEFAULT_SETTINGS
+        from preview_cache import PreviewCache
+        from screenshot_core import ScreenshotCore
+        from thumbnail_cache import ThumbnailCache
+        
+        self.preview_cache = PreviewCache(self.render_preview,
+                                          budget_bytes=self.preview_cache_bytes)
+        
+        # Crops and exports are written off the Tk thread, one at a time
+        self.crop_writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix="crop-writer")
+        
+        self.ocr_settings = dict(DEFAULT_SETTINGS)
+        self.ocr_settings["preprocess"] = dict(DEFAULT_SETTINGS["preprocess"],
+                                               source_dpi=round(self.root.winfo_fpixels("1i")))
+        
+        # Everything that is not Tk: folder index, metadata catalog,
+        # capture pipeline, OCR pool and cache, search index.  Its
+        # callbacks arrive on worker threads and are passed to Tk here;
+        # on_changed runs on the Tk thread, where the list is changed.
+        self.core = ScreenshotCore(
+            self.screenshot_folder,
+            encoder_profile=self.encoder_profile,
+            capture_backend=self.capture_backend,
+            storage_mode=self.storage_mode,
+            split_mode=self.split_mode,
+            split_grid=self.split_grid,
+            capture_workers=self.capture_workers,
+            capture_queue_depth=self.capture_queue_depth,
+            capture_queue_policy=self.capture_queue_policy,
+            dedupe=self.dedupe_enabled,
+            dedupe_threshold=self.dedupe_threshold,
+            dedupe_action=self.dedupe_action,
+            ocr_workers=self.ocr_workers,
+            ocr_settings=self.ocr_settings,
+            ocr_index_cpu_share=self.ocr_index_cpu_share,
+            sort=self.sort_key,
+            descending=self.sort_descending,
+            on_saved=lambda path: self.post(self.on_screenshot_saved, path),
+            on_capture_error=lambda path, e: self.post(self.on_screenshot_failed, path, e),
+            on_dropped=lambda path: self.post(self.on_screenshot_dropped, path),
+            on_ocr_progress=lambda batch: self.post(self.on_ocr_progress, batch),
+            on_ocr_done=lambda batch: self.post(self.on_ocr_done, batch),
+            on_indexed=lambda name: self.post(self.on_indexed, name),
+            on_scanned=lambda names: self.post(self.on_catalog_scanned, names),
+            on_changed=self.apply_index_diff)
+        self.file_list = self.core.file_list
+        
+        self.file_listbox.set_source(self.file_list)
+        
+        # Preview thumbnails, inside the core's private cache folder
+        self.thumbnail_cache = ThumbnailCache(os.path.join(self.core.cache_folder, "thumbnails"))
+        
+        # Load existing screenshots
+        self.refresh_file_list()
+        self.startup_times["list_ms"] = (time.perf_counter() - STARTED_AT) * 1000
+        
+        # Pick up files added, removed or renamed by other tools
+        self.setup_folder_watcher()
+        
+        # Fill in metadata of older files and OCR those that are not
+        # searchable yet, in the background
+        self.core.start_background()
+        
+        # The tray menu hides Start Timelapse until core exists
+        self.update_tray_menu()
+        
+        # Remove keyframes whose delta entries were all deleted
+        threading.Thread(target=self.core.delta_store.prune_keyframes,
+                         args=(self.screenshot_folder,), daemon=True).start()
+        
+        if self.startup_report:
+            self.root.after_idle(self.print_startup_report)
+        else:
+            # Register global hotkey for PrintScreen
+            self.setup_hotkey()
+        
+    def print_startup_report(self):
+        """Print startup timings as JSON and exit (--startup-report)"""
+        import json
+        self.startup_times["ready_ms"] = (time.perf_counter() - STARTED_AT) * 1000
+        print(json.dumps(dict(self.startup_times, files=len(self.file_list),
+                              first_frame_modules=sorted(self.first_frame_modules))))
+        sys.stdout.flush()
+        self._quit_app()
+        
     def create_screenshot_folder(self):
         """Create screenshot folder if it doesn't exist"""
         if not os.path.exists(self.screenshot_folder):
@@ -315,38 +600,44 @@ class ScreenshotApp:
             except Exception as e:
                 messagebox.showerror("Error", f"Failed to create folder: {str(e)}")
                 
-    def create_button_icons(self):
-        """Create icons for buttons"""
-        # Icon size
-        icon_size = 24
-        
-        # Refresh icon (circular arrow)
-        refresh_img = PILImage.new('RGBA', (icon_size, icon_size), (0, 0, 0, 0))
-        # Simple representation - we'll use text-based icons
-        
-        # Rename icon (pencil/edit)
-        rename_img = PILImage.new('RGBA', (icon_size, icon_size), (0, 0, 0, 0))
-        
-        # Delete icon (X or trash)
-        delete_img = PILImage.new('RGBA', (icon_size, icon_size), (0, 0, 0, 0))
-        
-        # Folder icon
-        folder_img = PILImage.new('RGBA', (icon_size, icon_size), (0, 0, 0, 0))
-        
-        # Convert to PhotoImage
-        self.button_icons['refresh'] = ImageTk.PhotoImage(refresh_img)
-        self.button_icons['rename'] = ImageTk.PhotoImage(rename_img)
-        self.button_icons['delete'] = ImageTk.PhotoImage(delete_img)
-        self.button_icons['folder'] = ImageTk.PhotoImage(folder_img)
-        
     def setup_menu(self):
         """Setup the menu bar"""
         menubar = tk.Menu(self.root)
         self.root.config(menu=menubar)
         
+        # File menu
+        file_menu = tk.Menu(menubar, tearoff=0)
+        menubar.add_cascade(label="File", menu=file_menu)
+        file_menu.add_command(label="Export as PNG...", command=self.export_as_png)
+        file_menu.add_separator()
+        file_menu.add_command(label="Start Timelapse...", command=self.ask_timelapse)
+        file_menu.add_command(label="Stop Timelapse", command=self.stop_timelapse)
+        file_menu.add_separator()
+        self.pause_indexing_var = tk.BooleanVar(value=False)
+        file_menu.add_checkbutton(label="Pause Background OCR",
+                                  variable=self.pause_indexing_var,
+                                  command=self.toggle_indexing)
+        
+        # View menu: list order, read from the catalog's indexes
+        view_menu = tk.Menu(menubar, tearoff=0)
+        menubar.add_cascade(label="View", menu=view_menu)
+        self.sort_key_var = tk.StringVar(value=self.sort_key)
+        self.sort_descending_var = tk.BooleanVar(value=self.sort_descending)
+        # Keys of catalog.SORT_COLUMNS (not imported here: see start_services)
+        sort_labels = {"captured": "Capture Time", "name": "Name", "size": "File Size",
+                       "dimensions": "Dimensions", "encoder": "Encoder", "hash": "Content Hash"}
+        for key, label in sort_labels.items():
+            view_menu.add_radiobutton(label=f"Sort by {label}", value=key,
+                                      variable=self.sort_key_var, command=self.change_sort)
+        view_menu.add_separator()
+        view_menu.add_checkbutton(label="Descending", variable=self.sort_descending_var,
+                                  command=self.change_sort)
+        
         # Help menu
         help_menu = tk.Menu(menubar, tearoff=0)
         menubar.add_cascade(label="Help", menu=help_menu)
+        help_menu.add_command(label="Preview Cache Statistics", command=self.show_cache_stats)
+        help_menu.add_command(label="Background OCR Status", command=self.show_indexer_status)
         help_menu.add_command(label="About", command=self.show_about)
         
     def show_about(self):
@@ -420,7 +711,8 @@ class ScreenshotApp:
         
         # Info Label
         info_label = tk.Label(main_frame, 
-                              text="Press Ctrl+PrtSc to capture screenshot", 
+                              text="Ctrl+PrtSc: screen   Ctrl+Shift+PrtSc: region   "
+                                   "Ctrl+Alt+PrtSc: window", 
                               font=("Consolas", 11),
                               bg=self.colors['bg'], fg=self.colors['fg'])
         info_label.grid(row=1, column=0, pady=(0, 10))
@@ -519,7 +811,7 @@ class ScreenshotApp:
         left_frame = tk.Frame(paned_frame, bg=self.colors['bg'], width=280)
         left_frame.grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
         left_frame.grid_propagate(False)  # Prevent frame from shrinking
-        left_frame.rowconfigure(1, weight=1)
+        left_frame.rowconfigure(2, weight=1)
         left_frame.columnconfigure(0, weight=1)
         
         # File list label
@@ -528,24 +820,36 @@ class ScreenshotApp:
                               bg=self.colors['bg'], fg=self.colors['accent'])
         list_label.grid(row=0, column=0, pady=(0, 5), sticky=tk.W)
         
+        # Search box: filters the list by OCR text as you type
+        self.search_var = tk.StringVar()
+        search_entry = tk.Entry(left_frame, textvariable=self.search_var,
+                                font=("Consolas", 12),
+                                bg=self.colors['canvas_bg'], fg=self.colors['fg'],
+                                insertbackground=self.colors['fg'],
+                                relief=tk.FLAT)
+        search_entry.grid(row=1, column=0, pady=(0, 5), sticky=(tk.W, tk.E), ipady=4)
+        search_entry.bind("<Escape>", lambda event: self.clear_search())
+        search_entry.bind("<Return>", lambda event: self.run_search())
+        self.search_var.trace_add("write", lambda *args: self.schedule_search())
+        
         # Listbox frame
         listbox_frame = tk.Frame(left_frame, bg=self.colors['bg'])
-        listbox_frame.grid(row=1, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
+        listbox_frame.grid(row=2, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
         
         # Scrollbar for listbox
         scrollbar = tk.Scrollbar(listbox_frame, bg=self.colors['button_bg'])
         scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
         
-        # Listbox for screenshots
-        self.file_listbox = tk.Listbox(listbox_frame, 
-                                       yscrollcommand=scrollbar.set,
-                                       font=("Consolas", 14),
-                                       bg=self.colors['button_bg'],
-                                       fg=self.colors['fg'],
-                                       selectbackground=self.colors['accent'],
-                                       selectforeground='#000000',
-                                       bd=0,
-                                       highlightthickness=0)
+        # Listbox for screenshots (virtualized: only visible rows exist)
+        self.file_listbox = VirtualListbox(listbox_frame, self.file_list,
+                                           yscrollcommand=scrollbar.set,
+                                           font=("Consolas", 14),
+                                           bg=self.colors['button_bg'],
+                                           fg=self.colors['fg'],
+                                           selectbackground=self.colors['accent'],
+                                           selectforeground='#000000',
+                                           selectmode="extended",
+                                           label=self.list_label)
         self.file_listbox.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
         scrollbar.config(command=self.file_listbox.yview)
         
@@ -579,15 +883,41 @@ class ScreenshotApp:
                              font=('Consolas', 10), padx=10, pady=5)
         status_bar.grid(row=4, column=0, sticky=(tk.W, tk.E), pady=(10, 0))
         
+        # OCR progress, only shown while OCR is running
+        self.ocr_progress_frame = tk.Frame(main_frame, bg=self.colors['bg'])
+        self.ocr_progress_frame.grid(row=5, column=0, sticky=(tk.W, tk.E), pady=(5, 0))
+        self.ocr_progress_frame.columnconfigure(0, weight=1)
+        self.ocr_progress = ttk.Progressbar(self.ocr_progress_frame, mode="determinate")
+        self.ocr_progress.grid(row=0, column=0, sticky=(tk.W, tk.E), padx=(0, 5))
+        cancel_ocr_btn = tk.Button(self.ocr_progress_frame, text="Cancel OCR",
+                                   command=self.cancel_ocr,
+                                   bg=self.colors['delete'], fg='#000000',
+                                   font=('Consolas', 10, 'bold'),
+                                   relief=tk.FLAT, bd=0, cursor='hand2',
+                                   activebackground=self.colors['button_active'])
+        cancel_ocr_btn.grid(row=0, column=1, ipadx=5)
+        self.ocr_progress_frame.grid_remove()
+        
     def setup_hotkey(self):
-        """Setup global hotkey for Ctrl+PrintScreen"""
+        """Setup global hotkeys: Ctrl+PrintScreen captures the screen,
+        Ctrl+Shift+PrintScreen a region, Ctrl+Alt+PrintScreen the active
+        window"""
         def on_printscreen():
             self.take_screenshot()
             
+        def on_region():
+            self.post(self.select_region)
+            
+        def on_window():
+            self.take_screenshot(active_window=True)
+            
         # Run keyboard listener in separate thread
         def listen_keyboard():
             try:
+                import keyboard
                 keyboard.add_hotkey('ctrl+print screen', on_printscreen)
+                keyboard.add_hotkey('ctrl+shift+print screen', on_region)
+                keyboard.add_hotkey('ctrl+alt+print screen', on_window)
                 keyboard.wait()
             except Exception as e:
                 print(f"Keyboard listener error: {str(e)}")
@@ -595,93 +925,295 @@ class ScreenshotApp:
         keyboard_thread = threading.Thread(target=listen_keyboard, daemon=True)
         keyboard_thread.start()
         
-    def take_screenshot(self):
-        """Capture screenshot and save to folder"""
+    def setup_folder_watcher(self):
+        """Feed folder change events into the file list without rescanning"""
+        from folder_watcher import FolderWatcher
+        self.folder_watcher = FolderWatcher(
+            self.screenshot_folder,
+            self.on_folder_changed,
+            deliver=self.post,
+            accept=self.core.file_index.is_screenshot)
+        self.folder_watcher.start()
+        
+    def on_folder_changed(self, names, rescan):
+        """Apply a coalesced batch of folder changes (Tk thread)"""
+        if rescan:
+            self.refresh_file_list()
+        else:
+            self.update_file_list(names)
+        
+    def take_screenshot(self, bbox=None, active_window=False):
+        """Capture screenshot and queue it for saving
+
+        Runs on the hotkey thread: only the raw frame is grabbed here, the
+        PNG encode and disk write happen on the capture pipeline workers.
+        bbox or active_window limit the capture to that part of the screen.
+        """
         try:
-            # Capture screenshot
-            screenshot = ImageGrab.grab()
-            
-            # Generate filename
-            timestamp = datetime.now().strftime("%d%m%Y_%H%M%S")
-            filename = f"ss_{timestamp}.png"
-            filepath = os.path.join(self.screenshot_folder, filename)
-            
-            # Save screenshot
-            screenshot.save(filepath, "PNG")
+            # Grab, dedupe and hand the frame to the encoder pool
+            filepath, duplicate_of = self.core.capture(bbox=bbox, active_window=active_window)
+            if filepath is None:
+                self.post(self.on_screenshot_duplicate, duplicate_of)
             
-            # Update status
-            self.status_var.set(f"Screenshot saved: {filename}")
-            
-            # Refresh file list
-            self.refresh_file_list()
+        except Exception as e:
+            self.post(self.on_screenshot_failed, None, e)
             
-            # Select the new file
+    def select_region(self):
+        """Let the user drag out a box, then capture only that (Tk thread)"""
+        if self.core is None or self.region_selector is not None:
+            return
+        self.region_selector = RegionSelector(self.root, self.desktop_bounds(), self.colors,
+                                              lambda box: self.take_screenshot(bbox=box))
+        self.region_selector.bind("<Destroy>", self.on_region_selector_closed, add="+")
+        
+    def on_region_selector_closed(self, event):
+        if event.widget is self.region_selector:
+            self.region_selector = None
+        
+    def desktop_bounds(self):
+        """Box of the whole desktop (every monitor) in screen coordinates"""
+        if sys.platform == "win32":
+            import win32api
+            # SM_XVIRTUALSCREEN, SM_YVIRTUALSCREEN, SM_CXVIRTUALSCREEN, SM_CYVIRTUALSCREEN
+            left, top, width, height = (win32api.GetSystemMetrics(i) for i in (76, 77, 78, 79))
+            return left, top, left + width, top + height
+        return 0, 0, self.root.winfo_screenwidth(), self.root.winfo_screenheight()
+        
+    def on_screenshot_saved(self, filepath):
+        """Handle a finished capture write (Tk thread)"""
+        filename = os.path.basename(filepath)
+        
+        # Add just this file to the list
+        self.update_file_list([filename])
+        
+        # A timelapse reports its own progress and leaves the selection
+        # (and the preview decode) alone; manual captures taken meanwhile
+        # are reported as usual
+        if self.is_timelapse_frame(filepath):
+            return
+        
+        # Select the new file (the first part of a capture set)
+        if part_index(filename) in (None, 1):
             self.select_file_by_name(filename)
+        
+        # Update status
+        self.status_var.set(f"Screenshot saved: {filename}")
+        
+    def is_timelapse_frame(self, filepath):
+        """True if filepath was written by the timelapse session"""
+        return self.core.timelapse is not None and self.core.timelapse.owns(filepath)
+        
+    def on_screenshot_duplicate(self, filepath):
+        """Report a capture skipped as a duplicate (Tk thread)"""
+        filename = os.path.basename(filepath)
+        self.select_file_by_name(filename)
+        self.status_var.set(f"Duplicate of {filename} - not saved")
+        
+    def ask_timelapse(self):
+        """Ask for the interval and duration, then start a timelapse (File menu)"""
+        if self.core is None:
+            return
+        if self.core.timelapse_running():
+            self.status_var.set("A timelapse is already running - File > Stop Timelapse")
+            return
+        interval = simpledialog.askfloat("Timelapse", "Seconds between captures:",
+                                         initialvalue=self.timelapse_interval,
+                                         minvalue=0.1, parent=self.root)
+        if interval is None:
+            return
+        minutes = simpledialog.askfloat(
+            "Timelapse", "Run for how many minutes? (0 = until stopped)",
+            initialvalue=(self.timelapse_duration or 0) / 60, minvalue=0, parent=self.root)
+        if minutes is None:
+            return
+        self.timelapse_interval = interval
+        self.timelapse_duration = minutes * 60 or None
+        self.start_timelapse()
+        
+    def start_timelapse(self):
+        """Start a timelapse with the current settings (Tk thread)"""
+        if self.core is None or self.core.timelapse_running():
+            return
+        try:
+            self.core.start_timelapse(
+                self.timelapse_interval, duration=self.timelapse_duration,
+                on_frame=lambda stats: self.post(self.on_timelapse_frame, stats),
+                on_done=lambda stats: self.post(self.on_timelapse_done, stats))
+        except (ValueError, RuntimeError) as e:
+            messagebox.showerror("Error", f"Failed to start timelapse: {str(e)}")
+            return
+        length = f"{self.timelapse_duration / 60:g} min" if self.timelapse_duration \
+            else "until stopped"
+        self.status_var.set(f"Timelapse started: every {self.timelapse_interval:g} s, {length}")
+        self.update_tray_menu()
+        
+    def stop_timelapse(self):
+        """Stop the running timelapse (File menu or tray, Tk thread)"""
+        if self.core is not None and self.core.timelapse_running():
+            # on_timelapse_done reports the final stats
+            self.core.timelapse.stop()
             
-        except Exception as e:
-            messagebox.showerror("Error", f"Failed to capture screenshot: {str(e)}")
-            self.status_var.set("Error capturing screenshot")
+    def on_timelapse_frame(self, stats):
+        """Show the session stats after every timelapse tick (Tk thread)"""
+        remaining = stats.remaining()
+        left = f" - {int(remaining // 60)}:{int(remaining % 60):02d} left" \
+            if remaining is not None else ""
+        self.status_var.set(f"Timelapse: {stats.summary()}{left}")
+        
+    def on_timelapse_done(self, stats):
+        """Report the finished session (Tk thread)"""
+        if stats.error is not None:
+            self.status_var.set(f"Timelapse stopped by an error: {stats.error} - "
+                                f"{stats.summary()}")
+        else:
+            self.status_var.set(f"Timelapse finished: {stats.summary()}")
+        self.update_tray_menu()
+        
+    def on_screenshot_failed(self, filepath, error):
+        """Report a failed capture or write (Tk thread)"""
+        if filepath:
+            self.core.forget_capture(filepath)
+        messagebox.showerror("Error", f"Failed to capture screenshot: {str(error)}")
+        self.status_var.set("Error capturing screenshot")
+        
+    def on_screenshot_dropped(self, filepath):
+        """Report a frame dropped because the encode queue was full (Tk thread)"""
+        self.core.forget_capture(filepath)
+        if not self.is_timelapse_frame(filepath):
+            self.status_var.set(f"Capture queue full - dropped {os.path.basename(filepath)}")
             
     def refresh_file_list(self):
-        """Refresh the file list"""
-        self.file_listbox.delete(0, tk.END)
-        
+        """Rescan the folder and apply the changes to the file list"""
+        if self.core is None:
+            return
         try:
-            files = [f for f in os.listdir(self.screenshot_folder) 
-                    if f.endswith('.png')]
-            files.sort(reverse=True)  # Most recent first
+            self.core.refresh()
+            self.status_var.set(f"Found {len(self.file_list)} screenshot(s)")
             
-            for file in files:
-                self.file_listbox.insert(tk.END, file)
-                
-            self.status_var.set(f"Found {len(files)} screenshot(s)")
+        except Exception as e:
+            messagebox.showerror("Error", f"Failed to list files: {str(e)}")
             
+    def update_file_list(self, names):
+        """Re-check only the given file names and update the file list"""
+        try:
+            self.core.update(names)
         except Exception as e:
             messagebox.showerror("Error", f"Failed to list files: {str(e)}")
             
+    def apply_index_diff(self, diff, full=False):
+        """Bring the preview and the file list in line with a folder diff
+
+        The core has already updated the catalog, its view and the search
+        index; full is set after a complete folder scan.
+        """
+        for name in diff.changed:
+            self.preview_cache.invalidate(os.path.join(self.screenshot_folder, name))
+            
+        # The list reads rows straight from the catalog view, so it only
+        # needs a redraw of the visible rows
+        if diff or full:
+            if self.file_listbox.source is self.file_list:
+                self.file_listbox.refresh()
+            else:
+                self.run_search(highlight=False)
+            
+    def list_label(self, row, name):
+        """Row text; the parts of a capture set are bracketed together"""
+        group = capture_set(name)
+        if group is None:
+            return name
+        source = self.file_listbox.source
+        above = row > 0 and capture_set(source[row - 1]) == group
+        below = row + 1 < len(source) and capture_set(source[row + 1]) == group
+        if not (above or below):
+            return name
+        return f"{'├' if above and below else '└' if above else '┌'} {name}"
+        
     def on_file_select(self, event):
         """Handle file selection"""
         selection = self.file_listbox.curselection()
         if selection:
-            filename = self.file_listbox.get(selection[0])
-            self.show_preview(filename)
+            # With several rows selected, preview the one last clicked
+            row = self.file_listbox.index(tk.ACTIVE)
+            if row not in selection:
+                row = selection[0]
+            self.show_preview(self.file_listbox.get(row))
+            self.prefetch_neighbours(row)
+            
+    def preview_box(self):
+        """Size of the preview canvas, with a default before it is rendered"""
+        canvas_width = self.preview_canvas.winfo_width()
+        canvas_height = self.preview_canvas.winfo_height()
+        
+        # Use default size if canvas not yet rendered
+        if canvas_width <= 1:
+            canvas_width = 500
+        if canvas_height <= 1:
+            canvas_height = 500
+        return canvas_width, canvas_height
+            
+    def render_preview(self, filepath, box):
+        """Decode and scale a screenshot to fit box (safe off the Tk thread)"""
+        from PIL import Image
+        from preview_cache import fit_size
+        # Load the smallest cached thumbnail that covers the canvas
+        image, source_size = self.thumbnail_cache.get(filepath, box)
+        
+        # Resize image
+        return image.resize(fit_size(source_size, box), Image.Resampling.LANCZOS)
+            
+    def source_size(self, filepath):
+        """(width, height) of a screenshot without decoding its pixels:
+        from the catalog, else the file header (or delta manifest)"""
+        from delta_store import screenshot_size
+        info = self.core.info(os.path.basename(filepath))
+        if info and info.get("width"):
+            return info["width"], info["height"]
+        return screenshot_size(filepath)
+        
+    def render_quick_preview(self, filepath, box):
+        """Cheap first frame from the smallest cached thumbnail
+        
+        Without a thumbnail this is a flat placeholder of the preview's
+        size: the source is never decoded on the Tk thread, the preview
+        worker already does that for the real frame.
+        """
+        from PIL import Image
+        from preview_cache import fit_size, quick_preview
+        # Only the size of the source is needed, not its pixels
+        size = fit_size(self.source_size(filepath), box)
+        image = self.thumbnail_cache.peek(filepath)
+        if image is None:
+            return Image.new("RGB", size, self.colors['button_bg'])
+        return quick_preview(image, size)
             
     def show_preview(self, filename):
-        """Show preview of selected screenshot"""
+        """Show preview of selected screenshot
+
+        A cheap first frame is shown straight away; the LANCZOS render
+        replaces it from a background worker unless the selection changes
+        first.
+        """
         filepath = os.path.join(self.screenshot_folder, filename)
         
+        # Abandon the high-quality render of the previous selection
+        self.preview_generation += 1
+        generation = self.preview_generation
+        if self.preview_future is not None:
+            self.preview_future.cancel()
+            self.preview_future = None
+        
         try:
-            # Load image
-            image = Image.open(filepath)
-            
-            # Get canvas size
-            canvas_width = self.preview_canvas.winfo_width()
-            canvas_height = self.preview_canvas.winfo_height()
-            
-            # Use default size if canvas not yet rendered
-            if canvas_width <= 1:
-                canvas_width = 500
-            if canvas_height <= 1:
-                canvas_height = 500
-                
-            # Calculate scaling to fit canvas
-            img_width, img_height = image.size
-            scale = min(canvas_width / img_width, canvas_height / img_height, 1)
-            new_width = int(img_width * scale * 0.95)  # 95% to add padding
-            new_height = int(img_height * scale * 0.95)
+            box = self.preview_box()
+            future = self.preview_cache.get_async(filepath, box)
             
-            # Resize image
-            image = image.resize((new_width, new_height), Image.Resampling.LANCZOS)
-            
-            # Convert to PhotoImage
-            self.preview_photo = ImageTk.PhotoImage(image)
-            
-            # Clear canvas and display image
-            self.preview_canvas.delete("all")
-            self.preview_canvas.create_image(canvas_width // 2, 
-                                            canvas_height // 2, 
-                                            image=self.preview_photo, 
-                                            anchor=tk.CENTER)
+            if future.done() and not future.cancelled() and future.result() is not None:
+                self.display_preview(future.result(), box)
+            else:
+                self.display_preview(self.render_quick_preview(filepath, box), box)
+                self.preview_future = future
+                future.add_done_callback(
+                    lambda f: self.post(self.on_preview_rendered, f, generation, box))
             
             self.current_preview = filename
             self.status_var.set(f"Viewing: {filename}")
@@ -689,15 +1221,146 @@ class ScreenshotApp:
         except Exception as e:
             messagebox.showerror("Error", f"Failed to load preview: {str(e)}")
             
+    def on_preview_rendered(self, future, generation, box):
+        """Swap in the high-quality preview if it is still wanted (Tk thread)"""
+        if generation != self.preview_generation or future.cancelled():
+            return
+        self.preview_future = None
+        if future.exception() is None and future.result() is not None:
+            self.display_preview(future.result(), box)
+            
+    def display_preview(self, image, box):
+        """Put a ready-to-show image on the preview canvas"""
+        canvas_width, canvas_height = box
+        
+        # Convert to PhotoImage
+        from PIL import ImageTk
+        self.preview_photo = ImageTk.PhotoImage(image)
+        
+        # Clear canvas and display image
+        self.preview_canvas.delete("all")
+        self.preview_canvas.create_image(canvas_width // 2, 
+                                        canvas_height // 2, 
+                                        image=self.preview_photo, 
+                                        anchor=tk.CENTER)
+            
+    def prefetch_neighbours(self, index):
+        """Decode the previews around row index in the background"""
+        radius = self.preview_prefetch_radius
+        last = self.file_listbox.size() - 1
+        rows = sorted(range(max(0, index - radius), min(last, index + radius) + 1),
+                      key=lambda row: abs(row - index))
+        filepaths = [os.path.join(self.screenshot_folder, self.file_listbox.get(row))
+                     for row in rows if row != index]
+        self.preview_cache.prefetch(filepaths, self.preview_box())
+        
+    def show_cache_stats(self):
+        """Show preview cache counters"""
+        stats = self.preview_cache.stats()
+        messagebox.showinfo("Preview Cache",
+                            f"Hits: {stats['hits']}\n"
+                            f"Misses: {stats['misses']}\n"
+                            f"Hit rate: {stats['hit_rate']:.0%}\n"
+                            f"Prefetched: {stats['prefetched']}\n"
+                            f"Entries: {stats['entries']}\n"
+                            f"Memory: {stats['bytes'] / 1048576:.1f} MB of "
+                            f"{stats['budget_bytes'] / 1048576:.0f} MB")
+            
+    def toggle_indexing(self):
+        """Pause or resume the background OCR indexer (File menu)"""
+        if self.pause_indexing_var.get():
+            self.core.ocr_indexer.pause("user")
+            self.status_var.set("Background OCR paused")
+        else:
+            self.core.ocr_indexer.resume("user")
+            self.status_var.set("Background OCR resumed")
+            
+    def show_indexer_status(self):
+        """Show background OCR indexer progress"""
+        indexer = self.core.ocr_indexer
+        if indexer.is_paused("unavailable"):
+            state = "Stopped (Tesseract OCR not installed)"
+        elif indexer.is_paused("user"):
+            state = "Paused"
+        else:
+            state = "Running" if indexer.pending() else "Idle"
+        messagebox.showinfo("Background OCR",
+                            f"State: {state}\n"
+                            f"Searchable screenshots: {len(self.core.search_index)}\n"
+                            f"Indexed this session: {indexer.indexed}\n"
+                            f"Waiting: {indexer.pending()}\n"
+                            f"Failed: {len(indexer.failed)}")
+            
+    def on_indexed(self, name):
+        """A file became searchable in the background (Tk thread)"""
+        if self.file_listbox.source is not self.file_list:
+            self.run_search(highlight=False)
+            
+    def on_catalog_scanned(self, names):
+        """Metadata of names was filled in by the scanner (Tk thread)"""
+        if self.sort_key in ("captured", "name"):
+            return
+        self.file_list.update(names)
+        if self.file_listbox.source is self.file_list:
+            self.file_listbox.refresh()
+            
+    def change_sort(self):
+        """Re-order the file list from the View menu"""
+        self.sort_key = self.sort_key_var.get()
+        self.sort_descending = self.sort_descending_var.get()
+        self.file_list.set_sort(self.sort_key, self.sort_descending)
+        if self.file_listbox.source is self.file_list:
+            self.file_listbox.refresh()
+            selection = self.file_listbox.curselection()
+            if selection:
+                self.file_listbox.see(selection[0])
+            
+    def schedule_search(self):
+        """Run the search shortly after the last keystroke"""
+        if self.search_job is not None:
+            self.root.after_cancel(self.search_job)
+        self.search_job = self.root.after(self.search_delay_ms, self.run_search)
+        
+    def run_search(self, highlight=True):
+        """Filter the file list to screenshots whose OCR text matches"""
+        self.search_job = None
+        text = self.search_var.get().strip()
+        if self.core is None:
+            return
+        if not text:
+            if self.file_listbox.source is not self.file_list:
+                self.file_listbox.set_source(self.file_list)
+                self.status_var.set(f"Found {len(self.file_list)} screenshot(s)")
+            return
+            
+        names = self.core.search(text)
+        self.file_listbox.set_source(SearchResults(text, names))
+        if not highlight:
+            return
+        if not names:
+            self.status_var.set(f"No screenshots contain \"{text}\"")
+            return
+            
+        # Highlight the best match and show where the text was found
+        best = names[0]
+        self.select_file_by_name(best)
+        snippet = " ".join(self.core.search_index.snippet(best, text).split())
+        self.status_var.set(f"{len(names)} match(es) - {best}: {snippet}")
+        
+    def clear_search(self):
+        """Empty the search box and show every screenshot again"""
+        self.search_var.set("")
+        self.run_search()
+        return "break"
+        
     def select_file_by_name(self, filename):
         """Select a file in the listbox by name"""
-        for i in range(self.file_listbox.size()):
-            if self.file_listbox.get(i) == filename:
-                self.file_listbox.selection_clear(0, tk.END)
-                self.file_listbox.selection_set(i)
-                self.file_listbox.see(i)
-                self.show_preview(filename)
-                break
+        i = self.file_listbox.source.index_of(filename)
+        if i is not None:
+            self.file_listbox.selection_clear(0, tk.END)
+            self.file_listbox.selection_set(i)
+            self.file_listbox.see(i)
+            self.show_preview(filename)
                 
     def rename_file(self):
         """Rename selected file"""
@@ -707,35 +1370,22 @@ class ScreenshotApp:
             return
             
         old_filename = self.file_listbox.get(selection[0])
-        old_filepath = os.path.join(self.screenshot_folder, old_filename)
+        old_stem = os.path.splitext(old_filename)[0]
         
         # Get new filename
         new_filename = simpledialog.askstring("Rename File", 
                                              "Enter new filename (without extension):",
-                                             initialvalue=old_filename.replace('.png', ''))
+                                             initialvalue=old_stem)
         
         if new_filename:
-            # Add extension if not provided
-            if not new_filename.endswith('.png'):
-                new_filename += '.png'
-                
-            new_filepath = os.path.join(self.screenshot_folder, new_filename)
-            
             try:
-                # Check if file already exists
-                if os.path.exists(new_filepath):
-                    messagebox.showerror("Error", "A file with that name already exists")
-                    return
-                    
-                # Rename file
-                os.rename(old_filepath, new_filepath)
-                
-                # Refresh list and select renamed file
-                self.refresh_file_list()
+                # Keeps the extension; the list is updated by the core
+                new_filename = self.core.rename(old_filename, new_filename)
                 self.select_file_by_name(new_filename)
-                
                 self.status_var.set(f"Renamed to: {new_filename}")
                 
+            except FileExistsError:
+                messagebox.showerror("Error", "A file with that name already exists")
             except Exception as e:
                 messagebox.showerror("Error", f"Failed to rename file: {str(e)}")
                 
@@ -747,15 +1397,13 @@ class ScreenshotApp:
             return
             
         filename = self.file_listbox.get(selection[0])
-        filepath = os.path.join(self.screenshot_folder, filename)
         
         # Confirm deletion
         if messagebox.askyesno("Confirm Delete", 
                               f"Are you sure you want to delete '{filename}'?"):
             try:
-                os.remove(filepath)
+                self.core.delete(filename)
                 self.preview_canvas.delete("all")
-                self.refresh_file_list()
                 self.status_var.set(f"Deleted: {filename}")
             except Exception as e:
                 messagebox.showerror("Error", f"Failed to delete file: {str(e)}")
@@ -778,6 +1426,15 @@ class ScreenshotApp:
         filepath = os.path.join(self.screenshot_folder, filename)
 
         try:
+            import win32api
+            from delta_store import export_png, is_delta
+            
+            # The shell cannot print delta entries; print a PNG copy instead
+            if is_delta(filepath):
+                import tempfile
+                filepath = export_png(filepath, os.path.join(
+                    tempfile.gettempdir(), os.path.splitext(filename)[0] + ".png"))
+                
             win32api.ShellExecute(
                 0,
                 "print",
@@ -802,10 +1459,80 @@ class ScreenshotApp:
         filepath = os.path.join(self.screenshot_folder, filename)
 
         try:
-            CropWindow(self.root, filepath, self.colors, self.refresh_file_list, self.select_file_by_name)
+            window = CropWindow(self.root, filepath, self.colors, self.save_crop)
         except Exception as e:
             messagebox.showerror("Error", f"Failed to open crop window: {str(e)}")
-
+            return
+            
+        # No background OCR while the crop window is open
+        self.core.ocr_indexer.pause("crop")
+        window.bind("<Destroy>", lambda event: event.widget is window and
+                    self.core.ocr_indexer.resume("crop"))
+
+    def save_crop(self, image, filepath, overwrite):
+        """Write a cropped image on the crop writer thread"""
+        filename = os.path.basename(filepath)
+        self.status_var.set(f"Saving crop: {filename}...")
+        
+        def write():
+            self.core.save_image(image, filepath)
+            self.thumbnail_cache.update(filepath, image)
+            
+        future = self.crop_writer.submit(write)
+        future.add_done_callback(
+            lambda f: self.post(self.on_crop_saved, filepath, overwrite, f.exception()))
+        
+    def on_crop_saved(self, filepath, overwrite, error):
+        """Update the list entry and preview for a written crop (Tk thread)"""
+        filename = os.path.basename(filepath)
+        if error is not None:
+            messagebox.showerror("Error", f"Failed to save cropped image: {str(error)}")
+            self.status_var.set("Error saving crop")
+            return
+            
+        self.preview_cache.invalidate(filepath)
+        self.update_file_list([filename])
+        self.select_file_by_name(filename)
+        
+        if overwrite:
+            self.status_var.set(f"Image cropped and overwritten: {filename}")
+        else:
+            self.status_var.set(f"Image cropped and saved as {filename}")
+        
+    def export_as_png(self):
+        """Save the selected screenshot (of any storage kind) as a plain PNG"""
+        selection = self.file_listbox.curselection()
+        if not selection:
+            messagebox.showwarning("Warning", "Please select a file to export")
+            return
+            
+        filename = self.file_listbox.get(selection[0])
+        filepath = os.path.join(self.screenshot_folder, filename)
+        dest = filedialog.asksaveasfilename(
+            title="Export as PNG",
+            initialdir=self.screenshot_folder,
+            initialfile=os.path.splitext(filename)[0] + ".png",
+            defaultextension=".png",
+            filetypes=[("PNG image", "*.png")])
+        if not dest:
+            return
+            
+        self.status_var.set(f"Exporting {filename}...")
+        from delta_store import export_png
+        future = self.crop_writer.submit(export_png, filepath, dest)
+        future.add_done_callback(
+            lambda f: self.post(self.on_exported, dest, f.exception()))
+        
+    def on_exported(self, dest, error):
+        """Report a finished PNG export (Tk thread)"""
+        if error is not None:
+            messagebox.showerror("Error", f"Failed to export image: {str(error)}")
+            self.status_var.set("Error exporting image")
+            return
+        if os.path.dirname(os.path.abspath(dest)) == os.path.abspath(self.screenshot_folder):
+            self.update_file_list([os.path.basename(dest)])
+        self.status_var.set(f"Exported: {dest}")
+        
     def copy_image(self):
         """Copy the selected image to the clipboard"""
         selection = self.file_listbox.curselection()
@@ -817,19 +1544,11 @@ class ScreenshotApp:
         filepath = os.path.join(self.screenshot_folder, filename)
 
         try:
-            from io import BytesIO
-            import win32clipboard
-
-            image = Image.open(filepath)
-            output = BytesIO()
-            image.convert("RGB").save(output, "BMP")
-            data = output.getvalue()[14:]
-            output.close()
-
-            win32clipboard.OpenClipboard()
-            win32clipboard.EmptyClipboard()
-            win32clipboard.SetClipboardData(win32clipboard.CF_DIB, data)
-            win32clipboard.CloseClipboard()
+            from delta_store import open_screenshot
+            from screenshot_core import copy_image_to_clipboard
+            
+            with open_screenshot(filepath) as image:
+                copy_image_to_clipboard(image)
 
             self.status_var.set(f"Copied to clipboard: {filename}")
         except Exception as e:
@@ -837,56 +1556,94 @@ class ScreenshotApp:
             self.status_var.set("Error copying image")
 
     def ocr_image(self):
-        """Extract text from the selected image using OCR"""
-        # Import pytesseract first in its own block so it is bound before
-        # TesseractNotFoundError is referenced in the except clause below.
-        try:
-            import pytesseract
-        except ImportError:
-            messagebox.showerror("Missing Dependency",
-                                 "pytesseract is not installed.\nRun: pip install pytesseract==0.3.13")
-            return
-
-        pytesseract.pytesseract.tesseract_cmd = r'C:\Program Files\Tesseract-OCR\tesseract.exe'
+        """Extract text from the selected image(s) using OCR
 
+        The work runs on the OCR process pool; results arrive in
+        on_ocr_done.  Several selected files are spread across the workers.
+        """
         selection = self.file_listbox.curselection()
         if not selection:
             messagebox.showwarning("Warning", "Please select a file to OCR")
             return
+        if self.ocr_batch is not None:
+            self.status_var.set("OCR already running - press Esc to cancel")
+            return
 
-        filename = self.file_listbox.get(selection[0])
-        filepath = os.path.join(self.screenshot_folder, filename)
-
+        names = [self.file_listbox.get(row) for row in selection]
         try:
-            import win32clipboard
+            self.ocr_batch = self.core.ocr(names)
+            # Leave every core to the interactive batch
+            self.core.ocr_indexer.pause("ocr")
+        except Exception as e:
+            messagebox.showerror("Error", f"Failed to run OCR: {str(e)}")
+            self.status_var.set("Error running OCR")
+            return
 
-            image = Image.open(filepath)
-            text = pytesseract.image_to_string(image).strip()
+        self.ocr_progress.configure(maximum=len(names), value=0)
+        self.ocr_progress_frame.grid()
+        self.status_var.set(f"Running OCR on {len(names)} file(s)... (Esc to cancel)")
 
-            if not text:
-                messagebox.showwarning("No Text Found", "No text could be extracted from the image.")
-                return
+    def cancel_ocr(self):
+        """Cancel the running OCR batch"""
+        if self.ocr_batch is not None:
+            self.core.ocr_pool.cancel(self.ocr_batch)
 
-            win32clipboard.OpenClipboard()
-            try:
-                win32clipboard.EmptyClipboard()
-                win32clipboard.SetClipboardData(win32clipboard.CF_UNICODETEXT, text)
-            finally:
-                win32clipboard.CloseClipboard()
-
-            OcrResultWindow(self.root, text, self.colors)
-            self.status_var.set(f"OCR complete: {filename}")
-
-        except pytesseract.pytesseract.TesseractNotFoundError:
-            messagebox.showerror("Tesseract Not Found",
-                                 "Tesseract OCR is not installed.\n"
-                                 "Download it from: https://github.com/UB-Mannheim/tesseract/wiki")
-        except Exception as e:
-            messagebox.showerror("Error", f"Failed to run OCR: {str(e)}")
+    def on_ocr_progress(self, batch):
+        """Update the progress bar after each file (Tk thread)"""
+        if batch is not self.ocr_batch:
+            return
+        self.ocr_progress.configure(value=batch.completed)
+        self.status_var.set(f"OCR {batch.completed}/{batch.total}... (Esc to cancel)")
+
+    def on_ocr_done(self, batch):
+        """Show and copy the text of a finished OCR batch (Tk thread)"""
+        if batch is not self.ocr_batch:
+            return
+        self.ocr_batch = None
+        self.ocr_progress_frame.grid_remove()
+        self.core.ocr_indexer.resume("ocr")
+
+        if batch.cancelled:
+            self.status_var.set(f"OCR cancelled ({batch.completed}/{batch.total} done)")
+            return
+
+        from ocr_pool import TesseractMissingError
+        from screenshot_core import copy_text_to_clipboard, ocr_text
+        
+        missing = [e for e in batch.errors.values() if isinstance(e, TesseractMissingError)]
+        if missing:
+            messagebox.showerror("Tesseract Not Found", str(missing[0]))
+            self.status_var.set("Error running OCR")
+            return
+
+        if batch.total == 1 and batch.filepaths[0] in batch.errors:
+            messagebox.showerror("Error", f"Failed to run OCR: {batch.errors[batch.filepaths[0]]}")
             self.status_var.set("Error running OCR")
+            return
+        text = ocr_text(batch)
+
+        if not text:
+            messagebox.showwarning("No Text Found", "No text could be extracted from the image.")
+            self.status_var.set("OCR complete: no text found")
+            return
+
+        try:
+            copy_text_to_clipboard(text)
+        except Exception as e:
+            self.status_var.set(f"OCR complete, but copying to the clipboard failed: {str(e)}")
+        else:
+            if batch.total == 1:
+                self.status_var.set(f"OCR complete: {os.path.basename(batch.filepaths[0])}")
+            else:
+                self.status_var.set(f"OCR complete: {batch.total} files, "
+                                    f"{len(batch.errors)} failed")
+
+        OcrResultWindow(self.root, text, self.colors)
 
     def create_camera_icon(self):
         """Create a camera icon for system tray"""
+        from PIL import Image as PILImage, ImageDraw
+        
         # Create a 64x64 image with camera icon
         img = PILImage.new('RGB', (64, 64), color=(30, 30, 46))  # Dark background
         draw = ImageDraw.Draw(img)
@@ -907,6 +1664,9 @@ class ScreenshotApp:
     
     def minimize_to_tray(self):
         """Minimize application to system tray"""
+        import pystray
+        from pystray import MenuItem as item
+        
         self.root.withdraw()
         
         # Create camera icon for system tray
@@ -914,6 +1674,13 @@ class ScreenshotApp:
         
         menu = (
             item('Restore', self.restore_from_tray),
+            # The tray can come up before start_services() creates core
+            item('Start Timelapse', self.tray_start_timelapse,
+                 visible=lambda menu_item: self.core is not None and
+                 not self.core.timelapse_running()),
+            item('Stop Timelapse', self.tray_stop_timelapse,
+                 visible=lambda menu_item: self.core is not None and
+                 self.core.timelapse_running()),
             item('Exit', self.exit_app)
         )
         
@@ -924,9 +1691,22 @@ class ScreenshotApp:
         icon_thread = threading.Thread(target=self.icon.run, daemon=False)
         icon_thread.start()
         
+    def tray_start_timelapse(self, icon=None, item=None):
+        """Start a timelapse with the last used settings (tray thread)"""
+        self.post(self.start_timelapse)
+        
+    def tray_stop_timelapse(self, icon=None, item=None):
+        """Stop the running timelapse (tray thread)"""
+        self.post(self.stop_timelapse)
+        
+    def update_tray_menu(self):
+        """Show Start or Stop Timelapse in the tray menu"""
+        if self.icon is not None:
+            self.icon.update_menu()
+        
     def restore_from_tray(self, icon=None, item=None):
         """Restore application from system tray"""
-        self.root.after(0, self._restore_window)
+        self.post(self._restore_window)
         
     def _restore_window(self):
         """Helper method to restore window in main thread"""
@@ -940,10 +1720,42 @@ class ScreenshotApp:
         """Exit the application"""
         if self.icon:
             self.icon.stop()
-        self.root.after(0, self._quit_app)
+        self.post(self._quit_app)
+        
+    def post(self, callback, *args):
+        """Run callback(*args) on the Tk thread; safe from any thread
+
+        Worker threads never call Tk themselves: such a call waits for the
+        Tk thread, which may be joining that very worker (e.g. on quit).
+        """
+        self.ui_calls.put((callback, args))
+        
+    def process_ui_calls(self):
+        """Run the callbacks posted by worker threads (Tk thread, polled)"""
+        while True:
+            try:
+                callback, args = self.ui_calls.get_nowait()
+            except queue.Empty:
+                break
+            try:
+                callback(*args)
+            except Exception:
+                self.root.report_callback_exception(*sys.exc_info())
+        self.root.after(self.ui_poll_ms, self.process_ui_calls)
         
     def _quit_app(self):
-        """Helper method to quit in main thread"""
+        """Helper method to quit in main thread
+
+        Joining the workers here is safe: their callbacks only queue
+        work for the Tk thread (post) and never wait for it.
+        """
+        # Let queued captures reach the disk before exiting
+        if self.core is not None:
+            self.folder_watcher.stop()
+            self.crop_writer.shutdown(wait=True)
+            self.core.close(wait=True)
+            self.preview_cache.close()
+            self.thumbnail_cache.flush()
         self.root.quit()
         self.root.destroy()
         sys.exit(0)
@@ -953,11 +1765,21 @@ class ScreenshotApp:
         self.root.mainloop()
 
 
-def main():
+def main(argv=None):
+    import argparse
+    parser = argparse.ArgumentParser(description="Screen Shot Manager")
+    parser.add_argument("--folder", default=None, help=r"screenshot folder (default C:\Screenshot)")
+    parser.add_argument("--startup-report", action="store_true",
+                        help="print startup timings as JSON once the list is filled, then exit")
+    args = parser.parse_args(argv)
+    
     root = tk.Tk()
-    app = ScreenshotApp(root)
+    app = ScreenshotApp(root, folder=args.folder, startup_report=args.startup_report)
     app.run()
 
 
 if __name__ == "__main__":
+    # Needed by the OCR worker processes in the PyInstaller build
+    import multiprocessing
+    multiprocessing.freeze_support()
     main()
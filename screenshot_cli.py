@@ -0,0 +1,294 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+===========================================================
+    Project Name : Screen Shot Manager
+    File Name    : screenshot_cli.py
+    Author       : Vignesh Kumar B
+    Created On   : 2026-10-18
+    Description  : Command line front end (no GUI)
+===========================================================
+
+Runs the same operations as the application on a screenshot folder,
+without Tk, the tray or the hotkey, so they can be scripted and run on
+headless machines.  "batch" reads one command per line from a file (or
+stdin) and runs them all on one ScreenshotCore, sharing its OCR workers.
+
+Usage: python screenshot_cli.py [--folder DIR] COMMAND ...
+       python screenshot_cli.py COMMAND --help
+"""
+
+import argparse
+import json
+import os
+import shlex
+import sys
+import time
+from datetime import datetime
+
+from capture_backends import CAPTURE_BACKENDS, DEFAULT_BACKEND
+from capture_split import DEFAULT_GRID, SPLIT_MODES
+from catalog import SORT_COLUMNS
+from encoders import DEFAULT_PROFILE, ENCODER_PROFILES
+from ocr_pool import OcrError
+from screenshot_core import DEFAULT_FOLDER, ScreenshotCore, copy_image_to_clipboard, ocr_text
+
+
+def cmd_capture(core, args):
+    for i in range(args.count):
+        if i:
+            time.sleep(args.interval)
+        filepaths, duplicate_of = core.capture_parts(
+            bbox=tuple(args.region) if args.region else None, active_window=args.window)
+        if not filepaths:
+            print(f"duplicate of {os.path.basename(duplicate_of)}, not saved")
+        else:
+            print(" ".join(os.path.basename(filepath) for filepath in filepaths))
+
+
+def cmd_timelapse(core, args):
+    """Capture on a schedule until the duration/count is reached or Ctrl+C"""
+    def on_frame(stats):
+        if not args.quiet:
+            print(f"{stats.ticks}: {stats.summary()}", flush=True)
+
+    session = core.start_timelapse(
+        args.interval, duration=args.duration, count=args.count,
+        bbox=tuple(args.region) if args.region else None, active_window=args.window,
+        on_frame=on_frame)
+    try:
+        while not session.wait(0.5):
+            pass
+    except KeyboardInterrupt:
+        session.stop()
+        session.wait()
+    # Let the last frames reach the disk so the encode stats are complete
+    core.capture_pipeline.close(wait=True)
+    stats = session.snapshot()
+    print(f"timelapse: {stats.summary()} ({stats.missed} missed, "
+          f"{stats.dropped} dropped by backpressure, "
+          f"{stats.finished_at - stats.started_at:.1f} s)")
+    if stats.error is not None:
+        raise stats.error
+
+
+def cmd_list(core, args):
+    if args.long or args.sort not in ("captured", "name"):
+        core.scan_metadata()
+    for name in core.names(args.sort, not args.ascending):
+        if not args.long:
+            print(name)
+            continue
+        info = core.info(name) or {}
+        captured = info.get("captured_at")
+        size = f"{info['width']}x{info['height']}" if info.get("width") else "-"
+        print("\t".join((
+            datetime.fromtimestamp(captured).strftime("%Y-%m-%d %H:%M:%S") if captured else "-",
+            size, str(info.get("bytes", "-")), info.get("encoder") or "-",
+            (info.get("content_hash") or "-")[:12], name)))
+
+
+def cmd_crop(core, args):
+    print(os.path.basename(core.crop(args.name, tuple(args.box), overwrite=args.overwrite)))
+
+
+def cmd_encode(core, args):
+    for name in args.names:
+        print(core.encode(name, args.encoder, args.output_dir))
+
+
+def cmd_export(core, args):
+    print(core.export_png(args.name, args.dest))
+
+
+def cmd_rename(core, args):
+    print(core.rename(args.name, args.new_name))
+
+
+def cmd_delete(core, args):
+    core.delete(args.name)
+
+
+def cmd_copy(core, args):
+    with core.open(args.name) as image:
+        copy_image_to_clipboard(image)
+
+
+def cmd_ocr(core, args):
+    batch = core.ocr(args.names)
+    batch.wait()
+    if args.json:
+        print(json.dumps({os.path.basename(path): batch.results.get(path)
+                          for path in batch.filepaths}, ensure_ascii=False, indent=2))
+    else:
+        print(ocr_text(batch))
+    errors = list(batch.errors.values())
+    if errors:
+        raise errors[0] if len(errors) == batch.total else \
+            OcrError(f"OCR failed for {len(errors)} of {batch.total} file(s)")
+
+
+def cmd_search(core, args):
+    for name in core.search(args.text):
+        print(name)
+
+
+def cmd_batch(core, args):
+    """Run every command of a file; returns the number that failed"""
+    handle = sys.stdin if args.file == "-" else open(args.file, "r", encoding="utf-8")
+    parser = build_parser(batch=True)
+    failed = 0
+    with handle:
+        for number, line in enumerate(handle, 1):
+            words = shlex.split(line, comments=True)
+            if not words:
+                continue
+            try:
+                command = parser.parse_args(words)
+            except SystemExit:
+                print(f"line {number}: invalid command: {line.strip()}", file=sys.stderr)
+                failed += 1
+                continue
+            if not run(core, command, f"line {number}: "):
+                failed += 1
+                if args.stop_on_error:
+                    break
+    return failed
+
+
+def build_parser(batch=False):
+    parser = argparse.ArgumentParser(prog="screenshot_cli.py",
+                                     description=__doc__.split("\n\n")[1].replace("\n", " "))
+    if not batch:
+        parser.add_argument("--folder", default=DEFAULT_FOLDER,
+                            help=f"screenshot folder (default {DEFAULT_FOLDER})")
+        parser.add_argument("--capture-encoder", default=DEFAULT_PROFILE,
+                            choices=sorted(ENCODER_PROFILES), help="encoder for new captures")
+        parser.add_argument("--capture-backend", default=DEFAULT_BACKEND,
+                            choices=("auto",) + tuple(CAPTURE_BACKENDS),
+                            help="how the screen is captured (synthetic needs no display)")
+        parser.add_argument("--storage", choices=("standalone", "delta"), default="standalone",
+                            help="storage mode for new captures")
+        parser.add_argument("--split", choices=SPLIT_MODES, default="off",
+                            help="save full-screen captures as one file per monitor or tile, "
+                                 "encoded in parallel")
+        parser.add_argument("--split-grid", type=int, nargs=2, default=DEFAULT_GRID,
+                            metavar=("COLUMNS", "ROWS"), help="tile grid for --split tiles")
+        parser.add_argument("--ocr-workers", type=int, default=None,
+                            help="OCR worker processes (default: one per core)")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    sub = commands.add_parser("capture", help="capture the screen")
+    sub.add_argument("--count", type=int, default=1)
+    sub.add_argument("--interval", type=float, default=1.0, help="seconds between captures")
+    mode = sub.add_mutually_exclusive_group()
+    mode.add_argument("--region", type=int, nargs=4, metavar=("LEFT", "TOP", "RIGHT", "BOTTOM"),
+                      help="capture only this box of the screen")
+    mode.add_argument("--window", action="store_true", help="capture only the active window")
+    sub.set_defaults(func=cmd_capture)
+
+    if not batch:
+        sub = commands.add_parser("timelapse", help="capture every few seconds for a while")
+        sub.add_argument("--interval", type=float, required=True, help="seconds between frames")
+        sub.add_argument("--duration", type=float, default=None,
+                         help="seconds to run (default: until --count or Ctrl+C)")
+        sub.add_argument("--count", type=int, default=None, help="stop after this many frames")
+        sub.add_argument("--quiet", "-q", action="store_true", help="only print the summary")
+        mode = sub.add_mutually_exclusive_group()
+        mode.add_argument("--region", type=int, nargs=4,
+                          metavar=("LEFT", "TOP", "RIGHT", "BOTTOM"))
+        mode.add_argument("--window", action="store_true")
+        sub.set_defaults(func=cmd_timelapse)
+
+    sub = commands.add_parser("list", help="list screenshots, newest first")
+    sub.add_argument("--sort", choices=tuple(SORT_COLUMNS), default="captured")
+    sub.add_argument("--ascending", action="store_true")
+    sub.add_argument("--long", "-l", action="store_true",
+                     help="show capture time, dimensions, bytes, encoder and hash")
+    sub.set_defaults(func=cmd_list)
+
+    sub = commands.add_parser("crop", help="crop a screenshot")
+    sub.add_argument("name")
+    sub.add_argument("box", type=int, nargs=4, metavar=("LEFT", "TOP", "RIGHT", "BOTTOM"))
+    sub.add_argument("--overwrite", action="store_true",
+                     help="replace the file instead of saving a new one")
+    sub.set_defaults(func=cmd_crop)
+
+    sub = commands.add_parser("encode", help="re-encode screenshots with an encoder profile")
+    sub.add_argument("names", nargs="+")
+    sub.add_argument("--encoder", required=True, choices=sorted(ENCODER_PROFILES))
+    sub.add_argument("--output-dir", default=None)
+    sub.set_defaults(func=cmd_encode)
+
+    sub = commands.add_parser("export", help="save a screenshot as a plain PNG")
+    sub.add_argument("name")
+    sub.add_argument("dest", nargs="?", default=None)
+    sub.set_defaults(func=cmd_export)
+
+    sub = commands.add_parser("rename", help="rename a screenshot (extension is kept)")
+    sub.add_argument("name")
+    sub.add_argument("new_name")
+    sub.set_defaults(func=cmd_rename)
+
+    sub = commands.add_parser("delete", help="delete a screenshot")
+    sub.add_argument("name")
+    sub.set_defaults(func=cmd_delete)
+
+    sub = commands.add_parser("copy", help="copy a screenshot to the clipboard (Windows)")
+    sub.add_argument("name")
+    sub.set_defaults(func=cmd_copy)
+
+    sub = commands.add_parser("ocr", help="extract the text of screenshots")
+    sub.add_argument("names", nargs="+")
+    sub.add_argument("--json", action="store_true", help="print {name: text}")
+    sub.set_defaults(func=cmd_ocr)
+
+    sub = commands.add_parser("search", help="find screenshots by their OCR text")
+    sub.add_argument("text")
+    sub.set_defaults(func=cmd_search)
+
+    if not batch:
+        sub = commands.add_parser("batch", help="run commands from a file, one per line")
+        sub.add_argument("file", help='command file, or "-" for stdin')
+        sub.add_argument("--stop-on-error", action="store_true")
+        sub.set_defaults(func=cmd_batch)
+    return parser
+
+
+def run(core, args, prefix=""):
+    """Run one parsed command; reports errors and returns success"""
+    try:
+        failed = args.func(core, args)
+    except (OSError, ValueError, OcrError) as e:
+        print(f"{prefix}{args.command}: {e}", file=sys.stderr)
+        return False
+    except ImportError as e:
+        # e.g. copy without pywin32
+        print(f"{prefix}{args.command}: not available here ({e})", file=sys.stderr)
+        return False
+    return not failed
+
+
+def main(argv=None):
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    if args.split != "off" and args.storage == "delta":
+        parser.error("--split needs --storage standalone")
+    core = ScreenshotCore(args.folder, encoder_profile=args.capture_encoder,
+                          capture_backend=args.capture_backend, storage_mode=args.storage,
+                          split_mode=args.split, split_grid=args.split_grid,
+                          ocr_workers=args.ocr_workers, capture_queue_policy="block")
+    try:
+        core.refresh()
+        ok = run(core, args)
+    finally:
+        # Waits for queued captures to reach the disk
+        core.close(wait=True)
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    # OCR worker processes of a frozen build start through this entry too
+    import multiprocessing
+    multiprocessing.freeze_support()
+    sys.exit(main())
@@ -0,0 +1,505 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+===========================================================
+    Project Name : Screen Shot Manager
+    File Name    : screenshot_core.py
+    Author       : Vignesh Kumar B
+    Created On   : 2026-10-18
+    Description  : Screenshot library without a GUI
+===========================================================
+
+Everything the application does to the screenshot folder (capture,
+listing, renaming, cropping, encoding, OCR and search) lives here with no
+dependency on Tk, the tray or the global hotkey.  screenshot_app.py is
+the Tk front end and screenshot_cli.py the command line one; both create
+a ScreenshotCore and call into it.
+"""
+
+import os
+import sys
+import threading
+from datetime import datetime
+
+from capture_backends import DEFAULT_BACKEND, check_backend, get_backend
+from capture_dedupe import DEDUPE_ACTIONS, CaptureDeduplicator
+from capture_pipeline import CapturePipeline
+from capture_split import DEFAULT_GRID, check_split, part_suffixes, split_boxes
+from catalog import Catalog, CatalogScanner, CatalogView
+from delta_store import DeltaStore, export_png, is_delta, open_screenshot
+from encoders import DEFAULT_PROFILE, SCREENSHOT_EXTENSIONS, get_profile, profile_for_path
+from file_index import FileIndex
+from ocr_cache import OcrCache
+from ocr_indexer import OcrIndexer
+from ocr_pool import DEFAULT_SETTINGS, OcrPool
+from search_index import SearchIndex
+from timelapse import TimelapseSession
+
+
+DEFAULT_FOLDER = r"C:\Screenshot" if sys.platform == "win32" else \
+    os.path.join(os.path.expanduser("~"), "Screenshot")
+
+# Private cache folder (thumbnails, catalog, OCR cache, search index)
+# inside the screenshot folder
+CACHE_FOLDER_NAME = ".screenshot_manager"
+
+def capture_stem(when):
+    """File name (without extension) of a capture taken at when"""
+    return f"ss_{when.strftime('%d%m%Y_%H%M%S')}"
+
+
+def crop_path(filepath, when):
+    """Where a crop of filepath saved as a new file goes"""
+    stem, ext = os.path.splitext(os.path.basename(filepath))
+    return os.path.join(os.path.dirname(filepath),
+                        f"{stem}_cropped_{when.strftime('%d%m%Y_%H%M%S')}{ext}")
+
+
+def ocr_text(batch):
+    """Text of a finished OcrBatch as shown and copied to the clipboard
+
+    One file gives its text as is; several are joined under a header
+    line per file, with failures noted in place.
+    """
+    if batch.total == 1 and batch.filepaths[0] in batch.results:
+        return batch.results[batch.filepaths[0]]
+    sections = []
+    for filepath in batch.filepaths:
+        filename = os.path.basename(filepath)
+        if filepath in batch.errors:
+            body = f"[OCR failed: {batch.errors[filepath]}]"
+        else:
+            body = batch.results.get(filepath) or "[No text found]"
+        sections.append(f"===== {filename} =====\n{body}")
+    return "\n\n".join(sections)
+
+
+def copy_image_to_clipboard(image):
+    """Put image on the Windows clipboard as a DIB"""
+    from io import BytesIO
+    import win32clipboard
+
+    output = BytesIO()
+    image.convert("RGB").save(output, "BMP")
+    # A DIB is the BMP file without its 14-byte file header
+    data = output.getvalue()[14:]
+    output.close()
+
+    win32clipboard.OpenClipboard()
+    try:
+        win32clipboard.EmptyClipboard()
+        win32clipboard.SetClipboardData(win32clipboard.CF_DIB, data)
+    finally:
+        win32clipboard.CloseClipboard()
+
+
+def copy_text_to_clipboard(text):
+    """Put text on the Windows clipboard"""
+    import win32clipboard
+
+    win32clipboard.OpenClipboard()
+    try:
+        win32clipboard.EmptyClipboard()
+        win32clipboard.SetClipboardData(win32clipboard.CF_UNICODETEXT, text)
+    finally:
+        win32clipboard.CloseClipboard()
+
+
+class ScreenshotCore:
+    """A screenshot folder with its storage, catalog, OCR and search
+
+    Capture writes happen on the capture pipeline and OCR on the OCR
+    process pool; everything else runs on the calling thread.  The
+    callbacks (see CapturePipeline, OcrPool, OcrIndexer, CatalogScanner)
+    run on background threads, so a GUI must marshal them itself.
+
+    on_changed(diff, full) is the exception: it runs on the thread that
+    changed the folder, after every refresh/update (including those made
+    by crop, rename, delete, ...), so the caller can redraw its list.
+
+    Files are addressed by name inside folder.  The background services
+    (metadata scanner, OCR indexer) only run after start_background().
+    """
+
+    def __init__(self, folder=DEFAULT_FOLDER, encoder_profile=DEFAULT_PROFILE,
+                 capture_backend=DEFAULT_BACKEND, storage_mode="standalone", split_mode="off",
+                 split_grid=DEFAULT_GRID, capture_workers=None, capture_queue_depth=4,
+                 capture_queue_policy="drop_oldest", dedupe=True, dedupe_threshold=0.0,
+                 dedupe_action="skip", ocr_workers=None, ocr_settings=None,
+                 ocr_index_cpu_share=0.25, sort="captured", descending=True,
+                 on_saved=None, on_capture_error=None, on_dropped=None,
+                 on_ocr_progress=None, on_ocr_done=None, on_indexed=None, on_scanned=None,
+                 on_changed=None):
+        if storage_mode not in ("standalone", "delta"):
+            raise ValueError(f"Unknown storage mode: {storage_mode!r}")
+        if dedupe_action not in DEDUPE_ACTIONS:
+            raise ValueError(f"Unknown duplicate action: {dedupe_action!r}")
+        get_profile(encoder_profile)
+        check_backend(capture_backend)
+        check_split(split_mode, split_grid)
+        if split_mode != "off" and storage_mode == "delta":
+            # One keyframe at a time; parts of different sizes would
+            # restart it on every part
+            raise ValueError("Split captures need standalone storage")
+
+        self.folder = folder
+        os.makedirs(folder, exist_ok=True)
+        self.cache_folder = os.path.join(folder, CACHE_FOLDER_NAME)
+        self.encoder_profile = encoder_profile
+        # Name of the capture backend; connected on the first capture
+        self.capture_backend = capture_backend
+        self._grabber = None
+        # The hotkey and timelapse threads may both make the first capture
+        self._grabber_lock = threading.Lock()
+        self.storage_mode = storage_mode
+        self.split_mode = split_mode
+        self.split_grid = tuple(split_grid)
+        self.dedupe = dedupe
+        self.dedupe_action = dedupe_action
+        self.on_ocr_done = on_ocr_done
+        self.on_changed = on_changed
+
+        self.delta_store = DeltaStore(os.path.join(self.cache_folder, "keyframes"))
+        self.deduplicator = CaptureDeduplicator(threshold=dedupe_threshold)
+
+        # The folder (FileIndex) and the metadata that orders it (Catalog)
+        self.file_index = FileIndex(folder, SCREENSHOT_EXTENSIONS)
+        self.catalog = Catalog(os.path.join(self.cache_folder, "catalog.sqlite3"))
+        self.file_list = CatalogView(self.catalog, sort, descending)
+        self.catalog_scanner = CatalogScanner(folder, self.catalog, on_scanned=on_scanned)
+
+        if capture_workers is None:
+            # Split captures encode their parts in parallel, one per core
+            capture_workers = 2 if split_mode == "off" else max(2, os.cpu_count() or 1)
+        self.capture_pipeline = CapturePipeline(
+            workers=capture_workers, queue_depth=capture_queue_depth,
+            policy=capture_queue_policy, on_saved=on_saved, on_error=on_capture_error,
+            on_dropped=on_dropped, catalog=self.catalog)
+
+        self.ocr_settings = ocr_settings or DEFAULT_SETTINGS
+        self.ocr_cache = OcrCache(os.path.join(self.cache_folder, "ocr_cache.sqlite3"))
+        self.ocr_pool = OcrPool(workers=ocr_workers, settings=self.ocr_settings,
+                                cache=self.ocr_cache, on_progress=on_ocr_progress,
+                                on_done=self._on_ocr_done)
+        # Search candidates are picked by the catalog's capture time
+        self.search_index = SearchIndex(os.path.join(self.cache_folder, "search.sqlite3"),
+                                        captured_at=self._captured_at)
+        self.ocr_indexer = OcrIndexer(
+            folder, self.search_index, cache=self.ocr_cache, settings=self.ocr_settings,
+            checkpoint_path=os.path.join(self.cache_folder, "ocr_indexer.json"),
+            cpu_share=ocr_index_cpu_share, on_indexed=on_indexed)
+        self._background = False
+        self.timelapse = None
+
+    def _captured_at(self, name):
+        row = self.catalog.get(name)
+        return row["captured_at"] if row else None
+
+    def path(self, name):
+        return os.path.join(self.folder, name)
+
+    # Listing
+
+    def refresh(self):
+        """Rescan the whole folder; returns the FileIndex diff"""
+        diff = self.file_index.scan()
+        self._apply(diff, full=True)
+        return diff
+
+    def update(self, names):
+        """Re-check only these names; returns the FileIndex diff"""
+        diff = self.file_index.update_names(names)
+        self._apply(diff)
+        return diff
+
+    def names(self, sort=None, descending=True):
+        """Every screenshot name, in the list order or sorted by sort"""
+        if sort is None:
+            return self.file_list.names()
+        names = [name for _value, name in self.catalog.keys(sort)]
+        return names[::-1] if descending else names
+
+    def set_sort(self, sort, descending=True):
+        self.file_list.set_sort(sort, descending)
+
+    def scan_metadata(self):
+        """Fill in missing dimensions, hashes and encoders right away
+
+        Without start_background() nothing else does; returns the names
+        scanned.
+        """
+        return self.catalog_scanner.scan_pending()
+
+    def info(self, name):
+        """Catalog metadata of name (see Catalog.get), or None"""
+        return self.catalog.get(name)
+
+    def _apply(self, diff, full=False):
+        if diff or full:
+            self.catalog.sync(diff, self.file_index.entries, full=full)
+            if full:
+                self.file_list.reload()
+            else:
+                self.file_list.apply(diff)
+            self.catalog_scanner.wake()
+
+        # Keep the search index in step with the folder
+        renamed_from = {old for old, _ in diff.renamed}
+        for old, new in diff.renamed:
+            self.search_index.rename(old, new)
+        for name in diff.removed:
+            if name not in renamed_from:
+                self.search_index.remove(name)
+        for name in diff.changed:
+            # Content changed (e.g. cropped); its old text no longer applies
+            self.search_index.remove(name)
+        if self._background:
+            renamed_to = {new for _, new in diff.renamed}
+            self.ocr_indexer.enqueue([name for name in diff.added if name not in renamed_to] +
+                                     diff.changed)
+        if self.on_changed:
+            self.on_changed(diff, full)
+
+    # Capture and storage
+
+    def grabber(self):
+        """The capture backend, created on first use (once, from any thread)"""
+        with self._grabber_lock:
+            if self._grabber is None:
+                grabber = get_backend(self.capture_backend)
+                if self.split_mode == "monitors" and hasattr(grabber, "all_screens"):
+                    # ImageGrab on Windows grabs the primary monitor by default
+                    grabber.all_screens = True
+                self._grabber = grabber
+            return self._grabber
+
+    def encoder(self):
+        """Encoder for new captures (the storage mode and profile)"""
+        if self.storage_mode == "delta":
+            return self.delta_store
+        return get_profile(self.encoder_profile)
+
+    def capture(self, image=None, bbox=None, active_window=False):
+        """Grab the screen with the capture backend (or take image) and
+        queue it for saving
+
+        bbox (left, top, right, bottom) or active_window grabs and stores
+        only that part of the screen, which is much cheaper to capture
+        and encode than the whole desktop.
+
+        Returns (filepath, duplicate_of).  filepath is None when the frame
+        was skipped as a duplicate of the earlier capture duplicate_of.
+        The file exists once the on_saved callback ran (or after close).
+        A split capture returns its first part; see capture_parts().
+        """
+        filepaths, duplicate_of = self.capture_parts(image, bbox, active_window)
+        return (filepaths[0] if filepaths else None), duplicate_of
+
+    def capture_parts(self, image=None, bbox=None, active_window=False, on_reserved=None):
+        """capture(), returning ([filepath, ...], duplicate_of)
+
+        With split_mode a full-screen capture is cut into one part per
+        monitor (or grid tile), each queued as its own encode job so the
+        capture pipeline workers encode them in parallel.  Region and
+        window captures are never split.  Parts identical to a recent
+        capture are stored as links; only a capture whose every part is
+        a duplicate is skipped (filepaths is then empty).  on_reserved
+        (filepaths) runs before the parts are queued, so it is never late
+        for their on_saved/on_dropped callbacks.
+        """
+        # Keep background OCR off the CPU while the user is capturing
+        self.ocr_indexer.touch()
+        full_screen = image is None and bbox is None and not active_window
+        if image is None:
+            grabber = self.grabber()
+            if active_window:
+                bbox = grabber.active_window_box()
+            image = grabber.grab(bbox)
+        captured_at = datetime.now()
+
+        boxes = None
+        if self.split_mode != "off" and bbox is None:
+            monitors = self.grabber().monitors() if full_screen else [(0, 0) + image.size]
+            boxes = split_boxes(image.size, monitors, self.split_mode, self.split_grid)
+        parts = [image.crop(box) for box in boxes] if boxes else [image]
+
+        # Compare with recent captures before paying for an encode
+        signatures, links = [None] * len(parts), [None] * len(parts)
+        if self.dedupe:
+            for i, part in enumerate(parts):
+                signatures[i] = self.deduplicator.signature(part)
+                links[i] = self.deduplicator.find(part, signatures[i])
+            if all(links) and self.dedupe_action == "skip":
+                return [], links[0]
+
+        encoder = self.encoder()
+        stem = capture_stem(captured_at)
+        if boxes:
+            filepaths = self.capture_pipeline.reserve_set(
+                self.folder, stem, part_suffixes(self.split_mode, len(parts)), encoder.ext)
+        else:
+            filepaths = [self.capture_pipeline.reserve_path(self.folder, stem, encoder.ext)]
+        if on_reserved:
+            on_reserved(filepaths)
+        self.capture_pipeline.submit_set(list(zip(parts, filepaths, links)), encoder,
+                                         captured_at=captured_at.timestamp())
+        if self.dedupe:
+            self.deduplicator.set_parts(len(parts))
+            for part, signature, link, filepath in zip(parts, signatures, links, filepaths):
+                if link is None:
+                    self.deduplicator.remember(part, signature, filepath)
+        return filepaths, links[0]
+
+    def start_timelapse(self, interval, duration=None, count=None, bbox=None,
+                        active_window=False, on_frame=None, on_done=None):
+        """Capture every interval seconds on a background thread
+
+        Ends after duration seconds or count frames (whichever is first),
+        or on stop_timelapse().  Frames are dropped, never queued, while
+        the capture pipeline is full.  Returns the TimelapseSession; see
+        it for the callbacks, which run on the session thread.
+        """
+        if self.timelapse_running():
+            raise RuntimeError("A timelapse session is already running")
+        self.timelapse = TimelapseSession(
+            self, interval, duration, count, {"bbox": bbox, "active_window": active_window},
+            on_frame=on_frame, on_done=on_done).start()
+        return self.timelapse
+
+    def stop_timelapse(self):
+        """Stop the running timelapse session; returns its stats, or None"""
+        session = self.timelapse
+        if session is None:
+            return None
+        session.stop()
+        session.wait()
+        return session.snapshot()
+
+    def timelapse_running(self):
+        return self.timelapse is not None and self.timelapse.running
+
+    def forget_capture(self, filepath):
+        """A queued capture failed or was dropped; never link to it"""
+        self.deduplicator.forget(filepath)
+
+    def open(self, name):
+        """Screenshot name as a PIL image (delta entries rebuilt)"""
+        return open_screenshot(self.path(name))
+
+    def save_image(self, image, filepath):
+        """Rewrite filepath with image, losslessly in its own format
+
+        Used for crops; written through a temp file and rename, so an
+        overwrite never leaves a torn file.  Returns filepath.
+        """
+        if is_delta(filepath):
+            self.delta_store.save_keyframe(image, filepath)
+        else:
+            profile = profile_for_path(filepath, self.encoder_profile)
+            if profile is None:
+                raise ValueError(f"Cannot write {os.path.basename(filepath)}: unknown format")
+            profile.save(image, filepath)
+        self.ocr_cache.invalidate(filepath)
+        return filepath
+
+    def crop(self, name, box, overwrite=False):
+        """Crop screenshot name to box (left, top, right, bottom)
+
+        Overwrites the file or saves the crop next to it; returns the
+        path written.  The folder listing is updated.
+        """
+        filepath = self.path(name)
+        with self.open(name) as image:
+            cropped = image.crop(box)
+        dest = filepath if overwrite else crop_path(filepath, datetime.now())
+        self.save_image(cropped, dest)
+        self.update([os.path.basename(dest)])
+        return dest
+
+    def encode(self, name, profile, dest_folder=None):
+        """Re-encode screenshot name with another encoder profile
+
+        Written to dest_folder (default: the screenshot folder) under the
+        same stem with the profile's extension; returns the path.
+        """
+        encoder = get_profile(profile)
+        dest_folder = dest_folder or self.folder
+        dest = os.path.join(dest_folder, os.path.splitext(name)[0] + encoder.ext)
+        with self.open(name) as image:
+            image.load()
+            encoder.save(image, dest)
+        self.ocr_cache.invalidate(dest)
+        self._update_if_inside(dest)
+        return dest
+
+    def export_png(self, name, dest=None):
+        """Write screenshot name as a plain PNG; returns the PNG path"""
+        dest = export_png(self.path(name), dest)
+        self._update_if_inside(dest)
+        return dest
+
+    def rename(self, old_name, new_stem):
+        """Rename a screenshot, keeping its extension; returns the new name"""
+        ext = os.path.splitext(old_name)[1]
+        new_name = new_stem if new_stem.lower().endswith(ext.lower()) else new_stem + ext
+        if os.path.exists(self.path(new_name)):
+            raise FileExistsError(f"A file named {new_name} already exists")
+        os.rename(self.path(old_name), self.path(new_name))
+        self.deduplicator.forget(self.path(old_name))
+        self.update([old_name, new_name])
+        return new_name
+
+    def delete(self, name):
+        os.remove(self.path(name))
+        self.deduplicator.forget(self.path(name))
+        self.update([name])
+
+    def _update_if_inside(self, filepath):
+        if os.path.dirname(os.path.abspath(filepath)) == os.path.abspath(self.folder):
+            self.update([os.path.basename(filepath)])
+
+    # OCR and search
+
+    def ocr(self, names):
+        """Start OCR of screenshots names; returns the OcrBatch
+
+        Results are added to the search index when the batch finishes;
+        wait with batch.wait() or use the on_ocr_done callback.
+        """
+        return self.ocr_pool.submit([self.path(name) for name in names])
+
+    def _on_ocr_done(self, batch):
+        # Whatever text came back is searchable, even from a cancelled batch
+        self.search_index.add_many((os.path.basename(path), text)
+                                   for path, text in batch.results.items())
+        if self.on_ocr_done:
+            self.on_ocr_done(batch)
+
+    def search(self, text):
+        """Names of screenshots whose OCR text matches, best first"""
+        return [name for name in self.search_index.search(text) if name in self.file_index]
+
+    # Lifetime
+
+    def start_background(self):
+        """Start the metadata scanner and the background OCR indexer"""
+        self._background = True
+        self.catalog_scanner.start()
+        # Work through screenshots that are not searchable yet, newest first
+        self.ocr_indexer.start(self.names("captured", True))
+
+    def close(self, wait=True):
+        """Finish queued captures (if wait) and release everything"""
+        self.stop_timelapse()
+        self.capture_pipeline.close(wait=wait)
+        with self._grabber_lock:
+            if self._grabber is not None:
+                self._grabber.close()
+        self.ocr_pool.shutdown(wait=False)
+        if self._background:
+            self.ocr_indexer.stop()
+            self.catalog_scanner.stop()
+        self.ocr_cache.close()
+        self.search_index.close()
+        self.catalog.close()
+
@@ -0,0 +1,228 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+===========================================================
+    Project Name : Screen Shot Manager
+    File Name    : search_index.py
+    Author       : Vignesh Kumar B
+    Created On   : 2026-10-18
+    Description  : Full-text search over OCR text (SQLite FTS5)
+===========================================================
+"""
+
+import sqlite3
+import threading
+import time
+
+from catalog import capture_time
+
+
+# Most results a search returns; the best matches come first
+DEFAULT_LIMIT = 500
+
+# Most recently captured matches that are ranked by relevance (see
+# SearchIndex.search)
+CANDIDATES = 2000
+
+# Document ids are the capture time in milliseconds shifted left by this
+# many bits; the low bits tell apart captures of the same millisecond
+_ID_SHIFT = 10
+
+# PRAGMA user_version of an index whose ids follow capture time
+_SCHEMA_VERSION = 1
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS docs (
+    id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL UNIQUE
+);
+CREATE VIRTUAL TABLE IF NOT EXISTS ocr_fts USING fts5(
+    text,
+    tokenize = 'unicode61 remove_diacritics 2',
+    prefix = '1 2 3'
+);
+"""
+
+
+def build_query(text):
+    """FTS5 query for what the user typed
+
+    Every word must match; the last one as a prefix (from two letters
+    on), so results appear while the word is still being typed.  Words are quoted, so FTS5
+    operators and punctuation in the input are searched for literally
+    ("ERR-4012" finds the phrase err 4012).
+    """
+    words = text.split()
+    if not words:
+        return None
+    terms = ['"' + word.replace('"', '""') + '"' for word in words]
+    # A one-letter prefix matches almost everything; wait for more
+    if len(words[-1]) >= 2:
+        terms[-1] += "*"
+    return " ".join(terms)
+
+
+class SearchResults:
+    """Ranked search hits; a drop-in source for VirtualListbox"""
+
+    def __init__(self, query, names):
+        self.query = query
+        self._names = list(names)
+        self._positions = {name: row for row, name in enumerate(self._names)}
+
+    def __len__(self):
+        return len(self._names)
+
+    def __getitem__(self, row):
+        return self._names[row]
+
+    def __contains__(self, name):
+        return name in self._positions
+
+    def index_of(self, name):
+        return self._positions.get(name)
+
+
+class SearchIndex:
+    """OCR text of each screenshot, searchable by words, ranked by BM25
+
+    Documents are keyed by file name; docs maps each name to the FTS
+    rowid so updates, renames and deletes never scan the text table.
+    The rowid follows the capture time, not the order files were
+    indexed in (the background indexer adds older captures last), so
+    "highest rowids" means "most recent captures".  captured_at(name)
+    gives that time (e.g. from the catalog); by default it is read from
+    the file name, else the time of indexing.  Safe to share between the
+    Tk thread and background threads.
+    """
+
+    def __init__(self, db_path, captured_at=None):
+        self.db_path = db_path
+        self.captured_at = captured_at
+        self._lock = threading.RLock()
+        self._db = sqlite3.connect(db_path, timeout=10, check_same_thread=False)
+        with self._lock:
+            self._db.execute("PRAGMA journal_mode=WAL")
+            self._db.execute("PRAGMA synchronous=NORMAL")
+            self._db.executescript(_SCHEMA)
+            if self._db.execute("PRAGMA user_version").fetchone()[0] < _SCHEMA_VERSION:
+                self._renumber()
+                self._db.execute(f"PRAGMA user_version = {_SCHEMA_VERSION}")
+            self._db.commit()
+
+    def __len__(self):
+        with self._lock:
+            return self._db.execute("SELECT COUNT(*) FROM docs").fetchone()[0]
+
+    def __contains__(self, name):
+        with self._lock:
+            return self._db.execute("SELECT 1 FROM docs WHERE name = ?",
+                                    (name,)).fetchone() is not None
+
+    def names(self):
+        """Set of every indexed file name"""
+        with self._lock:
+            return {name for name, in self._db.execute("SELECT name FROM docs")}
+
+    def add(self, name, text):
+        """Index (or re-index) the OCR text of name"""
+        self.add_many([(name, text)])
+
+    def add_many(self, items):
+        """Index several (name, text) pairs in one transaction"""
+        with self._lock:
+            for name, text in items:
+                row = self._db.execute("SELECT id FROM docs WHERE name = ?", (name,)).fetchone()
+                if row is None:
+                    rowid = self._new_id(name)
+                    self._db.execute("INSERT INTO docs (id, name) VALUES (?, ?)", (rowid, name))
+                else:
+                    rowid = row[0]
+                self._db.execute("DELETE FROM ocr_fts WHERE rowid = ?", (rowid,))
+                self._db.execute("INSERT INTO ocr_fts (rowid, text) VALUES (?, ?)",
+                                 (rowid, text))
+            self._db.commit()
+
+    def remove(self, name):
+        with self._lock:
+            row = self._db.execute("SELECT id FROM docs WHERE name = ?", (name,)).fetchone()
+            if row is None:
+                return
+            self._db.execute("DELETE FROM ocr_fts WHERE rowid = ?", row)
+            self._db.execute("DELETE FROM docs WHERE id = ?", row)
+            self._db.commit()
+
+    def rename(self, old_name, new_name):
+        """Keep the text of a renamed file without re-indexing it"""
+        with self._lock:
+            self._db.execute("DELETE FROM ocr_fts WHERE rowid IN "
+                             "(SELECT id FROM docs WHERE name = ?)", (new_name,))
+            self._db.execute("DELETE FROM docs WHERE name = ?", (new_name,))
+            self._db.execute("UPDATE docs SET name = ? WHERE name = ?", (new_name, old_name))
+            self._db.commit()
+
+    def search(self, text, limit=DEFAULT_LIMIT):
+        """Names matching the words in text, best match first
+
+        Only the CANDIDATES most recently captured matches (highest
+        rowids) are scored with BM25: ranking every hit of a word found
+        in nearly every screenshot is what makes a search slow.  The
+        trade-off: when a word matches more than CANDIDATES screenshots,
+        a strong match in an older capture is not shown.  A word that
+        common does not rank usefully anyway, and one more word narrows
+        the matches below the cap.
+        """
+        query = build_query(text)
+        if query is None:
+            return []
+        with self._lock:
+            try:
+                rows = self._db.execute(
+                    "SELECT docs.name FROM ("
+                    "    SELECT rowid, rank FROM ocr_fts WHERE ocr_fts MATCH ?"
+                    "    ORDER BY rowid DESC LIMIT ?"
+                    ") AS hits JOIN docs ON docs.id = hits.rowid "
+                    "ORDER BY hits.rank LIMIT ?",
+                    (query, CANDIDATES, limit)).fetchall()
+            except sqlite3.OperationalError:
+                # Input FTS5 still cannot parse (e.g. only punctuation)
+                return []
+        return [name for name, in rows]
+
+    def snippet(self, name, text):
+        """Text of name around the words in text, matches in [brackets]"""
+        query = build_query(text)
+        if query is None:
+            return ""
+        with self._lock:
+            try:
+                row = self._db.execute(
+                    "SELECT snippet(ocr_fts, 0, '[', ']', '...', 10) FROM ocr_fts "
+                    "WHERE ocr_fts MATCH ? AND rowid = (SELECT id FROM docs WHERE name = ?)",
+                    (query, name)).fetchone()
+            except sqlite3.OperationalError:
+                return ""
+        return row[0] if row else ""
+
+    def _new_id(self, name):
+        """Unused document id ordered by the capture time of name"""
+        captured_at = self.captured_at(name) if self.captured_at else None
+        if captured_at is None:
+            captured_at = capture_time(name, time.time())
+        rowid = max(int(captured_at * 1000), 0) << _ID_SHIFT
+        while self._db.execute("SELECT 1 FROM docs WHERE id = ?", (rowid,)).fetchone():
+            rowid += 1
+        return rowid
+
+    def _renumber(self):
+        """Give documents of an older index capture-ordered ids"""
+        for old_id, name in self._db.execute("SELECT id, name FROM docs").fetchall():
+            new_id = self._new_id(name)
+            self._db.execute("UPDATE docs SET id = ? WHERE id = ?", (new_id, old_id))
+            self._db.execute("INSERT INTO ocr_fts (rowid, text) "
+                             "SELECT ?, text FROM ocr_fts WHERE rowid = ?", (new_id, old_id))
+            self._db.execute("DELETE FROM ocr_fts WHERE rowid = ?", (old_id,))
+
+    def close(self):
+        with self._lock:
+            self._db.close()
@@ -0,0 +1,185 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+===========================================================
+    Project Name : Screen Shot Manager
+    File Name    : test_capture_backends.py
+    Author       : Vignesh Kumar B
+    Created On   : 2026-10-18
+    Description  : Capture backend selection and synthetic captures
+===========================================================
+
+Runs without a display: captures go through the synthetic backend.
+
+Usage: python -m unittest discover -s tests
+"""
+
+import ctypes
+import os
+import shutil
+import sys
+import tempfile
+import threading
+import time
+import unittest
+from unittest import mock
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from PIL import Image  # noqa: E402
+
+import capture_backends  # noqa: E402
+from capture_backends import (CaptureUnavailableError, ImageGrabBackend,  # noqa: E402
+                              SyntheticBackend, check_backend, get_backend)
+from screenshot_core import ScreenshotCore  # noqa: E402
+
+
+class BackendSelectionTest(unittest.TestCase):
+
+    def test_named_backend(self):
+        backend = get_backend("synthetic", size=(320, 200))
+        self.assertIsInstance(backend, SyntheticBackend)
+        self.assertEqual(backend.size(), (320, 200))
+
+    def test_unknown_backend(self):
+        with self.assertRaises(ValueError):
+            check_backend("dxgi")
+        with self.assertRaises(ValueError):
+            get_backend("dxgi")
+
+    def test_auto_falls_back_when_x11_shm_is_unavailable(self):
+        unavailable = mock.Mock(side_effect=CaptureUnavailableError("no MIT-SHM"))
+        with mock.patch.object(capture_backends, "X11ShmBackend", unavailable), \
+                mock.patch.object(capture_backends.sys, "platform", "linux"), \
+                mock.patch.dict(os.environ, {"DISPLAY": ":99"}):
+            backend = get_backend("auto")
+        unavailable.assert_called_once_with()
+        self.assertIsInstance(backend, ImageGrabBackend)
+
+    def test_auto_skips_x11_shm_without_display(self):
+        x11 = mock.Mock()
+        with mock.patch.object(capture_backends, "X11ShmBackend", x11), \
+                mock.patch.object(capture_backends.sys, "platform", "linux"), \
+                mock.patch.dict(os.environ, {}, clear=True):
+            backend = get_backend("auto")
+        x11.assert_not_called()
+        self.assertIsInstance(backend, ImageGrabBackend)
+
+
+class X11ErrorHandlerTest(unittest.TestCase):
+    """The process-wide Xlib handler only swallows trapped displays"""
+
+    def test_other_displays_reach_the_previous_handler(self):
+        ErrorHandler = ctypes.CFUNCTYPE(ctypes.c_int, ctypes.c_void_p, ctypes.c_void_p)
+        forwarded = []
+        previous = ErrorHandler(lambda display, event: forwarded.append(display) or 0)
+        installed = []
+
+        class FakeXlib:
+            @staticmethod
+            def XSetErrorHandler(handler):
+                installed.append(handler)
+                return ctypes.cast(previous, ctypes.c_void_p).value
+
+        with mock.patch.object(capture_backends, "_X11_HANDLER", None), \
+                mock.patch.dict(capture_backends._X11_TRAPS, clear=True):
+            capture_backends._install_x11_error_handler(FakeXlib)
+            capture_backends._install_x11_error_handler(FakeXlib)
+            self.assertEqual(len(installed), 1)
+            handler = installed[0]
+
+            errors = []
+            capture_backends._X11_TRAPS[0x1000] = errors
+            handler(0x1000, None)
+            handler(0x2000, None)
+        self.assertEqual(errors, [1])
+        self.assertEqual(forwarded, [0x2000])
+
+
+class SyntheticBackendTest(unittest.TestCase):
+
+    def setUp(self):
+        self.backend = get_backend("synthetic", size=(640, 360))
+
+    def test_full_frame(self):
+        image = self.backend.grab()
+        self.assertEqual(image.mode, "RGB")
+        self.assertEqual(image.size, (640, 360))
+
+    def test_box(self):
+        image = self.backend.grab((10, 20, 110, 70))
+        self.assertEqual(image.mode, "RGB")
+        self.assertEqual(image.size, (100, 50))
+
+    def test_frames_differ_unless_static(self):
+        self.assertNotEqual(self.backend.grab().tobytes(), self.backend.grab().tobytes())
+        static = SyntheticBackend(size=(64, 64), static=True)
+        self.assertEqual(static.grab().tobytes(), static.grab().tobytes())
+
+    def test_monitors_cover_the_frame(self):
+        backend = SyntheticBackend(size=(5760, 1080))
+        self.assertEqual(backend.monitors(), [(0, 0, 1920, 1080), (1920, 0, 3840, 1080),
+                                              (3840, 0, 5760, 1080)])
+
+
+class CoreCaptureTest(unittest.TestCase):
+    """ScreenshotCore -> CapturePipeline -> disk, on synthetic frames"""
+
+    def setUp(self):
+        self.folder = tempfile.mkdtemp(prefix="test_capture_")
+        self.saved = []
+        self.core = ScreenshotCore(self.folder, capture_backend="synthetic",
+                                   on_saved=self.saved.append)
+        self.core._grabber = get_backend("synthetic", size=(640, 360))
+
+    def tearDown(self):
+        self.core.close(wait=True)
+        shutil.rmtree(self.folder, ignore_errors=True)
+
+    def test_backend_from_config(self):
+        core = ScreenshotCore(os.path.join(self.folder, "other"), capture_backend="synthetic")
+        try:
+            self.assertIsInstance(core.grabber(), SyntheticBackend)
+        finally:
+            core.close(wait=True)
+
+    def test_backend_created_once_across_threads(self):
+        created = []
+
+        def slow_backend(name):
+            # Widen the window between the None check and the assignment
+            time.sleep(0.05)
+            created.append(SyntheticBackend(size=(64, 64)))
+            return created[-1]
+
+        core = ScreenshotCore(os.path.join(self.folder, "other"), capture_backend="synthetic")
+        try:
+            with mock.patch("screenshot_core.get_backend", slow_backend):
+                threads = [threading.Thread(target=core.grabber) for _ in range(4)]
+                for thread in threads:
+                    thread.start()
+                for thread in threads:
+                    thread.join()
+            self.assertEqual(len(created), 1)
+            self.assertIs(core.grabber(), created[0])
+        finally:
+            core.close(wait=True)
+
+    def test_capture_is_written(self):
+        filepath, duplicate_of = self.core.capture()
+        self.assertIsNone(duplicate_of)
+        self.core.capture_pipeline.close(wait=True)
+        self.assertEqual(self.saved, [filepath])
+        with Image.open(filepath) as image:
+            self.assertEqual(image.size, (640, 360))
+
+    def test_unchanged_screen_is_skipped(self):
+        self.core._grabber = SyntheticBackend(size=(320, 200), static=True)
+        first, _ = self.core.capture()
+        second, duplicate_of = self.core.capture()
+        self.assertIsNone(second)
+        self.assertEqual(duplicate_of, first)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,173 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+===========================================================
+    Project Name : Screen Shot Manager
+    File Name    : test_capture_dedupe.py
+    Author       : Vignesh Kumar B
+    Created On   : 2026-10-18
+    Description  : Duplicate captures: skip, link and link fallback
+===========================================================
+
+Usage: python -m unittest discover -s tests
+"""
+
+import os
+import shutil
+import sys
+import tempfile
+import threading
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from PIL import Image  # noqa: E402
+
+from capture_backends import SyntheticBackend  # noqa: E402
+from capture_dedupe import CaptureDeduplicator  # noqa: E402
+from capture_pipeline import CapturePipeline  # noqa: E402
+from encoders import DEFAULT_PROFILE, get_profile  # noqa: E402
+from screenshot_core import ScreenshotCore  # noqa: E402
+
+TIMEOUT = 10
+
+
+def frame(color="white", size=(64, 48)):
+    return Image.new("RGB", size, color)
+
+
+class BlockingEncoder:
+    """The default encoder, holding the worker until released"""
+
+    def __init__(self):
+        self.profile = get_profile(DEFAULT_PROFILE)
+        self.name, self.lossless = self.profile.name, self.profile.lossless
+        self.started = threading.Event()
+        self.release = threading.Event()
+
+    def save(self, image, filepath):
+        self.started.set()
+        self.release.wait(TIMEOUT)
+        self.profile.save(image, filepath)
+
+
+class DeduplicatorTest(unittest.TestCase):
+
+    def setUp(self):
+        self.dedupe = CaptureDeduplicator()
+
+    def remember(self, image, filepath):
+        self.dedupe.remember(image, self.dedupe.signature(image), filepath)
+
+    def find(self, image):
+        return self.dedupe.find(image, self.dedupe.signature(image))
+
+    def test_identical_frame_matches(self):
+        self.remember(frame(), "a.png")
+        self.assertEqual(self.find(frame()), "a.png")
+        self.assertIsNone(self.find(frame("black")))
+        self.assertIsNone(self.find(frame(size=(48, 64))))
+
+    def test_one_changed_pixel_is_not_a_duplicate(self):
+        self.remember(frame(), "a.png")
+        changed = frame()
+        changed.putpixel((63, 47), (0, 0, 0))
+        self.assertIsNone(self.find(changed))
+
+    def test_forget(self):
+        self.remember(frame(), "a.png")
+        self.dedupe.forget("a.png")
+        self.assertIsNone(self.find(frame()))
+
+
+class LinkJobTest(unittest.TestCase):
+
+    def setUp(self):
+        self.folder = tempfile.mkdtemp(prefix="test_dedupe_")
+
+    def tearDown(self):
+        shutil.rmtree(self.folder, ignore_errors=True)
+
+    def path(self, name):
+        return os.path.join(self.folder, name)
+
+    def test_duplicate_is_linked_to_the_original(self):
+        pipeline = CapturePipeline(workers=2)
+        original, duplicate = self.path("a.png"), self.path("b.png")
+        pipeline.submit(frame(), original)
+        pipeline.submit(frame(), duplicate, link_to=original)
+        pipeline.close(wait=True)
+        self.assertTrue(os.path.samefile(original, duplicate))
+        stats = pipeline.stats()
+        self.assertEqual((stats["saved"], stats["encoded"]), (2, 1))
+
+    def test_link_falls_back_when_the_original_is_dropped(self):
+        pipeline = CapturePipeline(workers=1, queue_depth=1, policy="drop_oldest")
+        blocker = BlockingEncoder()
+        original, duplicate = self.path("a.png"), self.path("b.png")
+        pipeline.submit(frame("black"), self.path("busy.png"), encoder=blocker)
+        self.assertTrue(blocker.started.wait(TIMEOUT))
+        # The worker is busy: a waits in the queue and b evicts it
+        pipeline.submit(frame(), original)
+        pipeline.submit(frame(), duplicate, link_to=original)
+        blocker.release.set()
+        pipeline.close(wait=True)
+
+        self.assertFalse(os.path.exists(original))
+        with Image.open(duplicate) as image:
+            self.assertEqual(image.size, (64, 48))
+        stats = pipeline.stats()
+        self.assertEqual((stats["dropped"], stats["saved"], stats["encoded"]), (1, 2, 2))
+
+    def test_link_falls_back_when_the_original_fails(self):
+        class FailingEncoder(BlockingEncoder):
+            def save(self, image, filepath):
+                raise OSError("disk full")
+
+        errors = []
+        pipeline = CapturePipeline(workers=2, on_error=lambda path, e: errors.append(path))
+        original, duplicate = self.path("a.png"), self.path("b.png")
+        pipeline.submit(frame(), original, encoder=FailingEncoder())
+        pipeline.submit(frame(), duplicate, link_to=original)
+        pipeline.close(wait=True)
+        self.assertEqual(errors, [original])
+        self.assertTrue(os.path.isfile(duplicate))
+        self.assertEqual(os.stat(duplicate).st_nlink, 1)
+
+
+class CoreDedupeTest(unittest.TestCase):
+
+    def setUp(self):
+        self.folder = tempfile.mkdtemp(prefix="test_dedupe_core_")
+
+    def tearDown(self):
+        shutil.rmtree(self.folder, ignore_errors=True)
+
+    def core(self, **kwargs):
+        core = ScreenshotCore(self.folder, capture_backend="synthetic", **kwargs)
+        core._grabber = SyntheticBackend(size=(320, 200), static=True)
+        self.addCleanup(core.close, wait=True)
+        return core
+
+    def test_skip(self):
+        core = self.core(dedupe_action="skip")
+        first, _ = core.capture()
+        second, duplicate_of = core.capture()
+        self.assertEqual((second, duplicate_of), (None, first))
+
+    def test_link(self):
+        core = self.core(dedupe_action="link")
+        first, _ = core.capture()
+        second, duplicate_of = core.capture()
+        core.capture_pipeline.close(wait=True)
+        self.assertEqual(duplicate_of, first)
+        self.assertNotEqual(second, first)
+        self.assertTrue(os.path.samefile(first, second))
+
+    def test_unknown_action(self):
+        with self.assertRaises(ValueError):
+            ScreenshotCore(self.folder, dedupe_action="delete")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+===========================================================
+    Project Name : Screen Shot Manager
+    File Name    : test_delta_store.py
+    Author       : Vignesh Kumar B
+    Created On   : 2026-10-18
+    Description  : Delta screenshots round-trip and keyframe pruning
+===========================================================
+
+Usage: python -m unittest discover -s tests
+"""
+
+import os
+import random
+import shutil
+import sys
+import tempfile
+import time
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from PIL import Image, ImageChops, ImageDraw  # noqa: E402
+
+from delta_store import (DeltaStore, export_png, open_screenshot, read_manifest,  # noqa: E402
+                         screenshot_size)
+
+# Not a multiple of the tile size, so edge tiles are partial
+SIZE = (300, 170)
+
+
+def noise(seed, size=SIZE):
+    rng = random.Random(seed)
+    return Image.frombytes("RGB", size, bytes(rng.getrandbits(8) for _ in range(size[0] * size[1] * 3)))
+
+
+def same_pixels(a, b):
+    return a.size == b.size and ImageChops.difference(a.convert("RGB"), b.convert("RGB")).getbbox() is None
+
+
+class DeltaStoreTest(unittest.TestCase):
+
+    def setUp(self):
+        self.folder = tempfile.mkdtemp(prefix="test_delta_")
+        self.keyframes = os.path.join(self.folder, ".screenshot_manager", "keyframes")
+        self.store = DeltaStore(self.keyframes)
+
+    def tearDown(self):
+        shutil.rmtree(self.folder, ignore_errors=True)
+
+    def path(self, name):
+        return os.path.join(self.folder, name)
+
+    def save(self, image, name):
+        self.store.save(image, self.path(name))
+        return read_manifest(self.path(name))
+
+    def test_round_trip(self):
+        first = noise(1)
+        second = first.copy()
+        ImageDraw.Draw(second).rectangle((280, 150, 299, 169), fill="red")
+        keyframe = self.save(first, "a.ssd")
+        delta = self.save(second, "b.ssd")
+
+        self.assertEqual(keyframe["tiles"], [])
+        self.assertEqual(delta["keyframe"], keyframe["keyframe"])
+        self.assertEqual(delta["tiles"], [[4, 2]])
+        self.assertTrue(same_pixels(open_screenshot(self.path("a.ssd")), first))
+        self.assertTrue(same_pixels(open_screenshot(self.path("b.ssd")), second))
+        self.assertEqual(screenshot_size(self.path("b.ssd")), SIZE)
+        with Image.open(export_png(self.path("b.ssd"))) as exported:
+            self.assertTrue(same_pixels(exported, second))
+
+    def test_new_keyframe_when_most_tiles_change(self):
+        first = self.save(noise(1), "a.ssd")
+        second = self.save(noise(2), "b.ssd")
+        third = self.save(noise(3, (200, 100)), "c.ssd")
+        self.assertEqual(len({first["keyframe"], second["keyframe"], third["keyframe"]}), 3)
+        self.assertEqual(second["tiles"], [])
+
+    def test_saved_keyframe_leaves_the_sequence_alone(self):
+        first = self.save(noise(1), "a.ssd")
+        self.store.save_keyframe(noise(2), self.path("cropped.ssd"))
+        self.assertNotEqual(read_manifest(self.path("cropped.ssd"))["keyframe"], first["keyframe"])
+        self.assertEqual(self.save(noise(1), "b.ssd")["keyframe"], first["keyframe"])
+
+    def test_prune_keyframes(self):
+        old = self.save(noise(1), "a.ssd")["keyframe"]
+        kept = self.save(noise(2), "b.ssd")["keyframe"]
+        current = self.save(noise(3), "c.ssd")["keyframe"]
+        os.remove(self.path("a.ssd"))
+        os.remove(self.path("c.ssd"))
+        # Keyframes written in the last second may belong to an entry
+        # that is still being written
+        stale = time.time() - 60
+        for name in os.listdir(self.keyframes):
+            os.utime(os.path.join(self.keyframes, name), (stale, stale))
+
+        self.store.prune_keyframes(self.folder)
+        self.assertEqual(sorted(os.listdir(self.keyframes)), sorted([kept, current]))
+        self.assertFalse(os.path.exists(os.path.join(self.keyframes, old)))
+        self.assertTrue(same_pixels(open_screenshot(self.path("b.ssd")), noise(2)))
+
+    def test_prune_keeps_recent_keyframes(self):
+        name = self.save(noise(1), "a.ssd")["keyframe"]
+        self.save(noise(2), "b.ssd")
+        os.remove(self.path("a.ssd"))
+        self.store.prune_keyframes(self.folder)
+        self.assertIn(name, os.listdir(self.keyframes))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+===========================================================
+    Project Name : Screen Shot Manager
+    File Name    : test_file_index.py
+    Author       : Vignesh Kumar B
+    Created On   : 2026-10-18
+    Description  : Folder index diffs, rename detection and rows
+===========================================================
+
+Usage: python -m unittest discover -s tests
+"""
+
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from catalog import Catalog, CatalogView  # noqa: E402
+from file_index import FileEntry, FileIndex  # noqa: E402
+
+
+class FileIndexTest(unittest.TestCase):
+
+    def setUp(self):
+        self.folder = tempfile.mkdtemp(prefix="test_index_")
+        self.index = FileIndex(self.folder)
+
+    def tearDown(self):
+        shutil.rmtree(self.folder, ignore_errors=True)
+
+    def path(self, name):
+        return os.path.join(self.folder, name)
+
+    def write(self, name, data=b"x" * 100):
+        with open(self.path(name), "wb") as handle:
+            handle.write(data)
+
+    def test_added_removed_changed(self):
+        self.write("a.png")
+        self.write("b.png")
+        self.write("notes.txt")
+        diff = self.index.scan()
+        self.assertEqual(sorted(diff.added), ["a.png", "b.png"])
+
+        self.write("a.png", b"y" * 200)
+        os.remove(self.path("b.png"))
+        diff = self.index.scan()
+        self.assertEqual((diff.changed, diff.removed, diff.added), (["a.png"], ["b.png"], []))
+        self.assertFalse(self.index.scan())
+
+    def test_rename(self):
+        self.write("a.png")
+        self.index.scan()
+        os.rename(self.path("a.png"), self.path("b.png"))
+        diff = self.index.update_names(["a.png", "b.png"])
+        self.assertEqual(diff.renamed, [("a.png", "b.png")])
+
+    def test_copy_replacing_a_deleted_file_is_not_a_rename(self):
+        # copy2 keeps size and mtime; only the inode tells them apart
+        self.write("a.png")
+        self.index.scan()
+        shutil.copy2(self.path("a.png"), self.path("b.png"))
+        os.remove(self.path("a.png"))
+        diff = self.index.scan()
+        self.assertEqual(diff.renamed, [])
+        self.assertEqual((diff.added, diff.removed), (["b.png"], ["a.png"]))
+
+    def test_hard_link_then_delete_is_a_rename(self):
+        self.write("a.png")
+        self.index.scan()
+        os.link(self.path("a.png"), self.path("b.png"))
+        os.remove(self.path("a.png"))
+        diff = self.index.scan()
+        self.assertEqual(diff.renamed, [("a.png", "b.png")])
+
+    def test_unknown_inode_falls_back_to_stat_data(self):
+        # os.scandir on Windows reports st_ino 0
+        old, new = FileEntry("a.png", 1, 100, 0, 0), FileEntry("b.png", 1, 100, 42, 7)
+        self.assertTrue(old.same_file(new))
+        self.assertFalse(FileEntry("a.png", 1, 100, 41, 7).same_file(new))
+        self.assertFalse(FileEntry("a.png", 2, 100, 42, 7).same_file(new))
+
+    def test_rows_follow_changes(self):
+        for name in ("b.png", "d.png"):
+            self.write(name)
+        self.index.scan()
+        self.assertEqual(self.index.names(), ["d.png", "b.png"])
+        self.write("c.png")
+        self.write("a.png")
+        diff = self.index.update_names(["a.png", "c.png"])
+        self.assertEqual(diff.added_rows, [1, 3])
+        for row, name in enumerate(["d.png", "c.png", "b.png", "a.png"]):
+            self.assertEqual(self.index[row], name)
+            self.assertEqual(self.index.index_of(name), row)
+        os.remove(self.path("c.png"))
+        diff = self.index.update_names(["c.png"])
+        self.assertEqual(diff.removed_rows, [1])
+        self.assertIsNone(self.index.index_of("c.png"))
+        self.assertEqual(self.index.index_of("a.png"), 2)
+
+
+class CatalogViewTest(unittest.TestCase):
+
+    def setUp(self):
+        self.folder = tempfile.mkdtemp(prefix="test_view_")
+        self.catalog = Catalog(os.path.join(self.folder, "catalog.sqlite3"))
+        self.index = FileIndex(self.folder)
+
+    def tearDown(self):
+        self.catalog.close()
+        shutil.rmtree(self.folder, ignore_errors=True)
+
+    def add(self, *names):
+        for name in names:
+            with open(os.path.join(self.folder, name), "wb") as handle:
+                handle.write(b"x")
+        diff = self.index.update_names(names)
+        self.catalog.sync(diff, self.index.entries)
+        return diff
+
+    def test_rows_in_capture_order(self):
+        self.add("ss_01012026_120000.png", "ss_03012026_120000.png")
+        view = CatalogView(self.catalog)
+        diff = self.add("ss_02012026_120000.png")
+        view.apply(diff)
+        expected = ["ss_03012026_120000.png", "ss_02012026_120000.png",
+                    "ss_01012026_120000.png"]
+        self.assertEqual(view.names(), expected)
+        for row, name in enumerate(expected):
+            self.assertEqual(view.index_of(name), row)
+        view.set_sort("captured", False)
+        self.assertEqual(view.index_of(expected[0]), 2)
+        self.assertIsNone(view.index_of("missing.png"))
+
+
+if __name__ == "__main__":
+    unittest.main()
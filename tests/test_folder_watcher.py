@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+===========================================================
+    Project Name : Screen Shot Manager
+    File Name    : test_folder_watcher.py
+    Author       : Vignesh Kumar B
+    Created On   : 2026-10-18
+    Description  : Folder watcher events, fallback and shutdown
+===========================================================
+
+Usage: python -m unittest discover -s tests
+"""
+
+import os
+import queue
+import shutil
+import sys
+import tempfile
+import unittest
+from unittest import mock
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import folder_watcher  # noqa: E402
+from folder_watcher import FolderWatcher  # noqa: E402
+
+TIMEOUT = 10
+
+
+class FolderWatcherTest(unittest.TestCase):
+
+    def setUp(self):
+        self.folder = tempfile.mkdtemp(prefix="test_watcher_")
+        self.changes = queue.Queue()
+
+    def tearDown(self):
+        shutil.rmtree(self.folder, ignore_errors=True)
+
+    def watcher(self, **kwargs):
+        watcher = FolderWatcher(self.folder, lambda names, rescan: self.changes.put(names),
+                                debounce=0.01, poll_interval=0.05, **kwargs)
+        self.addCleanup(watcher.stop)
+        return watcher
+
+    def touch(self, name):
+        open(os.path.join(self.folder, name), "wb").close()
+
+    def test_polling_reports_new_files(self):
+        watcher = self.watcher(backend="polling")
+        watcher.start()
+        # The first snapshot is taken on the watcher thread
+        watcher._threads[0].join(0.2)
+        self.touch("a.png")
+        self.assertEqual(self.changes.get(timeout=TIMEOUT), {"a.png"})
+
+    @unittest.skipUnless(sys.platform.startswith("linux"), "inotify is Linux only")
+    def test_inotify_failure_falls_back_and_closes_the_wake_pipe(self):
+        watcher = self.watcher(backend="inotify")
+        opened = []
+        real_pipe = os.pipe
+
+        def pipe():
+            opened.extend(real_pipe())
+            return tuple(opened)
+
+        with mock.patch.object(folder_watcher, "_load_libc") as libc, \
+                mock.patch.object(folder_watcher.os, "pipe", pipe):
+            libc.return_value.inotify_init1.return_value = -1
+            watcher.start()
+        watcher._threads[0].join(0.2)
+        self.assertEqual(watcher.backend, "polling")
+        self.assertIsNone(watcher._wake_fds)
+        self.touch("a.png")
+        self.assertEqual(self.changes.get(timeout=TIMEOUT), {"a.png"})
+        # Checked once the polling thread, which opens fds, has ended
+        watcher.stop()
+        watcher._threads[0].join(TIMEOUT)
+        for fd in opened:
+            with self.assertRaises(OSError):
+                os.fstat(fd)
+
+    @unittest.skipUnless(folder_watcher._load_libc() is not None, "needs inotify")
+    def test_inotify_stop_closes_the_wake_pipe(self):
+        watcher = self.watcher(backend="inotify")
+        watcher.start()
+        wake_fds = watcher._wake_fds
+        watcher.stop()
+        watcher._threads[0].join(TIMEOUT)
+        self.assertFalse(watcher._threads[0].is_alive())
+        self.assertIsNone(watcher._wake_fds)
+        for fd in wake_fds:
+            with self.assertRaises(OSError):
+                os.fstat(fd)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+===========================================================
+    Project Name : Screen Shot Manager
+    File Name    : test_ocr_cache.py
+    Author       : Vignesh Kumar B
+    Created On   : 2026-10-18
+    Description  : OCR cache lookups and size-capped eviction
+===========================================================
+
+Usage: python -m unittest discover -s tests
+"""
+
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from ocr_cache import OcrCache  # noqa: E402
+
+KEY = "eng"
+
+
+class OcrCacheTest(unittest.TestCase):
+
+    def setUp(self):
+        self.folder = tempfile.mkdtemp(prefix="test_ocr_cache_")
+        self.db_path = os.path.join(self.folder, "ocr.sqlite3")
+
+    def tearDown(self):
+        shutil.rmtree(self.folder, ignore_errors=True)
+
+    def store(self, cache, digest, text):
+        cache.store(os.path.join(self.folder, digest + ".png"), 1, 1, digest, KEY, text)
+
+    def test_replace_counts_once(self):
+        cache = OcrCache(self.db_path, max_bytes=100)
+        self.store(cache, "a", "x" * 60)
+        self.store(cache, "a", "x" * 60)
+        self.assertEqual(cache.stats(), (1, 60))
+        self.assertEqual(cache.lookup_content("a", KEY), "x" * 60)
+        cache.close()
+
+    def test_least_recently_used_is_evicted(self):
+        cache = OcrCache(self.db_path, max_bytes=100)
+        self.store(cache, "a", "x" * 40)
+        self.store(cache, "b", "x" * 40)
+        cache.lookup_content("a", KEY)
+        self.store(cache, "c", "x" * 40)
+        self.assertIsNone(cache.lookup_content("b", KEY))
+        self.assertIsNotNone(cache.lookup_content("a", KEY))
+        self.assertEqual(cache.stats(), (2, 80))
+        cache.close()
+
+    def test_total_survives_reopen(self):
+        cache = OcrCache(self.db_path, max_bytes=100)
+        self.store(cache, "a", "x" * 60)
+        cache.close()
+        cache = OcrCache(self.db_path, max_bytes=100)
+        self.store(cache, "b", "x" * 60)
+        self.assertIsNone(cache.lookup_content("a", KEY))
+        self.assertEqual(cache.stats(), (1, 60))
+        cache.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
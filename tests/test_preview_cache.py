@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+===========================================================
+    Project Name : Screen Shot Manager
+    File Name    : test_preview_cache.py
+    Author       : Vignesh Kumar B
+    Created On   : 2026-10-18
+    Description  : Preview cache renders, prefetch and cancellation
+===========================================================
+
+Usage: python -m unittest discover -s tests
+"""
+
+import os
+import shutil
+import sys
+import tempfile
+import threading
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from PIL import Image  # noqa: E402
+
+from preview_cache import PreviewCache  # noqa: E402
+
+BOX = (200, 100)
+TIMEOUT = 10
+
+
+class PreviewCacheTest(unittest.TestCase):
+
+    def setUp(self):
+        self.folder = tempfile.mkdtemp(prefix="test_preview_")
+        self.paths = []
+        for name in ("a", "b", "c", "d"):
+            path = os.path.join(self.folder, name + ".png")
+            Image.new("RGB", (64, 32), "white").save(path)
+            self.paths.append(path)
+        # Renders of the first file block until released
+        self.release = threading.Event()
+        self.started = threading.Event()
+        self.rendered = []
+        self.cache = PreviewCache(self.render, prefetch_workers=1)
+
+    def tearDown(self):
+        self.release.set()
+        self.cache.close()
+        shutil.rmtree(self.folder, ignore_errors=True)
+
+    def render(self, filepath, box):
+        if filepath == self.paths[0]:
+            self.started.set()
+            self.release.wait(TIMEOUT)
+        self.rendered.append(os.path.basename(filepath))
+        return Image.new("RGB", box, "white")
+
+    def test_hit_after_render(self):
+        image = self.cache.get_async(self.paths[1], BOX).result(TIMEOUT)
+        self.assertEqual(image.size, BOX)
+        future = self.cache.get_async(self.paths[1], BOX)
+        self.assertTrue(future.done())
+        self.assertEqual(self.cache.stats()["hits"], 1)
+
+    def test_newer_prefetch_cancels_queued_ones(self):
+        self.cache.prefetch(self.paths[:3], BOX)
+        self.assertTrue(self.started.wait(TIMEOUT))
+        # a is running, b and c are queued behind it
+        self.cache.prefetch(self.paths[3:], BOX)
+        self.release.set()
+        self.cache.get_async(self.paths[3], BOX).result(TIMEOUT)
+        self.assertNotIn("b.png", self.rendered)
+        self.assertNotIn("c.png", self.rendered)
+
+    def test_selecting_a_queued_prefetch_still_renders(self):
+        self.cache.prefetch(self.paths[:2], BOX)
+        self.assertTrue(self.started.wait(TIMEOUT))
+        # b is queued; selecting it, then prefetching its neighbours
+        # (which leave b out) must not cancel the selection's render
+        future = self.cache.get_async(self.paths[1], BOX)
+        self.cache.prefetch([self.paths[2], self.paths[3]], BOX)
+        image = future.result(TIMEOUT)
+        self.assertFalse(future.cancelled())
+        self.assertEqual(image.size, BOX)
+
+    def test_running_prefetch_is_reused(self):
+        self.cache.prefetch(self.paths[:1], BOX)
+        self.assertTrue(self.started.wait(TIMEOUT))
+        future = self.cache.get_async(self.paths[0], BOX)
+        # Already running on the prefetch worker: reused, not cancelled
+        self.assertFalse(future.cancel())
+        self.release.set()
+        self.assertEqual(future.result(TIMEOUT).size, BOX)
+        self.assertEqual(self.rendered.count("a.png"), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+===========================================================
+    Project Name : Screen Shot Manager
+    File Name    : test_region_capture.py
+    Author       : Vignesh Kumar B
+    Created On   : 2026-10-18
+    Description  : Region and active-window capture
+===========================================================
+
+Runs without a display: captures go through the synthetic backend.
+
+Usage: python -m unittest discover -s tests
+"""
+
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from PIL import Image  # noqa: E402
+
+from capture_backends import (CaptureBackend, CaptureUnavailableError,  # noqa: E402
+                              SyntheticBackend, X11ShmBackend, clip_box)
+from screenshot_core import ScreenshotCore  # noqa: E402
+
+
+class NoWindowBackend(SyntheticBackend):
+    """A backend that cannot tell which window is active"""
+
+    active_window_box = CaptureBackend.active_window_box
+
+
+class ClipBoxTest(unittest.TestCase):
+
+    def test_inside(self):
+        self.assertEqual(clip_box((10, 20, 110, 70), (640, 360)), (10, 20, 110, 70))
+
+    def test_clamped_to_the_screen(self):
+        self.assertEqual(clip_box((-50, -10, 700, 400), (640, 360)), (0, 0, 640, 360))
+        self.assertEqual(clip_box((600, 300, 900, 500), (640, 360)), (600, 300, 640, 360))
+
+    def test_outside(self):
+        self.assertIsNone(clip_box((700, 0, 900, 100), (640, 360)))
+        self.assertIsNone(clip_box((10, 10, 10, 50), (640, 360)))
+
+    def test_x11_rejects_boxes_outside_the_screen(self):
+        # Checked before the display is touched: the server would answer
+        # with BadMatch, which kills the process
+        backend = X11ShmBackend.__new__(X11ShmBackend)
+        backend._size = (640, 360)
+        for box in ((-1, 0, 100, 100), (0, 0, 641, 100), (0, 0, 100, 361), (5, 5, 5, 50)):
+            with self.assertRaises(ValueError):
+                backend.grab(box)
+
+
+class ActiveWindowBoxTest(unittest.TestCase):
+
+    def test_window_clamped_to_the_screen(self):
+        backend = SyntheticBackend(size=(640, 360), window=(-20, 10, 200, 5000))
+        self.assertEqual(backend.active_window_box(), (0, 10, 200, 360))
+
+    def test_window_off_screen(self):
+        backend = SyntheticBackend(size=(640, 360), window=(700, 10, 900, 300))
+        with self.assertRaises(CaptureUnavailableError):
+            backend.active_window_box()
+
+    def test_backend_without_window_support(self):
+        with self.assertRaises(CaptureUnavailableError):
+            NoWindowBackend(size=(640, 360)).active_window_box()
+
+
+class CoreRegionCaptureTest(unittest.TestCase):
+    """Only the box is grabbed and written"""
+
+    def setUp(self):
+        self.folder = tempfile.mkdtemp(prefix="test_region_")
+        self.core = ScreenshotCore(self.folder, capture_backend="synthetic", split_mode="tiles")
+        self.core._grabber = SyntheticBackend(size=(640, 360), window=(40, 30, 360, 270))
+
+    def tearDown(self):
+        self.core.close(wait=True)
+        shutil.rmtree(self.folder, ignore_errors=True)
+
+    def written_sizes(self, filepaths):
+        self.core.capture_pipeline.close(wait=True)
+        sizes = []
+        for filepath in filepaths:
+            with Image.open(filepath) as image:
+                sizes.append(image.size)
+        return sizes
+
+    def test_region(self):
+        filepaths, _ = self.core.capture_parts(bbox=(100, 50, 300, 150))
+        # Region captures are never split
+        self.assertEqual(self.written_sizes(filepaths), [(200, 100)])
+
+    def test_active_window(self):
+        filepaths, _ = self.core.capture_parts(active_window=True)
+        self.assertEqual(self.written_sizes(filepaths), [(320, 240)])
+
+    def test_active_window_clamped(self):
+        self.core._grabber.window = (500, 200, 900, 600)
+        filepaths, _ = self.core.capture_parts(active_window=True)
+        self.assertEqual(self.written_sizes(filepaths), [(140, 160)])
+
+    def test_no_active_window_captures_nothing(self):
+        # The error reaches the caller instead of silently saving the
+        # whole desktop
+        self.core._grabber = NoWindowBackend(size=(640, 360))
+        with self.assertRaises(CaptureUnavailableError):
+            self.core.capture(active_window=True)
+        self.core._grabber = SyntheticBackend(size=(640, 360), window=(700, 0, 900, 100))
+        with self.assertRaises(CaptureUnavailableError):
+            self.core.capture(active_window=True)
+        self.core.capture_pipeline.close(wait=True)
+        self.assertEqual([name for name in os.listdir(self.folder) if name.endswith(".png")], [])
+
+    def test_full_screen_is_split(self):
+        filepaths, _ = self.core.capture_parts()
+        self.assertEqual(self.written_sizes(filepaths), [(320, 180)] * 4)
+
+
+if __name__ == "__main__":
+    unittest.main()
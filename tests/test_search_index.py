@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+===========================================================
+    Project Name : Screen Shot Manager
+    File Name    : test_search_index.py
+    Author       : Vignesh Kumar B
+    Created On   : 2026-10-18
+    Description  : OCR text search candidates and ranking
+===========================================================
+
+Usage: python -m unittest discover -s tests
+"""
+
+import os
+import shutil
+import sqlite3
+import sys
+import tempfile
+import unittest
+from unittest import mock
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import search_index  # noqa: E402
+from search_index import SearchIndex  # noqa: E402
+
+
+def capture_name(day):
+    return f"ss_{day:02d}012026_120000.png"
+
+
+class SearchIndexTest(unittest.TestCase):
+
+    def setUp(self):
+        self.folder = tempfile.mkdtemp(prefix="test_search_")
+        self.db_path = os.path.join(self.folder, "search.sqlite3")
+
+    def tearDown(self):
+        shutil.rmtree(self.folder, ignore_errors=True)
+
+    def test_candidates_are_the_latest_captures(self):
+        index = SearchIndex(self.db_path)
+        # New captures first, then the backlog of older ones, as the
+        # background indexer adds them
+        index.add_many((capture_name(day), "timeout") for day in range(20, 29))
+        index.add_many((capture_name(day), "timeout") for day in range(1, 10))
+        with mock.patch.object(search_index, "CANDIDATES", 5):
+            hits = index.search("timeout")
+        index.close()
+        self.assertEqual(sorted(hits), [capture_name(day) for day in range(24, 29)])
+
+    def test_best_match_first(self):
+        index = SearchIndex(self.db_path)
+        index.add(capture_name(1), "timeout timeout timeout connection")
+        index.add(capture_name(2), "connection refused " + "filler " * 50 + "timeout")
+        self.assertEqual(index.search("timeout"), [capture_name(1), capture_name(2)])
+        self.assertEqual(index.search("refused"), [capture_name(2)])
+        index.close()
+
+    def test_capture_time_from_callback(self):
+        times = {"a.png": 200.0, "b.png": 100.0}
+        index = SearchIndex(self.db_path, captured_at=times.get)
+        index.add_many([("b.png", "timeout"), ("a.png", "timeout")])
+        with mock.patch.object(search_index, "CANDIDATES", 1):
+            self.assertEqual(index.search("timeout"), ["a.png"])
+        index.close()
+
+    def test_rename_keeps_text(self):
+        index = SearchIndex(self.db_path)
+        index.add(capture_name(1), "invoice")
+        index.rename(capture_name(1), "invoice.png")
+        self.assertEqual(index.search("invoice"), ["invoice.png"])
+        index.remove("invoice.png")
+        self.assertEqual(index.search("invoice"), [])
+        index.close()
+
+    def test_older_index_is_renumbered(self):
+        # Ids in indexing order, as written before capture-ordered ids
+        db = sqlite3.connect(self.db_path)
+        db.executescript(search_index._SCHEMA)
+        for rowid, day in enumerate((1, 2, 3), 1):
+            db.execute("INSERT INTO docs (id, name) VALUES (?, ?)", (rowid, capture_name(day)))
+            db.execute("INSERT INTO ocr_fts (rowid, text) VALUES (?, 'timeout')", (rowid,))
+        db.commit()
+        db.close()
+
+        index = SearchIndex(self.db_path)
+        with mock.patch.object(search_index, "CANDIDATES", 1):
+            self.assertEqual(index.search("timeout"), [capture_name(3)])
+        self.assertEqual(len(index), 3)
+        index.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
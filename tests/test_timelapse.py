@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+===========================================================
+    Project Name : Screen Shot Manager
+    File Name    : test_timelapse.py
+    Author       : Vignesh Kumar B
+    Created On   : 2026-10-18
+    Description  : Timelapse schedule, missed ticks and backpressure
+===========================================================
+
+Sessions run against a stand-in core whose captures take a set time,
+so the schedule can be checked without encoding anything.
+
+Usage: python -m unittest discover -s tests
+"""
+
+import os
+import sys
+import threading
+import time
+import unittest
+from unittest import mock
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import timelapse  # noqa: E402
+from timelapse import MAX_FAILURES, TimelapseSession  # noqa: E402
+
+TIMEOUT = 10
+
+
+class Pipeline:
+    def __init__(self):
+        self.is_full = False
+
+    def full(self):
+        return self.is_full
+
+    def stats(self):
+        return {"encoded": 0, "encode_seconds": 0.0, "dropped": 0}
+
+
+class Core:
+    """capture_parts() that takes capture_seconds and names its frames"""
+
+    def __init__(self, capture_seconds=0.0, error=None):
+        self.capture_pipeline = Pipeline()
+        self.capture_seconds = capture_seconds
+        self.error = error
+        self.starts = []
+        self._lock = threading.Lock()
+
+    def capture_parts(self, on_reserved=None, **capture):
+        with self._lock:
+            self.starts.append(time.monotonic())
+            frame = len(self.starts)
+        if self.error is not None:
+            raise self.error
+        filepaths = [f"/shots/frame_{frame}.png"]
+        if on_reserved:
+            on_reserved(filepaths)
+        time.sleep(self.capture_seconds)
+        return filepaths, None
+
+
+def run(core, interval, **kwargs):
+    session = TimelapseSession(core, interval, **kwargs).start()
+    if not session.wait(TIMEOUT):
+        session.stop()
+        raise AssertionError("timelapse session did not end")
+    return session, session.snapshot()
+
+
+class TimelapseSessionTest(unittest.TestCase):
+
+    def test_count(self):
+        core = Core()
+        _, stats = run(core, 0.02, count=4)
+        self.assertEqual((stats.frames, stats.missed, stats.dropped), (4, 0, 0))
+        self.assertIsNotNone(stats.finished_at)
+
+    def test_duration_bounds_the_ticks(self):
+        # Ticks fall strictly inside the duration: 0, 0.05, ..., 0.15
+        session = TimelapseSession(Core(), 0.05, duration=0.2)
+        self.assertEqual(session.last_tick, 3)
+        session = TimelapseSession(Core(), 0.05, duration=0.21, count=2)
+        self.assertEqual(session.last_tick, 1)
+
+    def test_invalid_settings(self):
+        for kwargs in ({"interval": 0}, {"interval": 1, "duration": 0},
+                       {"interval": 1, "count": 0}):
+            with self.assertRaises(ValueError):
+                TimelapseSession(Core(), **kwargs)
+
+    def test_schedule_does_not_drift(self):
+        # Captures take most of the interval; a sleep(interval) loop
+        # would start each one capture_seconds later than the last
+        core = Core(capture_seconds=0.03)
+        run(core, 0.05, count=6)
+        origin = core.starts[0]
+        for tick, start in enumerate(core.starts):
+            self.assertLess(start - origin - tick * 0.05, 0.04)
+
+    def test_overrun_skips_to_the_latest_tick(self):
+        # Each capture overruns into the tick after next: the ticks in
+        # between are counted as missed, never fired in a burst
+        core = Core(capture_seconds=0.12)
+        _, stats = run(core, 0.05, count=8)
+        self.assertGreater(stats.missed, 0)
+        self.assertEqual(stats.frames + stats.missed, 8)
+        self.assertEqual(stats.frames, len(core.starts))
+        for earlier, later in zip(core.starts, core.starts[1:]):
+            self.assertGreaterEqual(later - earlier, 0.1)
+
+    def test_full_pipeline_drops_without_capturing(self):
+        core = Core()
+        core.capture_pipeline.is_full = True
+        _, stats = run(core, 0.01, count=5)
+        self.assertEqual((stats.frames, stats.dropped), (0, 5))
+        self.assertEqual(core.starts, [])
+
+    def test_gives_up_after_repeated_failures(self):
+        core = Core(error=OSError("disk full"))
+        _, stats = run(core, 0.01, count=20)
+        self.assertEqual(stats.failed, MAX_FAILURES)
+        self.assertIsInstance(stats.error, OSError)
+
+    def test_stop(self):
+        session = TimelapseSession(Core(), 0.01).start()
+        time.sleep(0.05)
+        session.stop()
+        self.assertTrue(session.wait(TIMEOUT))
+
+    def test_owns_only_recent_frames(self):
+        core = Core()
+        with mock.patch.object(timelapse, "OWNED_PATHS", 3):
+            session, _ = run(core, 0.01, count=5)
+        self.assertFalse(session.owns("/shots/frame_2.png"))
+        self.assertTrue(session.owns("/shots/frame_3.png"))
+        self.assertTrue(session.owns("/shots/frame_5.png"))
+        self.assertFalse(session.owns("/shots/manual.png"))
+        self.assertEqual(len(session._filepaths), 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
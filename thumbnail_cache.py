@@ -0,0 +1,320 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+===========================================================
+    Project Name : Screen Shot Manager
+    File Name    : thumbnail_cache.py
+    Author       : Vignesh Kumar B
+    Created On   : 2026-10-18
+    Description  : Persistent on-disk preview thumbnail cache
+===========================================================
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+import threading
+from collections import OrderedDict
+
+from PIL import Image
+
+from delta_store import open_screenshot, screenshot_size
+
+
+# Longest side, in pixels, of each cached thumbnail tier
+THUMBNAIL_SIZES = (320, 960, 1920)
+
+# Total size of all cached thumbnails before LRU eviction kicks in
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+
+# Seconds changes to the index may wait before it is written out; a burst
+# of thumbnail builds (e.g. prefetching) then costs one write, not one each
+FLUSH_DELAY = 5.0
+
+
+class ThumbnailCache:
+    """Downscaled copies of screenshots stored next to the originals
+
+    Entries are keyed by source path, mtime and size, so a file that is
+    overwritten (e.g. by a crop) simply misses and gets rebuilt; the stale
+    tiers are dropped at that point.  The cache is safe to share between
+    the Tk thread and background prefetch threads.
+
+    The index is written at most every flush_delay seconds; call flush()
+    before exit.  Files in cache_dir the index does not know about (left
+    by a crash before a flush) are removed when the cache is opened.
+    """
+
+    def __init__(self, cache_dir, sizes=THUMBNAIL_SIZES, max_bytes=DEFAULT_MAX_BYTES,
+                 flush_delay=FLUSH_DELAY):
+        self.cache_dir = cache_dir
+        self.sizes = tuple(sorted(sizes))
+        self.max_bytes = max_bytes
+        self.flush_delay = flush_delay
+        self.index_path = os.path.join(cache_dir, "index.json")
+
+        # entry file name -> {"source", "bytes", "width", "height"}, oldest first
+        self._entries = OrderedDict()
+        self._total_bytes = 0
+        self._dirty = False
+        self._lock = threading.RLock()
+        # Serialises index writes so an older snapshot never lands last
+        self._flush_lock = threading.Lock()
+        self._flush_timer = None
+
+        os.makedirs(cache_dir, exist_ok=True)
+        self._load_index()
+        self._reconcile()
+
+    def get(self, filepath, box):
+        """Return (image, source_size) for showing filepath inside box
+
+        The image is the smallest cached tier that still covers the size
+        the source would be scaled to for box; the source itself is
+        returned when it is already small enough or larger than every tier.
+        """
+        filepath = os.path.abspath(filepath)
+        st = os.stat(filepath)
+        key = self._key(filepath, st)
+
+        source_size = self._source_size(key, filepath)
+        tier = self._pick_tier(source_size, box)
+        if tier is None:
+            return open_screenshot(filepath), source_size
+
+        entry_name = f"{key}_{tier}.png"
+        entry_path = os.path.join(self.cache_dir, entry_name)
+        with self._lock:
+            cached = entry_name in self._entries
+            if cached:
+                self._entries.move_to_end(entry_name)
+                self._dirty = True
+
+        if cached:
+            try:
+                image = Image.open(entry_path)
+                image.load()
+                return image, source_size
+            except OSError:
+                self._remove_entry(entry_name)
+
+        return self._build(filepath, key, tier), source_size
+
+    def peek(self, filepath):
+        """Smallest already cached tier of filepath, or None; never builds"""
+        filepath = os.path.abspath(filepath)
+        key = self._key(filepath, os.stat(filepath))
+        for size in self.sizes:
+            entry_name = f"{key}_{size}.png"
+            with self._lock:
+                if entry_name not in self._entries:
+                    continue
+            try:
+                image = Image.open(os.path.join(self.cache_dir, entry_name))
+                image.load()
+                return image
+            except OSError:
+                self._remove_entry(entry_name)
+        return None
+
+    def invalidate(self, filepath):
+        """Drop every cached tier of filepath"""
+        filepath = os.path.abspath(filepath)
+        with self._lock:
+            stale = [name for name, entry in self._entries.items()
+                     if entry["source"] == filepath]
+        for name in stale:
+            self._remove_entry(name)
+        self._schedule_flush()
+
+    def flush(self):
+        """Write the index to disk now if it changed"""
+        with self._flush_lock:
+            with self._lock:
+                if self._flush_timer is not None:
+                    self._flush_timer.cancel()
+                    self._flush_timer = None
+                if not self._dirty:
+                    return
+                data = [dict(entry, name=name) for name, entry in self._entries.items()]
+                self._dirty = False
+
+            try:
+                fd, tmp_path = tempfile.mkstemp(prefix="index.", suffix=".tmp",
+                                                dir=self.cache_dir)
+            except OSError:
+                return
+            try:
+                with os.fdopen(fd, "w", encoding="utf-8") as handle:
+                    json.dump(data, handle)
+                os.replace(tmp_path, self.index_path)
+            except OSError:
+                _discard(tmp_path)
+
+    def _schedule_flush(self):
+        """Write the index within flush_delay seconds"""
+        with self._lock:
+            if self._flush_timer is not None:
+                return
+            self._flush_timer = threading.Timer(self.flush_delay, self.flush)
+            self._flush_timer.daemon = True
+            self._flush_timer.start()
+
+    def _key(self, filepath, st):
+        raw = f"{os.path.normcase(filepath)}|{st.st_mtime_ns}|{st.st_size}"
+        return hashlib.sha1(raw.encode("utf-8")).hexdigest()
+
+    def _source_size(self, key, filepath):
+        with self._lock:
+            for size in self.sizes:
+                entry = self._entries.get(f"{key}_{size}.png")
+                if entry:
+                    return entry["width"], entry["height"]
+        # Only reads the header, not the pixel data
+        return screenshot_size(filepath)
+
+    def _pick_tier(self, source_size, box):
+        src_w, src_h = source_size
+        scale = min(box[0] / src_w, box[1] / src_h, 1)
+        needed = max(src_w, src_h) * scale
+        for size in self.sizes:
+            if size >= needed:
+                return size if size < max(src_w, src_h) else None
+        return None
+
+    def update(self, filepath, image):
+        """Rebuild every tier of filepath from an image already in memory
+
+        Used after the app rewrote a file itself (e.g. a crop), so the new
+        thumbnails are ready without decoding the file again.
+        """
+        filepath = os.path.abspath(filepath)
+        key = self._key(filepath, os.stat(filepath))
+        self._build(filepath, key, self.sizes[-1], image)
+
+    def _build(self, filepath, key, tier, source=None):
+        """Decode the source once and store the requested and smaller tiers"""
+        if source is None:
+            source = open_screenshot(filepath)
+        source.load()
+        if source.mode not in ("RGB", "RGBA", "L"):
+            source = source.convert("RGBA" if "A" in source.getbands() or
+                                    "transparency" in source.info else "RGB")
+
+        requested = None
+        current = source
+        for size in reversed(self.sizes):
+            if size > tier or size >= max(source.size):
+                continue
+            thumb = current.copy()
+            thumb.thumbnail((size, size), Image.Resampling.LANCZOS)
+            current = thumb
+            if size == tier:
+                requested = thumb
+            self._store(f"{key}_{size}.png", thumb, filepath, source.size)
+
+        self._drop_stale(filepath, key)
+        self._evict()
+        self._schedule_flush()
+        return requested if requested is not None else source
+
+    def _store(self, entry_name, image, filepath, source_size):
+        entry_path = os.path.join(self.cache_dir, entry_name)
+        try:
+            fd, tmp_path = tempfile.mkstemp(prefix=entry_name + ".", suffix=".tmp",
+                                            dir=self.cache_dir)
+        except OSError:
+            return
+        try:
+            with os.fdopen(fd, "wb") as handle:
+                image.save(handle, "PNG", compress_level=1)
+            os.replace(tmp_path, entry_path)
+            size = os.path.getsize(entry_path)
+        except OSError:
+            _discard(tmp_path)
+            return
+
+        with self._lock:
+            old = self._entries.pop(entry_name, None)
+            if old:
+                self._total_bytes -= old["bytes"]
+            self._entries[entry_name] = {
+                "source": filepath,
+                "bytes": size,
+                "width": source_size[0],
+                "height": source_size[1],
+            }
+            self._total_bytes += size
+            self._dirty = True
+
+    def _drop_stale(self, filepath, key):
+        """Remove tiers built from an older version of filepath"""
+        with self._lock:
+            stale = [name for name, entry in self._entries.items()
+                     if entry["source"] == filepath and not name.startswith(key)]
+        for name in stale:
+            self._remove_entry(name)
+
+    def _evict(self):
+        while True:
+            with self._lock:
+                if self._total_bytes <= self.max_bytes or len(self._entries) <= 1:
+                    return
+                name = next(iter(self._entries))
+            self._remove_entry(name)
+
+    def _remove_entry(self, entry_name):
+        with self._lock:
+            entry = self._entries.pop(entry_name, None)
+            if entry is None:
+                return
+            self._total_bytes -= entry["bytes"]
+            self._dirty = True
+        _discard(os.path.join(self.cache_dir, entry_name))
+
+    def _load_index(self):
+        try:
+            with open(self.index_path, "r", encoding="utf-8") as handle:
+                data = json.load(handle)
+        except (OSError, ValueError):
+            return
+
+        for item in data:
+            name = item.pop("name", None)
+            if name:
+                self._entries[name] = item
+                self._total_bytes += item.get("bytes", 0)
+
+    def _reconcile(self):
+        """Match the directory to the index: drop entries whose file is
+        gone, delete files no entry owns and recount the bytes"""
+        try:
+            files = {entry.name: entry.stat().st_size
+                     for entry in os.scandir(self.cache_dir) if entry.is_file()}
+        except OSError:
+            return
+        files.pop(os.path.basename(self.index_path), None)
+
+        with self._lock:
+            for name in [name for name in self._entries if name not in files]:
+                del self._entries[name]
+                self._dirty = True
+            self._total_bytes = 0
+            for name, entry in self._entries.items():
+                entry["bytes"] = files.pop(name)
+                self._total_bytes += entry["bytes"]
+
+        # Orphans: tiers built after the last flush before a crash, and
+        # temporary files of interrupted writes
+        for name in files:
+            _discard(os.path.join(self.cache_dir, name))
+        self._evict()
+        self.flush()
+
+
+def _discard(path):
+    try:
+        os.remove(path)
+    except OSError:
+        pass
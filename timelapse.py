@@ -0,0 +1,237 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+===========================================================
+    Project Name : Screen Shot Manager
+    File Name    : timelapse.py
+    Author       : Vignesh Kumar B
+    Created On   : 2026-10-18
+    Description  : Scheduled (interval / timelapse) capture
+===========================================================
+
+A timelapse session captures the screen every interval seconds for a
+duration (or a number of frames), e.g. to document a long test run.
+
+Ticks are due at start + n * interval on the monotonic clock, so the
+time a capture takes never shifts the ones after it.  If a capture
+overruns, only the latest overdue tick fires; older ones are counted as
+missed rather than fired late in a burst.  When the capture
+pipeline's queue is full the tick is dropped before the screen is even
+grabbed, so a slow encoder or disk never builds up a backlog.
+"""
+
+import copy
+import math
+import threading
+import time
+from collections import OrderedDict
+
+from capture_backends import CaptureUnavailableError
+
+
+# Consecutive failed captures after which a session gives up
+MAX_FAILURES = 3
+
+# Most recent frame paths a session remembers for owns(); a frame is
+# saved or dropped long before this many newer ones are queued (the
+# capture pipeline holds a few captures at most)
+OWNED_PATHS = 1024
+
+
+class TimelapseStats:
+    """Counters of one session
+
+    frames were queued for writing, duplicates skipped as identical to
+    an earlier capture, dropped skipped because the encode queue was
+    full (or dropped from it), missed came due while a capture was still
+    running.  encoded and encode_ms are the capture pipeline's totals
+    over the session (manual captures taken meanwhile included).
+    """
+
+    def __init__(self, interval, duration=None, count=None):
+        self.interval = interval
+        self.duration = duration
+        self.count = count
+        self.started_at = time.time()
+        self.finished_at = None
+        self.frames = 0
+        self.duplicates = 0
+        self.dropped = 0
+        self.missed = 0
+        self.failed = 0
+        self.encoded = 0
+        self.encode_ms = 0.0
+        self.error = None
+
+    @property
+    def ticks(self):
+        return self.frames + self.duplicates + self.dropped + self.missed + self.failed
+
+    @property
+    def mean_encode_ms(self):
+        return self.encode_ms / self.encoded if self.encoded else 0.0
+
+    def remaining(self):
+        """Seconds until the session ends by its duration, or None"""
+        if self.duration is None:
+            return None
+        return max(0.0, self.started_at + self.duration - time.time())
+
+    def summary(self):
+        """One line for a status bar"""
+        parts = [f"{self.frames} frame(s)", f"{self.dropped + self.missed} dropped"]
+        if self.duplicates:
+            parts.append(f"{self.duplicates} duplicate(s)")
+        if self.failed:
+            parts.append(f"{self.failed} failed")
+        parts.append(f"{self.mean_encode_ms:.1f} ms/encode")
+        return ", ".join(parts)
+
+
+class TimelapseSession:
+    """Captures with core.capture_parts() every interval seconds
+
+    Runs on its own thread once started.  duration (seconds) and count
+    (ticks) end the session, whichever comes first; with neither it runs
+    until stop().  capture holds keyword arguments for capture_parts()
+    (bbox, active_window).  on_frame(stats) runs on the session thread
+    after every tick and on_done(stats) once at the end, each with a
+    copy of the stats.  owns(filepath) tells the session's frames apart
+    from captures taken meanwhile.
+    """
+
+    def __init__(self, core, interval, duration=None, count=None, capture=None,
+                 on_frame=None, on_done=None):
+        if not interval > 0:
+            raise ValueError("Timelapse interval must be more than 0 seconds")
+        if duration is not None and not duration > 0:
+            raise ValueError("Timelapse duration must be more than 0 seconds")
+        if count is not None and count < 1:
+            raise ValueError("Timelapse frame count must be at least 1")
+        self.core = core
+        self.interval = interval
+        self.capture = capture or {}
+        self.on_frame = on_frame
+        self.on_done = on_done
+        self.stats = TimelapseStats(interval, duration, count)
+
+        # Index of the last tick: ticks fall strictly inside the duration
+        last = []
+        if duration is not None:
+            last.append(math.ceil(duration / interval) - 1)
+        if count is not None:
+            last.append(count - 1)
+        self.last_tick = min(last) if last else None
+
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = None
+        self._pipeline_start = None
+        self._pipeline_dropped = 0
+        # Ordered set of recent frame paths, bounded by OWNED_PATHS
+        self._filepaths = OrderedDict()
+
+    @property
+    def running(self):
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self):
+        self._pipeline_start = self.core.capture_pipeline.stats()
+        self._thread = threading.Thread(target=self._run, daemon=True, name="timelapse")
+        self._thread.start()
+        return self
+
+    def stop(self):
+        """End the session after the capture in progress, if any"""
+        self._stop.set()
+
+    def wait(self, timeout=None):
+        """Wait for the session to end; True if it has"""
+        if self._thread is not None:
+            self._thread.join(timeout)
+        return not self.running
+
+    def owns(self, filepath):
+        """True if filepath is one of this session's recent frames"""
+        with self._lock:
+            return filepath in self._filepaths
+
+    def _reserved(self, filepaths):
+        with self._lock:
+            for filepath in filepaths:
+                self._filepaths[filepath] = None
+            while len(self._filepaths) > OWNED_PATHS:
+                self._filepaths.popitem(last=False)
+
+    def snapshot(self):
+        """Copy of the stats, with the pipeline totals brought up to date"""
+        with self._lock:
+            if self._pipeline_start is not None:
+                now = self.core.capture_pipeline.stats()
+                start = self._pipeline_start
+                self.stats.encoded = now["encoded"] - start["encoded"]
+                self.stats.encode_ms = (now["encode_seconds"] - start["encode_seconds"]) * 1000
+                self._pipeline_dropped = now["dropped"] - start["dropped"]
+            stats = copy.copy(self.stats)
+            stats.dropped += self._pipeline_dropped
+        return stats
+
+    def _run(self):
+        start = time.monotonic()
+        tick = 0
+        failures = 0
+        try:
+            while self.last_tick is None or tick <= self.last_tick:
+                delay = start + tick * self.interval - time.monotonic()
+                if delay > 0 and self._stop.wait(delay):
+                    break
+                if self._stop.is_set():
+                    break
+
+                if self._capture():
+                    failures = 0
+                else:
+                    failures += 1
+                    if failures >= MAX_FAILURES or \
+                            isinstance(self.stats.error, CaptureUnavailableError):
+                        break
+                tick += 1
+
+                # After an overrun only the latest overdue tick fires; the
+                # schedule stays anchored to start
+                due = int((time.monotonic() - start) // self.interval)
+                if self.last_tick is not None:
+                    due = min(due, self.last_tick)
+                if due > tick:
+                    with self._lock:
+                        self.stats.missed += due - tick
+                    tick = due
+                if self.on_frame:
+                    self.on_frame(self.snapshot())
+        finally:
+            with self._lock:
+                self.stats.finished_at = time.time()
+            if self.on_done:
+                self.on_done(self.snapshot())
+
+    def _capture(self):
+        """One tick; False if the capture failed"""
+        # Backpressure: drop the frame rather than queue behind a backlog
+        if self.core.capture_pipeline.full():
+            with self._lock:
+                self.stats.dropped += 1
+            return True
+        try:
+            filepaths, _duplicate_of = self.core.capture_parts(on_reserved=self._reserved,
+                                                               **self.capture)
+        except Exception as e:
+            with self._lock:
+                self.stats.failed += 1
+                self.stats.error = e
+            return False
+        with self._lock:
+            if filepaths:
+                self.stats.frames += 1
+            else:
+                self.stats.duplicates += 1
+        return True
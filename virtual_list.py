@@ -0,0 +1,236 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+===========================================================
+    Project Name : Screen Shot Manager
+    File Name    : virtual_list.py
+    Author       : Vignesh Kumar B
+    Created On   : 2026-10-18
+    Description  : Virtualized listbox for very large folders
+===========================================================
+"""
+
+import tkinter as tk
+import tkinter.font as tkfont
+
+
+class VirtualListbox(tk.Frame):
+    """Listbox look-alike that only creates widgets for the visible rows
+
+    Rows are read on demand from source, any object with len(),
+    source[row] and source.index_of(name) (e.g. FileIndex).  Call
+    refresh() after the source changes.  Selection is kept by name, so
+    it survives rows being inserted or removed above it.
+
+    The commonly used tk.Listbox calls (curselection, get, size, index,
+    selection_set/clear, see, yview and <<ListboxSelect>>) behave the
+    same, so callers do not need to know the difference.  selectmode is
+    "browse" (one row) or "extended" (Ctrl/Shift-click, Ctrl+A).
+    label(row, name) returns the text drawn for a row (default: name).
+    """
+
+    def __init__(self, master, source, font=("Consolas", 14), bg="white", fg="black",
+                 selectbackground="#0078d7", selectforeground="white",
+                 yscrollcommand=None, selectmode="browse", label=None, **kwargs):
+        super().__init__(master, bg=bg, bd=0, highlightthickness=0)
+        self.source = source
+        self.label = label
+        self.font = tkfont.Font(self, font=font)
+        self.colors = {"bg": bg, "fg": fg,
+                       "select_bg": selectbackground, "select_fg": selectforeground}
+        self.yscrollcommand = yscrollcommand
+        self.selectmode = selectmode
+        self.row_height = self.font.metrics("linespace") + 2
+
+        self._top = 0.0  # pixel offset of the viewport into the full list
+        self._selected = {}  # selected names, in selection order
+        self._active = None  # last clicked name; anchor for Shift ranges
+        self._rows = []  # (rect_id, text_id) per visible slot
+
+        self.canvas = tk.Canvas(self, bg=bg, bd=0, highlightthickness=0,
+                                takefocus=True, **kwargs)
+        self.canvas.pack(fill=tk.BOTH, expand=True)
+
+        self.canvas.bind("<Configure>", lambda event: self._redraw())
+        self.canvas.bind("<ButtonPress-1>", self._on_click)
+        if selectmode == "extended":
+            self.canvas.bind("<Control-ButtonPress-1>", lambda event: self._on_click(event, "toggle"))
+            self.canvas.bind("<Shift-ButtonPress-1>", lambda event: self._on_click(event, "range"))
+            self.canvas.bind("<Control-a>", lambda event: self._select_all())
+        self.canvas.bind("<MouseWheel>", self._on_wheel)
+        self.canvas.bind("<Button-4>", lambda event: self.yview_scroll(-3, "units"))
+        self.canvas.bind("<Button-5>", lambda event: self.yview_scroll(3, "units"))
+        for key, delta in (("<Up>", -1), ("<Down>", 1), ("<Prior>", "-page"),
+                           ("<Next>", "page"), ("<Home>", "home"), ("<End>", "end")):
+            self.canvas.bind(key, lambda event, d=delta: self._on_key(d))
+
+    # tk.Listbox compatible API
+
+    def size(self):
+        return len(self.source)
+
+    def get(self, row):
+        return self.source[row]
+
+    def curselection(self):
+        rows = (self.source.index_of(name) for name in self._selected)
+        return tuple(sorted(row for row in rows if row is not None))
+
+    def index(self, what):
+        """Row of "active" (the last clicked row, or None) or of a row number"""
+        if what == tk.ACTIVE:
+            return None if self._active is None else self.source.index_of(self._active)
+        return int(what)
+
+    def selection_set(self, first, last=None):
+        last = first if last is None else last
+        for row in range(first, last + 1):
+            self._selected[self.source[row]] = True
+        self._active = self.source[last]
+        self._redraw()
+
+    def selection_clear(self, first=0, last=None):
+        self._selected.clear()
+        self._redraw()
+
+    def see(self, row):
+        view_height = max(self.canvas.winfo_height(), self.row_height)
+        row_top = row * self.row_height
+        if row_top < self._top:
+            self._set_top(row_top)
+        elif row_top + self.row_height > self._top + view_height:
+            self._set_top(row_top + self.row_height - view_height)
+
+    def yview(self, *args):
+        """Scrollbar protocol: no args returns the visible fraction"""
+        total = max(len(self.source) * self.row_height, 1)
+        if not args:
+            return self._fractions(total)
+        if args[0] == "moveto":
+            self._set_top(float(args[1]) * total)
+        elif args[0] == "scroll":
+            self.yview_scroll(int(args[1]), args[2])
+
+    def yview_scroll(self, number, what):
+        if what == "pages":
+            step = max(self.canvas.winfo_height() - self.row_height, self.row_height)
+        else:
+            step = self.row_height
+        self._set_top(self._top + number * step)
+
+    def focus_set(self):
+        self.canvas.focus_set()
+
+    def refresh(self):
+        """Redraw after the source changed"""
+        self._set_top(self._top)
+
+    def set_source(self, source):
+        """Show a different source (e.g. search results) from the top"""
+        self.source = source
+        self._set_top(0.0)
+
+    # Drawing
+
+    def _set_top(self, top):
+        view_height = self.canvas.winfo_height()
+        max_top = max(len(self.source) * self.row_height - view_height, 0)
+        self._top = min(max(top, 0.0), max_top)
+        self._redraw()
+
+    def _fractions(self, total):
+        view_height = self.canvas.winfo_height()
+        return self._top / total, min((self._top + view_height) / total, 1.0)
+
+    def _redraw(self):
+        width = self.canvas.winfo_width()
+        height = self.canvas.winfo_height()
+        slots = height // self.row_height + 2
+
+        # Grow the pool of row items to cover the viewport; never per file
+        while len(self._rows) < slots:
+            rect = self.canvas.create_rectangle(0, 0, 0, 0, width=0)
+            text = self.canvas.create_text(4, 0, anchor=tk.NW, font=self.font)
+            self._rows.append((rect, text))
+
+        first_row = int(self._top // self.row_height)
+        offset = first_row * self.row_height - self._top
+        count = len(self.source)
+        for slot, (rect, text) in enumerate(self._rows):
+            row = first_row + slot
+            if slot >= slots or row >= count:
+                self.canvas.itemconfigure(rect, state=tk.HIDDEN)
+                self.canvas.itemconfigure(text, state=tk.HIDDEN)
+                continue
+
+            name = self.source[row]
+            selected = name in self._selected
+            y = offset + slot * self.row_height
+            self.canvas.coords(rect, 0, y, width, y + self.row_height)
+            self.canvas.coords(text, 4, y + 1)
+            self.canvas.itemconfigure(
+                rect, state=tk.NORMAL,
+                fill=self.colors["select_bg"] if selected else self.colors["bg"])
+            self.canvas.itemconfigure(
+                text, state=tk.NORMAL, text=self.label(row, name) if self.label else name,
+                fill=self.colors["select_fg"] if selected else self.colors["fg"])
+
+        if self.yscrollcommand:
+            self.yscrollcommand(*self._fractions(max(count * self.row_height, 1)))
+
+    # Input
+
+    def _select_row(self, row, mode="single"):
+        if not 0 <= row < len(self.source):
+            return
+        name = self.source[row]
+        if mode == "toggle":
+            if self._selected.pop(name, None) is None:
+                self._selected[name] = True
+        elif mode == "range":
+            anchor = self.index(tk.ACTIVE)
+            anchor = row if anchor is None else anchor
+            self._selected.clear()
+            for i in range(min(anchor, row), max(anchor, row) + 1):
+                self._selected[self.source[i]] = True
+            name = self._active or name
+        else:
+            self._selected = {name: True}
+        self._active = name
+        self.see(row)
+        self._redraw()
+        self.event_generate("<<ListboxSelect>>")
+
+    def _select_all(self):
+        count = len(self.source)
+        if count:
+            self._selected = {self.source[row]: True for row in range(count)}
+            self._redraw()
+            self.event_generate("<<ListboxSelect>>")
+        return "break"
+
+    def _on_click(self, event, mode="single"):
+        self.canvas.focus_set()
+        self._select_row(int((self._top + event.y) // self.row_height), mode)
+
+    def _on_wheel(self, event):
+        self.yview_scroll(-3 if event.delta > 0 else 3, "units")
+
+    def _on_key(self, delta):
+        count = len(self.source)
+        if not count:
+            return
+        row = self.index(tk.ACTIVE)
+        row = -1 if row is None else row
+        page = max(self.canvas.winfo_height() // self.row_height - 1, 1)
+        if delta == "home":
+            row = 0
+        elif delta == "end":
+            row = count - 1
+        elif delta == "page":
+            row += page
+        elif delta == "-page":
+            row -= page
+        else:
+            row += delta
+        self._select_row(min(max(row, 0), count - 1))